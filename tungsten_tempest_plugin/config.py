@@ -35,6 +35,94 @@ SDNGroup = [
     cfg.StrOpt('catalog_type',
                default='sdn-l-config',
                help="Catalog type of the SDN service"),
+    cfg.IntOpt('connection_pool_size',
+               default=10,
+               min=0,
+               help="Maximum number of keep-alive connections kept open to "
+                    "each SDN endpoint. The pool is shared by all Contrail "
+                    "service clients of a process. Set to 0 to open a new "
+                    "connection for every request."),
+    cfg.StrOpt('http_compression',
+               default='none',
+               choices=['none', 'response', 'request_and_response'],
+               help="Compression used on the SDN API connections. "
+                    "'response' asks the server for gzip or deflate "
+                    "encoded responses, 'request_and_response' also sends "
+                    "gzip encoded request bodies, which the server or its "
+                    "proxy must accept."),
+    cfg.StrOpt('transport',
+               default='live',
+               choices=['live', 'record', 'replay'],
+               help="How the Contrail service clients reach the SDN API. "
+                    "'record' talks to the server and writes every "
+                    "exchange of the run to cassette_path, replacing its "
+                    "previous content, 'replay' answers requests "
+                    "from cassette_path without contacting the server. "
+                    "Keystone requests are never recorded or replayed."),
+    cfg.StrOpt('cassette_path',
+               default='contrail_cassette.jsonl.gz',
+               help="File the 'record' and 'replay' transports use. A "
+                    "'.gz' suffix stores it gzip compressed. Each worker "
+                    "records to <cassette_path>.<pid> and merges it into "
+                    "the file when it exits."),
+    cfg.IntOpt('show_cache_size',
+               default=0,
+               min=0,
+               help="Number of objects whose show responses are cached by "
+                    "the Contrail service clients. Cached objects are "
+                    "revalidated with a conditional GET and only fetched "
+                    "again when they changed. 0 disables the cache."),
+    cfg.IntOpt('fqname_cache_size',
+               default=1024,
+               min=1,
+               help="Maximum number of objects kept in the process-wide "
+                    "fq_name/uuid resolution cache."),
+    cfg.IntOpt('fqname_cache_ttl',
+               default=0,
+               min=0,
+               help="Seconds an fq_name/uuid resolution is served from the "
+                    "cache instead of the config API. Cached resolutions "
+                    "are not checked against the RBAC policy, so keep the "
+                    "default of 0 (no caching) when running the "
+                    "fqname_to_id and id_to_fqname RBAC tests."),
+    cfg.IntOpt('cleanup_conflict_retries',
+               default=3,
+               min=0,
+               help="Number of times deleting a test resource is retried "
+                    "when the config API answers 409 Conflict, e.g. while "
+                    "references to it are still being removed. What still "
+                    "fails is reported as leaked."),
+    cfg.BoolOpt('defer_role_switches',
+                default=False,
+                help="Switch the roles of the primary user back to the "
+                     "admin role only when a request needs it, instead of "
+                     "right after every override_role block, and skip "
+                     "Keystone calls for role assignments known to be in "
+                     "place already."),
+    cfg.ListOpt('rbac_matrix_roles',
+                default=[],
+                help="Roles the role matrix tests make each guarded call "
+                     "with, one after the other, on objects created once "
+                     "for all of them. Each worker writes the resulting "
+                     "rule-by-role table to report_log_path. The role "
+                     "matrix tests are skipped when empty."),
+    cfg.BoolOpt('role_credentials',
+                default=False,
+                help="Have override_role authenticate the Contrail clients "
+                     "as users holding the tested roles instead of "
+                     "changing the roles of the primary user. Each worker "
+                     "creates one such user per set of roles, gives it its "
+                     "roles on the project of every test class and deletes "
+                     "it when it exits. Requires admin credentials in "
+                     "[auth]."),
+    cfg.BoolOpt('worker_scoped_fixtures',
+                default=False,
+                help="Share the test project and common parent objects "
+                     "between all test classes run by a worker process, "
+                     "instead of creating them for every class. They are "
+                     "deleted when the worker exits. Only enable it when "
+                     "the tested RBAC rules do not depend on the objects "
+                     "living in the project of the test credentials."),
 ]
 
 tungsten_log_group = cfg.OptGroup(
@@ -44,7 +132,11 @@ TungstenLogGroup = [
     cfg.BoolOpt('enable_reporting',
                 default=False,
                 help="Enables reporting on RBAC expected and actual test "
-                     "results for each tungstenTempest test"),
+                     "results for each tungstenTempest test. Each worker "
+                     "writes JSON Lines records holding the rules, the "
+                     "expected and actual outcome, the role, the duration "
+                     "and its process ID to a file of its own, which are "
+                     "merged into report_log_name when the workers exit."),
     cfg.StrOpt('report_log_name',
                default='tungsten.log',
                help="Name of file where output from 'enable_reporting' is "
@@ -55,6 +147,59 @@ TungstenLogGroup = [
                help="Path (relative or absolute) where the output from "
                     "'enable_reporting' is logged. This is combined with"
                     "report_log_name to generate the full path."),
+    cfg.BoolOpt('enable_client_metrics',
+                default=False,
+                help="Records latency, status codes and transferred bytes "
+                     "of every Contrail API call per resource type and "
+                     "HTTP verb. Each test worker writes a JSON and a CSV "
+                     "summary with p50/p95/p99/max latencies to "
+                     "report_log_path when it exits."),
+    cfg.StrOpt('client_metrics_name',
+               default='client_metrics',
+               help="Prefix of the files written by 'enable_client_metrics'. "
+                    "The worker's process ID and the format are appended."),
+    cfg.BoolOpt('enable_durations',
+                default=False,
+                help="Records how long the setup and cleanup of every test "
+                     "class and each of its tests take. The workers merge "
+                     "them into durations_file in report_log_path when they "
+                     "exit, from which 'python -m "
+                     "tungsten_tempest_plugin.durations' writes a stestr "
+                     "worker file balancing the classes by cost."),
+    cfg.StrOpt('durations_file',
+               default='test_durations.json',
+               help="Name of the file where the durations recorded with "
+                    "'enable_durations' are kept across runs."),
+]
+
+tungsten_scale_group = cfg.OptGroup(
+    name='tungsten_scale', title='tungsten Tempest Scale Scenario Options')
+
+TungstenScaleGroup = [
+    cfg.IntOpt('scale_factor',
+               default=0,
+               min=0,
+               help="Number of virtual networks, virtual machine interfaces "
+                    "with an instance IP, and security groups with a rule "
+                    "created and deleted by the scale scenarios. 0 skips "
+                    "the scale scenarios."),
+    cfg.IntOpt('concurrency',
+               default=10,
+               min=1,
+               help="Number of requests the scale scenarios keep in flight "
+                    "at a time."),
+    cfg.FloatOpt('min_objects_per_second',
+                 default=0,
+                 min=0,
+                 help="Fail a scale scenario when any of its create phases "
+                      "runs at fewer objects per second than this. 0 only "
+                      "reports the throughput."),
+    cfg.StrOpt('report_name',
+               default='scale_report',
+               help="Prefix of the JSON file the scale scenarios write "
+                    "their per phase throughput and latency percentiles "
+                    "to. It is written to the tungsten_log report_log_path "
+                    "and the worker's process ID is appended."),
 ]
 
 
@@ -67,7 +212,8 @@ def list_opts():
     opt_list = [
         (service_available_group, ServiceAvailableGroup),
         (sdn_group, SDNGroup),
-        (tungsten_log_group, TungstenLogGroup)
+        (tungsten_log_group, TungstenLogGroup),
+        (tungsten_scale_group, TungstenScaleGroup)
 
     ]
     return opt_list
@@ -0,0 +1,190 @@
+#    Copyright 2017 AT&T Corporation.
+#    All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measured test durations and cost based partitioning of test classes
+
+Workers record how long the setup and cleanup of every test class and each
+of its tests took into a JSON file shared by all runs.  From it a stestr
+worker file is generated that spreads the test classes over the workers by
+their measured cost, e.g.::
+
+    stestr list > tests.txt
+    python -m tungsten_tempest_plugin.durations --workers 4 \\
+        --test-list tests.txt test_durations.json > workers.yaml
+    tempest run --worker-file workers.yaml
+"""
+
+import argparse
+import atexit
+import collections
+import json
+import os
+import re
+import sys
+import threading
+
+from oslo_concurrency import lockutils
+
+RECORDER = None
+
+# Attributes stestr appends to test ids, e.g. [id-...,smoke]
+ATTRS_RE = re.compile(r'\[.*\]$')
+
+
+def test_class(test_id):
+    """Return the id of the class of a test, without attributes"""
+    return ATTRS_RE.sub('', test_id).rsplit('.', 1)[0]
+
+
+class Recorder(object):
+    """Collects the durations measured by one worker
+
+    Classes are recorded as::
+
+        {class id: {'setup': seconds, 'cleanup': seconds,
+                    'tests': {test id: seconds}}}
+    """
+
+    def __init__(self):
+        self.classes = collections.defaultdict(
+            lambda: {'setup': 0.0, 'cleanup': 0.0, 'tests': {}})
+        self._lock = threading.Lock()
+
+    def record_class(self, class_id, phase, seconds):
+        """Record the duration of the 'setup' or 'cleanup' of a class"""
+        with self._lock:
+            self.classes[class_id][phase] = seconds
+
+    def record_test(self, test_id, seconds):
+        with self._lock:
+            test_id = ATTRS_RE.sub('', test_id)
+            self.classes[test_class(test_id)]['tests'][test_id] = seconds
+
+    def write(self, path):
+        """Merge the recorded durations into the file at path
+
+        The durations measured last replace those of earlier runs, tests
+        and classes not run by this worker are kept.
+        """
+        with self._lock:
+            classes = dict(self.classes)
+        if not classes:
+            return
+        directory, name = os.path.split(os.path.abspath(path))
+        with lockutils.lock(name + '.lock', external=True,
+                            lock_path=directory):
+            durations = load(path)
+            for class_id, measured in classes.items():
+                stored = durations.setdefault(
+                    class_id, {'setup': 0.0, 'cleanup': 0.0, 'tests': {}})
+                for phase in ('setup', 'cleanup'):
+                    if measured[phase]:
+                        stored[phase] = measured[phase]
+                stored['tests'].update(measured['tests'])
+            tmp_path = '%s.%d' % (path, os.getpid())
+            with open(tmp_path, 'w') as f:
+                json.dump(durations, f, indent=2, sort_keys=True)
+            os.rename(tmp_path, path)
+
+
+def load(path):
+    """Return the durations stored at path, empty if there are none"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def class_costs(durations):
+    """Return the seconds each class took, its setup and cleanup included"""
+    return dict((class_id, measured['setup'] + measured['cleanup']
+                 + sum(measured['tests'].values()))
+                for class_id, measured in durations.items())
+
+
+def partition(class_ids, costs, workers):
+    """Spread classes over workers so that they finish at about the same time
+
+    Classes are handed out from the most expensive one on, each to the
+    worker with the least work so far.  Classes without a measured cost
+    count as a class of median cost.
+
+    :param class_ids: ids of the classes to run
+    :param costs: dict of class id to seconds, see class_costs
+    :param workers: number of workers
+    :return: list holding a list of class ids per worker
+    """
+    known = sorted(costs[class_id] for class_id in class_ids
+                   if class_id in costs)
+    default = known[len(known) // 2] if known else 1.0
+    groups = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for class_id in sorted(class_ids,
+                           key=lambda class_id: (-costs.get(class_id, default),
+                                                 class_id)):
+        worker = loads.index(min(loads))
+        groups[worker].append(class_id)
+        loads[worker] += costs.get(class_id, default)
+    return [group for group in groups if group]
+
+
+def write_worker_file(groups, f):
+    """Write a stestr worker file running each group on its own worker"""
+    for group in groups:
+        f.write('- worker:\n')
+        for class_id in group:
+            # Single quoted YAML scalars only need their quotes doubled
+            f.write("  - '^%s\\.'\n" % re.escape(class_id).replace("'", "''"))
+
+
+def enable(path):
+    """Start recording durations of this process
+
+    They are merged into the file at path when the process exits.
+    """
+    global RECORDER
+    if RECORDER is None:
+        RECORDER = Recorder()
+        atexit.register(RECORDER.write, path)
+    return RECORDER
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Write a stestr worker file balancing the test classes "
+                    "over the workers by their measured durations")
+    parser.add_argument('durations', help="durations file written by the "
+                                          "test workers")
+    parser.add_argument('--workers', type=int, required=True,
+                        help="number of test workers")
+    parser.add_argument('--test-list',
+                        help="file with the ids of the tests to run, one "
+                             "per line; defaults to the recorded classes")
+    args = parser.parse_args(argv)
+
+    durations = load(args.durations)
+    if args.test_list:
+        with open(args.test_list) as f:
+            class_ids = set(test_class(line.strip()) for line in f
+                            if line.strip())
+    else:
+        class_ids = set(durations)
+    groups = partition(class_ids, class_costs(durations), args.workers)
+    write_worker_file(groups, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
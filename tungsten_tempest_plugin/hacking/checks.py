@@ -35,6 +35,13 @@ RBAC_CLASS_NAME_RE = re.compile(r'class .+RbacTest')
 RULE_VALIDATION_DECORATOR = re.compile(
     r'\s*@rbac_rule_validation.action\(.*')
 IDEMPOTENT_ID_DECORATOR = re.compile(r'\s*@decorators\.idempotent_id\((.*)\)')
+# Scenario modules measuring the service rather than validating RBAC rules
+NON_RBAC_TEST_MODULES = (
+    'tungsten_tempest_plugin/tests/scenario/contrail/test_scale.py',)
+# Tests checking a rule under every role of [sdn] rbac_matrix_roles with
+# BaseContrailTest._check_role_matrix, which switches the roles and compares
+# the outcomes with the expected ones itself
+ROLE_MATRIX_TEST_DEFINITION = re.compile(r'^\s*def test\w*_role_matrix\(')
 
 have_rbac_decorator = False
 
@@ -151,20 +158,26 @@ def no_rbac_rule_validation_decorator(physical_line, filename):
 
     Assumes that ``rbac_rule_validation.action`` decorator is either the first
     or second decorator above the test function; otherwise this check fails.
+    The modules of NON_RBAC_TEST_MODULES and the role matrix tests, named
+    ``test_*_role_matrix``, are not checked.
 
     P100
     """
     global have_rbac_decorator
 
-    if ("tungsten_tempest_plugin/tests/api" in filename or
-            "tungsten_tempest_plugin/tests/scenario" in filename):
+    if filename.endswith(NON_RBAC_TEST_MODULES):
+        return
+
+    if ("tungsten_tempest_plugin/tests/api" in filename
+            or "tungsten_tempest_plugin/tests/scenario" in filename):
 
         if RULE_VALIDATION_DECORATOR.match(physical_line):
             have_rbac_decorator = True
             return
 
         if TEST_DEFINITION.match(physical_line):
-            if not have_rbac_decorator:
+            if (not have_rbac_decorator
+                    and not ROLE_MATRIX_TEST_DEFINITION.match(physical_line)):
                 return (0, "Must use rbac_rule_validation.action "
                            "decorator for API and scenario tests")
 
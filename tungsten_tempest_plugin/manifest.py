@@ -0,0 +1,239 @@
+#    Copyright 2017 AT&T Corporation.
+#    All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Manifest of the plugin's tests built without importing them
+
+The manifest lists every test with its id, as the test runner lists it, its
+idempotent ids and the RBAC rules its rbac_rule_validation.action checks.
+It is read from the sources of the test modules, and cached in a file named
+after a hash of them, so listing and filtering the tests repeatedly only
+parses the tree when it changed, e.g.::
+
+    python -m tungsten_tempest_plugin.manifest \\
+        --rule list_virtual_networks > tests.txt
+    tempest run --load-list tests.txt
+"""
+
+import argparse
+import ast
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+
+import six
+
+from tungsten_tempest_plugin import tests as test_package
+
+MANIFEST_NAME = 'tungsten_tempest_manifest'
+
+# Versions the format of the cached manifest as part of its key
+VERSION = 1
+
+
+def _test_files(test_dir):
+    for directory, dirnames, filenames in os.walk(test_dir):
+        # Skip the packages the load_tests of tungsten_tempest_plugin.tests
+        # leaves out
+        dirnames[:] = sorted(
+            name for name in dirnames
+            if directory != test_dir
+            or name not in test_package.EXCLUDED_PACKAGES)
+        for filename in sorted(filenames):
+            if filename.endswith('.py'):
+                yield os.path.join(directory, filename)
+
+
+def source_hash(test_dir):
+    """Return a hash of the path and content of every module in test_dir"""
+    digest = hashlib.sha1(str(VERSION).encode('utf-8'))
+    for path in _test_files(test_dir):
+        digest.update(os.path.relpath(path, test_dir).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _call_name(node):
+    """Return the dotted name of a decorator call, e.g. 'decorators.attr'"""
+    func = node.func if isinstance(node, ast.Call) else node
+    names = []
+    while isinstance(func, ast.Attribute):
+        names.append(func.attr)
+        func = func.value
+    if isinstance(func, ast.Name):
+        names.append(func.id)
+    return '.'.join(reversed(names))
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        # Computed at run time, not known from the source
+        return None
+
+
+def _test_info(function):
+    """Return the attributes and RBAC checks of a test method"""
+    info = {'attrs': set(), 'idempotent_ids': [], 'rules': [],
+            'service': None}
+    for decorator in function.decorator_list:
+        if not isinstance(decorator, ast.Call):
+            continue
+        name = _call_name(decorator).rsplit('.', 1)[-1]
+        kwargs = dict((keyword.arg, _literal(keyword.value))
+                      for keyword in decorator.keywords)
+        if name == 'idempotent_id' and decorator.args:
+            idempotent_id = _literal(decorator.args[0])
+            info['idempotent_ids'].append(idempotent_id)
+            info['attrs'].add('id-%s' % idempotent_id)
+        elif name == 'attr' and 'condition' not in kwargs:
+            types = kwargs.get('type') or []
+            info['attrs'].update(
+                [types] if isinstance(types, six.string_types) else types)
+        elif name == 'action':
+            info['service'] = kwargs.get('service')
+            info['rules'].extend(kwargs.get('rules') or [])
+            if kwargs.get('rule'):
+                info['rules'].append(kwargs['rule'])
+    return info
+
+
+def _module_tests(path, module_name):
+    with io.open(path, 'rb') as f:
+        tree = ast.parse(f.read(), path)
+    # Class name -> (names of its bases, {method name: test info})
+    classes = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = (
+                [_call_name(base) for base in node.bases],
+                dict((item.name, _test_info(item)) for item in node.body
+                     if isinstance(item, ast.FunctionDef)
+                     and item.name.startswith('test')))
+
+    def methods(class_name):
+        # Tests inherited from base classes of the same module included
+        bases, own = classes[class_name]
+        inherited = {}
+        for base in bases:
+            if base in classes:
+                inherited.update(methods(base))
+        inherited.update(own)
+        return inherited
+
+    tests = []
+    for class_name in sorted(classes):
+        for method_name, info in sorted(methods(class_name).items()):
+            test_id = '%s.%s.%s' % (module_name, class_name, method_name)
+            if info['attrs']:
+                test_id += '[%s]' % ','.join(sorted(info['attrs']))
+            tests.append({'id': test_id,
+                          'idempotent_ids': info['idempotent_ids'],
+                          'rules': info['rules'],
+                          'service': info['service']})
+    return tests
+
+
+def build(test_dir, top_dir):
+    """Return the manifest of the tests of the modules in test_dir
+
+    Only tests inherited from classes of the same module are found, as
+    those of other modules are not known without importing them.
+
+    :param test_dir: directory holding the test modules
+    :param top_dir: directory the test modules are imported from
+    :return: list of dicts with the 'id', 'idempotent_ids', 'rules' and
+             'service' of every test
+    """
+    tests = []
+    for path in _test_files(test_dir):
+        if not os.path.basename(path).startswith('test'):
+            continue
+        module_name = os.path.splitext(
+            os.path.relpath(path, top_dir))[0].replace(os.sep, '.')
+        tests.extend(_module_tests(path, module_name))
+    return tests
+
+
+def load(test_dir, top_dir, cache_dir=None):
+    """Return the manifest of test_dir, built only if it is not cached yet
+
+    :param cache_dir: directory of the cached manifests, the system's
+                      temporary directory by default
+    """
+    cache_path = os.path.join(
+        cache_dir or tempfile.gettempdir(),
+        '%s.%s.json' % (MANIFEST_NAME, source_hash(test_dir)))
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return json.load(f)
+    tests = build(test_dir, top_dir)
+    # Written aside first, concurrent readers only see complete manifests
+    tmp_path = '%s.%d' % (cache_path, os.getpid())
+    with open(tmp_path, 'w') as f:
+        json.dump(tests, f, indent=2, sort_keys=True)
+    os.rename(tmp_path, cache_path)
+    return tests
+
+
+def select(tests, rules=None, regex=None):
+    """Return the tests checking any of rules and matching regex"""
+    if rules:
+        rules = set(rules)
+        tests = [test for test in tests if rules.intersection(test['rules'])]
+    if regex:
+        pattern = re.compile(regex)
+        tests = [test for test in tests if pattern.search(test['id'])]
+    return tests
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="List the tests of the plugin from a manifest cached "
+                    "across runs")
+    parser.add_argument('--cache-dir',
+                        help="directory of the cached manifests; defaults "
+                             "to the system's temporary directory")
+    parser.add_argument('--rule', action='append', dest='rules',
+                        help="only list tests checking this RBAC rule; may "
+                             "be given more than once")
+    parser.add_argument('--regex', help="only list tests whose id matches")
+    parser.add_argument('--json', action='store_true',
+                        help="write the manifest entries as JSON instead of "
+                             "the test ids")
+    args = parser.parse_args(argv)
+
+    # The directories TungstenTempestPlugin.load_tests returns, without
+    # importing the plugin and tempest's configuration along with it
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    tests = select(load(os.path.join(package_dir, 'tests'),
+                        os.path.dirname(package_dir), args.cache_dir),
+                   args.rules, args.regex)
+    if args.json:
+        json.dump(tests, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write('\n')
+    else:
+        for test in tests:
+            sys.stdout.write(test['id'] + '\n')
+
+
+if __name__ == '__main__':
+    main()
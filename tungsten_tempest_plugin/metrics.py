@@ -0,0 +1,219 @@
+#    Copyright 2017 AT&T Corporation.
+#    All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Latency and traffic metrics of the Contrail service client calls
+"""
+
+import atexit
+import collections
+import csv
+import json
+import os
+import re
+import threading
+
+from six.moves.urllib import parse as urllib
+
+# Every power of two of the recorded values is split into this many
+# buckets, which bounds the relative error of a percentile to about 3%
+SUB_BUCKETS = 32
+
+PERCENTILES = (50, 95, 99)
+
+RECORDER = None
+
+UUID_RE = re.compile(r'^[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}$')
+
+
+class Histogram(object):
+    """Log-linear histogram of non-negative integers (HDR style)
+
+    Memory only grows with the number of distinct buckets, i.e. with the
+    logarithm of the recorded range, not with the number of values.
+    """
+
+    def __init__(self):
+        self.buckets = collections.defaultdict(int)
+        self.count = 0
+        self.max = 0
+
+    @staticmethod
+    def _index(value):
+        shift = max(0, value.bit_length() - 6)
+        return SUB_BUCKETS * shift + (value >> shift)
+
+    @staticmethod
+    def _upper_bound(index):
+        shift = max(0, index // SUB_BUCKETS - 1)
+        return ((index - SUB_BUCKETS * shift + 1) << shift) - 1
+
+    def record(self, value):
+        self.buckets[self._index(value)] += 1
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] += count
+        self.count += other.count
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """Return the value below which ``percent`` of the values fall"""
+        if not self.count:
+            return 0
+        rank = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+
+class OperationStats(object):
+    """Statistics of one (resource type, verb) operation"""
+
+    def __init__(self):
+        self.latency_us = Histogram()
+        self.statuses = collections.defaultdict(int)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def merge(self, other):
+        self.latency_us.merge(other.latency_us)
+        for status, count in other.statuses.items():
+            self.statuses[status] += count
+        self.request_bytes += other.request_bytes
+        self.response_bytes += other.response_bytes
+
+    def to_dict(self):
+        latency = self.latency_us
+        summary = {
+            'count': latency.count,
+            'statuses': dict(self.statuses),
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'max_ms': latency.max / 1000.0,
+            'histogram': dict((str(index), count)
+                              for index, count in latency.buckets.items()),
+        }
+        for percent in PERCENTILES:
+            summary['p%d_ms' % percent] = (
+                latency.percentile(percent) / 1000.0)
+        return summary
+
+    @classmethod
+    def from_dict(cls, summary):
+        stats = cls()
+        for index, count in summary['histogram'].items():
+            stats.latency_us.buckets[int(index)] = count
+        stats.latency_us.count = summary['count']
+        stats.latency_us.max = int(summary['max_ms'] * 1000)
+        stats.statuses.update(summary['statuses'])
+        stats.request_bytes = summary['request_bytes']
+        stats.response_bytes = summary['response_bytes']
+        return stats
+
+
+class Recorder(object):
+    """Collects OperationStats keyed by operation, e.g. virtual-network/POST
+
+    GET requests on a collection are recorded under the LIST verb to keep
+    them apart from show calls.
+    """
+
+    def __init__(self):
+        self.operations = collections.defaultdict(OperationStats)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def operation(method, url):
+        path = urllib.urlparse(url).path.strip('/').split('/')
+        if len(path) > 1 and UUID_RE.match(path[-1]):
+            return '%s/%s' % (path[-2], method)
+        resource = path[-1]
+        if resource.endswith('s'):
+            resource = resource[:-1]
+            if method == 'GET':
+                method = 'LIST'
+        return '%s/%s' % (resource, method)
+
+    def record(self, method, url, status, seconds, request_bytes,
+               response_bytes):
+        key = self.operation(method, url)
+        with self._lock:
+            stats = self.operations[key]
+            stats.latency_us.record(int(seconds * 1000000))
+            stats.statuses[str(status)] += 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def merge(self, other):
+        with self._lock:
+            for key, stats in other.operations.items():
+                self.operations[key].merge(stats)
+
+    def to_dict(self):
+        with self._lock:
+            return dict((key, stats.to_dict())
+                        for key, stats in sorted(self.operations.items()))
+
+    def write(self, prefix):
+        """Write the summary to <prefix>.json and <prefix>.csv"""
+        summary = self.to_dict()
+        with open(prefix + '.json', 'w') as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+        columns = (['operation', 'count']
+                   + ['p%d_ms' % percent for percent in PERCENTILES]
+                   + ['max_ms', 'request_bytes', 'response_bytes', 'statuses'])
+        with open(prefix + '.csv', 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for key, stats in sorted(summary.items()):
+                stats = dict(stats, operation=key, statuses=' '.join(
+                    '%s:%d' % item for item in sorted(
+                        stats['statuses'].items())))
+                writer.writerow([stats[column] for column in columns])
+
+
+def load(paths):
+    """Merge the JSON summaries written by several workers
+
+    :param paths: JSON summary files
+    :return: Recorder object holding the merged statistics
+    """
+    recorder = Recorder()
+    for path in paths:
+        with open(path) as f:
+            summary = json.load(f)
+        for key, stats in summary.items():
+            recorder.operations[key].merge(OperationStats.from_dict(stats))
+    return recorder
+
+
+def enable(path, name):
+    """Start recording client calls of this process
+
+    The summary is written to <path>/<name>.<pid>.json and .csv when the
+    process exits, one pair of files per test worker.
+    """
+    global RECORDER
+    if RECORDER is None:
+        RECORDER = Recorder()
+        prefix = os.path.join(path, '%s.%d' % (name, os.getpid()))
+        atexit.register(RECORDER.write, prefix)
+    return RECORDER
@@ -22,6 +22,10 @@ from tempest import config
 from tempest.test_discover import plugins
 
 from tungsten_tempest_plugin import config as project_config
+from tungsten_tempest_plugin import durations
+from tungsten_tempest_plugin import manifest
+from tungsten_tempest_plugin import metrics
+from tungsten_tempest_plugin import rbac_report
 
 RBACLOG = logging.getLogger('rbac_reporting')
 
@@ -29,12 +33,23 @@ RBACLOG = logging.getLogger('rbac_reporting')
 class TungstenTempestPlugin(plugins.TempestPlugin):
 
     def load_tests(self):
+        # tests/__init__.py discovers tests/api and tests/scenario but not
+        # the unit tests
         base_path = os.path.split(os.path.dirname(
             os.path.abspath(__file__)))[0]
-        test_dir = "tungsten_tempest_plugin/tests/api"
+        test_dir = "tungsten_tempest_plugin/tests"
         full_test_dir = os.path.join(base_path, test_dir)
         return full_test_dir, base_path
 
+    def load_manifest(self, cache_dir=None):
+        """Return the manifest of the tests load_tests points to
+
+        It is cached under cache_dir and rebuilt only when the tests
+        change, see tungsten_tempest_plugin.manifest.
+        """
+        full_test_dir, base_path = self.load_tests()
+        return manifest.load(full_test_dir, base_path, cache_dir)
+
     @lockutils.synchronized('_reset_log_file')
     def _reset_log_file(self, logfile):
         try:
@@ -52,12 +67,9 @@ class TungstenTempestPlugin(plugins.TempestPlugin):
 
         # Remove the log file if it exists
         self._reset_log_file(report_path)
-        # Delay=True so that we don't end up creating an empty file if we
-        # never log to it.
-        rbac_report_handler = logging.FileHandler(
-            filename=report_path, delay=True, mode='a')
-        rbac_report_handler.setFormatter(
-            fmt=logging.Formatter(fmt='%(message)s'))
+        # Every worker writes a file of its own from a background thread
+        # and merges it into report_path when it exits.
+        rbac_report_handler = rbac_report.JsonLinesHandler(report_path)
         RBACLOG.addHandler(rbac_report_handler)
 
     def register_opts(self, conf):
@@ -67,9 +79,18 @@ class TungstenTempestPlugin(plugins.TempestPlugin):
                                   project_config.SDNGroup)
         config.register_opt_group(conf, project_config.tungsten_log_group,
                                   project_config.TungstenLogGroup)
+        config.register_opt_group(conf, project_config.tungsten_scale_group,
+                                  project_config.TungstenScaleGroup)
 
         if conf.tungsten_log.enable_reporting:
             self._configure_per_test_logging(conf)
+        if conf.tungsten_log.enable_client_metrics:
+            metrics.enable(os.path.abspath(conf.tungsten_log.report_log_path),
+                           conf.tungsten_log.client_metrics_name)
+        if conf.tungsten_log.enable_durations:
+            durations.enable(os.path.join(
+                os.path.abspath(conf.tungsten_log.report_log_path),
+                conf.tungsten_log.durations_file))
 
     def get_opt_lists(self):
         return [
@@ -78,4 +99,6 @@ class TungstenTempestPlugin(plugins.TempestPlugin):
             (project_config.sdn_group.name, project_config.SDNGroup),
             (project_config.tungsten_log_group.name,
              project_config.TungstenLogGroup),
+            (project_config.tungsten_scale_group.name,
+             project_config.TungstenScaleGroup),
         ]
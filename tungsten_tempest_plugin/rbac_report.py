@@ -0,0 +1,174 @@
+#    Copyright 2017 AT&T Corporation.
+#    All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Structured RBAC report written without blocking the tests
+
+patrole logs the expected and actual outcome of every RBAC test to the
+``rbac_reporting`` logger.  JsonLinesHandler turns these records into JSON
+objects, one per line, and has a QueueListener thread write them to a file
+of its own per worker.  When a worker exits it merges its file into the
+report and removes it, so that the last worker to exit leaves the complete
+report behind.
+"""
+
+import copy
+import io
+import json
+import logging
+from logging import handlers
+import os
+import threading
+import time
+
+from oslo_concurrency import lockutils
+import six
+from six.moves import queue
+from tempest import config
+
+CONF = config.CONF
+
+# Arguments of the record patrole logs for every RBAC test
+PATROLE_FIELDS = ('service', 'test', 'rules', 'expected', 'actual')
+
+_CURRENT_TEST = threading.local()
+
+
+def test_started():
+    """Note the start of the test run by the calling thread"""
+    _CURRENT_TEST.start = time.time()
+    _CURRENT_TEST.roles = None
+
+
+def roles_switched(roles):
+    """Note the roles the calling thread's test switched to
+
+    Called by whatever switches the roles instead of patrole, e.g. for
+    every role of the role matrix, so that the report holds the roles the
+    requests were really made with.
+    """
+    _CURRENT_TEST.roles = list(roles)
+
+
+def test_roles():
+    """Return the roles the RBAC tests run with"""
+    return (getattr(CONF.patrole, 'rbac_test_roles', None)
+            or [CONF.patrole.rbac_test_role])
+
+
+def worker_path(path):
+    """Return the file the records of this worker are written to"""
+    return '%s.%d.jsonl' % (path, os.getpid())
+
+
+def merge(path, worker_file):
+    """Merge the file of a worker into the report and remove it
+
+    :param path: path of the report
+    :param worker_file: file written by the worker
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    with lockutils.lock(name + '.lock', external=True, lock_path=directory):
+        records = []
+        for merged_file in (path, worker_file):
+            if os.path.exists(merged_file):
+                with io.open(merged_file, encoding='utf-8') as f:
+                    records.extend(json.loads(line) for line in f)
+        records.sort(key=lambda record: record['timestamp'])
+        tmp_path = '%s.%d' % (path, os.getpid())
+        with io.open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, sort_keys=True) + u'\n')
+        os.rename(tmp_path, path)
+        if os.path.exists(worker_file):
+            os.remove(worker_file)
+
+
+class _ReportFormatter(logging.Formatter):
+
+    def format(self, record):
+        return json.dumps(record.report, sort_keys=True, default=str)
+
+
+class JsonLinesHandler(handlers.QueueHandler):
+    """Logging handler queueing records for a QueueListener thread
+
+    Records are written as JSON objects holding the patrole outcome, the
+    roles in effect, the duration of the test so far and the worker's
+    process ID.  Closing the handler, which logging does at exit, waits for
+    the queued records to be written and merges them into the report.
+
+    :param path: path of the merged report
+    :param roles: roles the RBAC tests run with when no other roles were
+                  switched to, by default those of the patrole configuration
+    """
+
+    def __init__(self, path, roles=None):
+        handlers.QueueHandler.__init__(self, queue.Queue())
+        self.path = path
+        self.roles = roles
+        self.worker_path = worker_path(path)
+        self._writer = None
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def to_dict(self, record):
+        if self.roles is None:
+            # Read late, patrole registers its options after this plugin
+            self.roles = test_roles()
+        report = {
+            'timestamp': record.created,
+            'worker': record.process,
+            'role': getattr(_CURRENT_TEST, 'roles', None) or self.roles,
+        }
+        start = getattr(_CURRENT_TEST, 'start', None)
+        report['duration'] = record.created - start if start else None
+        if isinstance(record.args, tuple) and len(record.args) == len(
+                PATROLE_FIELDS):
+            report.update(zip(PATROLE_FIELDS, record.args))
+            if isinstance(report['rules'], six.string_types):
+                report['rules'] = [
+                    rule.strip() for rule in report['rules'].split(',')]
+        else:
+            report['message'] = record.getMessage()
+        return report
+
+    def prepare(self, record):
+        # The test's start and roles are only known to the logging thread
+        record = copy.copy(record)
+        record.report = self.to_dict(record)
+        return record
+
+    def emit(self, record):
+        with self._listener_lock:
+            if self._listener is None:
+                # Started on the first record, so that an idle worker
+                # leaves no file behind
+                self._writer = logging.FileHandler(
+                    self.worker_path, encoding='utf-8', delay=True)
+                self._writer.setFormatter(_ReportFormatter())
+                self._listener = handlers.QueueListener(self.queue,
+                                                        self._writer)
+                self._listener.start()
+        handlers.QueueHandler.emit(self, record)
+
+    def close(self):
+        with self._listener_lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            self._writer.close()
+            merge(self.path, self.worker_path)
+        handlers.QueueHandler.close(self)
@@ -17,67 +17,13 @@
 Tempest service class for alarm client test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class AlarmClient(base.BaseContrailClient):
 
     """
     Service class for alarm test cases
     """
-
-    def list_alarms(self, params=None):
-        """
-        :param params:
-        :return: map object
-        """
-        url = '/alarms'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_alarms(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/alarms'
-        resp, body = self.post(url, json.dumps({'alarm': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_alarm(self, uuid, params=None):
-        """
-        :param uuid:
-        :param params:
-        :return: map object
-        """
-        url = '/alarm/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_alarm(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/alarm/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'alarm': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_alarm(self, uuid):
-        """
-        :param uuid:
-        :return: response object
-        """
-        url = '/alarm/{0}'.format(uuid)
-        return self.delete(url)
@@ -17,62 +17,13 @@
 Tempest service class for analytics node test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class AnalyticsNodeClient(base.BaseContrailClient):
 
     """
     Service class for analytics node test cases
     """
-
-    def list_analytics_nodes(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/analytics-nodes'
-        if params:
-            url += '?{0}'.format(urllib.urlencode(params))
-        return self.get(url)
-
-    def show_analytics_node(self, uuid):
-        """
-        :param uuid:
-        :return: response object
-        """
-        url = '/analytics-node/{0}'.format(uuid)
-        return self.get(url)
-
-    def create_analytics_nodes(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/analytics-nodes'
-        post_body = json.dumps({'analytics-node': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_analytics_node(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/analytics-node/{0}'.format(uuid)
-        put_body = json.dumps({'analytics-node': kwargs})
-        resp, body = self.put(url, put_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_analytics_node(self, uuid):
-        """
-        :param uuid:
-        :return: response object
-        """
-        url = '/analytics-node/{0}'.format(uuid)
-        return self.delete(url)
@@ -17,113 +17,13 @@
 Tempest service class for attachment clients test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class AttachmentsClient(base.BaseContrailClient):
 
     """
     Service class for attachment client test cases
     """
-
-    def list_provider_attachments(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/provider-attachments'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_provider_attachments(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/provider-attachments'
-        post_body = json.dumps({'provider-attachment': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_provider_attachment(self, appliance_id):
-        """
-        :param appliance_id:
-        :return: response object
-        """
-        url = '/provider-attachment/%s' % str(appliance_id)
-        return self.get(url)
-
-    def delete_provider_attachment(self, appliance_id):
-        """
-        :param appliance_id:
-        :return: response object
-        """
-        url = '/provider-attachment/%s' % str(appliance_id)
-        return self.delete(url)
-
-    def update_provider_attachment(self, appliance_id, **kwargs):
-        """
-        :param appliance_id:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/provider-attachment/%s' % str(appliance_id)
-        post_data = {'provider-attachment': kwargs}
-        req_post_data = json.dumps(post_data)
-        resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def list_customer_attachments(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/customer-attachments'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_customer_attachments(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/customer-attachments'
-        post_body = json.dumps({'customer-attachment': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_customer_attachment(self, appliance_id):
-        """
-        :param appliance_id:
-        :return: response object
-        """
-        url = '/customer-attachment/%s' % str(appliance_id)
-        return self.get(url)
-
-    def delete_customer_attachment(self, appliance_id):
-        """
-        :param appliance_id:
-        :return: response object
-        """
-        url = '/customer-attachment/%s' % str(appliance_id)
-        return self.delete(url)
-
-    def update_customer_attachment(self, appliance_id, **kwargs):
-        """
-        :param appliance_id:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/customer-attachment/%s' % str(appliance_id)
-        post_data = {'customer-attachment': kwargs}
-        req_post_data = json.dumps(post_data)
-        resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
@@ -17,29 +17,613 @@
 Base service class for all service classes
 """
 
+import collections
+from concurrent import futures
+import gzip
+import io
+import threading
+import time
+
 from oslo_log import log as logging
+from oslo_serialization import jsonutils as json
+import six
+from six.moves.urllib import parse as urllib
+from tempest.lib.common import http
 from tempest.lib.common import rest_client
 
+from tungsten_tempest_plugin import metrics
+from tungsten_tempest_plugin.services.contrail.json import cassette
+
 LOG = logging.getLogger(__name__)
 
+_HTTP_POOLS = {}
+_HTTP_POOLS_LOCK = threading.Lock()
+
+# Number of concurrent requests of a bulk call when the client has no
+# shared connection pool to size it by
+DEFAULT_BULK_WORKERS = 10
+
+# Number of objects fetched per request by the paginated iterators
+DEFAULT_PAGE_LIMIT = 100
+
+# Outcome of one item of a bulk call and the seconds its request took
+BulkResult = collections.namedtuple('BulkResult',
+                                    ['result', 'error', 'seconds'])
+
+_CREATE_OBSERVERS = []
+_DELETE_OBSERVERS = []
+
+_SHOW_CACHES = {}
+_SHOW_CACHES_LOCK = threading.Lock()
+
+_json_loads = json.loads
+
+
+def set_json_decoder(loads):
+    """Use another JSON decoder for response bodies, e.g. orjson.loads
+
+    :param loads: callable decoding a str or bytes JSON document
+    """
+    global _json_loads
+    _json_loads = loads
+
+
+class KeepAliveHttp(http.ClosingHttp):
+    """Connection pool that keeps connections to the config API open
+
+    ``ClosingHttp`` sends ``Connection: close`` and drops its pools after
+    every request, so each call pays a new TCP and TLS handshake.  This
+    variant leaves the connections in the pool, and urllib3 keys the pools
+    by scheme, host and port, so one instance serves every endpoint.
+    """
+
+    def __init__(self, pool_size, **kwargs):
+        super(KeepAliveHttp, self).__init__(**kwargs)
+        self.connection_pool_kw['maxsize'] = pool_size
+
+    def urlopen(self, method, url, redirect=True, **kwargs):
+        # ClosingHttp.request asks for the connection to be closed
+        headers = kwargs.get('headers')
+        if headers and 'connection' in headers:
+            kwargs['headers'] = dict((name, value)
+                                     for name, value in headers.items()
+                                     if name != 'connection')
+        return super(KeepAliveHttp, self).urlopen(method, url,
+                                                  redirect=redirect, **kwargs)
+
+    def clear(self):
+        """Keep the pools, which ClosingHttp.request clears every time"""
+
+
+def get_shared_http(pool_size, disable_ssl_certificate_validation=False,
+                    ca_certs=None, http_timeout=None, follow_redirects=True):
+    """Return the process-wide keep-alive pool for the given settings
+
+    :param pool_size: maximum number of connections kept per endpoint
+    :param disable_ssl_certificate_validation: skip TLS verification
+    :param ca_certs: path to the CA bundle used for TLS verification
+    :param http_timeout: socket timeout for the connections
+    :param follow_redirects: follow HTTP redirects
+    :return: KeepAliveHttp object
+    """
+    key = (pool_size, disable_ssl_certificate_validation, ca_certs,
+           http_timeout, follow_redirects)
+    with _HTTP_POOLS_LOCK:
+        pool = _HTTP_POOLS.get(key)
+        if pool is None:
+            pool = KeepAliveHttp(
+                pool_size,
+                disable_ssl_certificate_validation=(
+                    disable_ssl_certificate_validation),
+                ca_certs=ca_certs,
+                timeout=http_timeout,
+                follow_redirects=follow_redirects)
+            _HTTP_POOLS[key] = pool
+        return pool
+
+
+class LRUCache(object):
+    """Thread-safe mapping keeping only the most recently used entries"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._entries[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            return self._entries.pop(key, None)
+
+
+def get_show_cache(maxsize):
+    """Return the process-wide cache of show responses of the given size
+
+    :param maxsize: maximum number of cached objects
+    :return: LRUCache object
+    """
+    with _SHOW_CACHES_LOCK:
+        cache = _SHOW_CACHES.get(maxsize)
+        if cache is None:
+            cache = _SHOW_CACHES[maxsize] = LRUCache(maxsize)
+        return cache
+
+
+def _object_path(url):
+    """Return [type, uuid] if url addresses a single object, else None"""
+    path = url.split('?', 1)[0].strip('/').split('/')
+    return path if len(path) == 2 else None
+
+
+def _last_modified_etag(body):
+    """Build an entity tag from id_perms.last_modified of a show body"""
+    try:
+        obj = next(iter(_json_loads(body).values()))
+        return '"%s"' % obj['id_perms']['last_modified']
+    except (ValueError, TypeError, KeyError, AttributeError,
+            StopIteration):
+        return None
+
+
+def _gzip(body):
+    if isinstance(body, six.text_type):
+        body = body.encode('utf-8')
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as f:
+        f.write(body)
+    return buf.getvalue()
+
+
+def register_create_observer(callback):
+    """Have ``callback(resource_type, obj, body)`` called on every create
+
+    The callback runs after any Contrail client successfully created an
+    object through its create methods, with the object returned by the
+    server and the object body that was sent, which holds its references.
+
+    :param callback: callable taking the object type, the created object
+                     and the request body
+    """
+    _CREATE_OBSERVERS.append(callback)
+
+
+def register_delete_observer(callback):
+    """Have ``callback(resource_type, uuid)`` called on every object delete
+
+    The callback runs after any Contrail client sends a DELETE for
+    ``/<resource_type>/<uuid>``, whether or not the delete succeeded, so
+    caches of object data can drop the entry.
+
+    :param callback: callable taking the object type and uuid
+    """
+    _DELETE_OBSERVERS.append(callback)
+
 
 class BaseContrailClient(rest_client.RestClient):
     """Base Tempest REST client for Designate API"""
 
+    def __init__(self, auth_provider, service, region,
+                 endpoint_type='publicURL', pool_size=0, show_cache_size=0,
+                 compression='none', transport='live', cassette_path=None,
+                 **kwargs):
+        super(BaseContrailClient, self).__init__(
+            auth_provider, service, region, endpoint_type=endpoint_type,
+            **kwargs)
+        self._resources = {}
+        self.pool_size = pool_size
+        self.compression = compression
+        self.show_cache = None
+        if show_cache_size:
+            self.show_cache = get_show_cache(show_cache_size)
+        # A proxied client keeps tempest's own ClosingProxyHttp
+        if pool_size and not kwargs.get('proxy_url'):
+            self.http_obj = get_shared_http(
+                pool_size,
+                disable_ssl_certificate_validation=kwargs.get(
+                    'disable_ssl_certificate_validation', False),
+                ca_certs=kwargs.get('ca_certs'),
+                http_timeout=kwargs.get('http_timeout'),
+                follow_redirects=kwargs.get('follow_redirects', True))
+        if transport == 'record':
+            self.http_obj = cassette.RecordingHttp(
+                self.http_obj, cassette.get_cassette(cassette_path))
+        elif transport == 'replay':
+            self.http_obj = cassette.ReplayHttp(
+                cassette.get_cassette(cassette_path))
+
+    def request(self, method, url, *args, **kwargs):
+        try:
+            return super(BaseContrailClient, self).request(
+                method, url, *args, **kwargs)
+        finally:
+            path = _object_path(url) if method in ('PUT', 'DELETE') else None
+            if path:
+                for cache in _SHOW_CACHES.values():
+                    cache.pop('/%s/%s' % tuple(path))
+                if method == 'DELETE':
+                    for observer in _DELETE_OBSERVERS:
+                        observer(*path)
+
+    def raw_request(self, url, method, headers=None, body=None,
+                    chunked=False, **kwargs):
+        if self.compression != 'none':
+            headers = dict(headers if headers is not None
+                           else self.get_headers())
+            headers.setdefault('Accept-Encoding', 'gzip, deflate')
+            if (self.compression == 'request_and_response' and body
+                    and 'Content-Encoding' not in headers):
+                kwargs.setdefault('log_req_body', body)
+                body = _gzip(body)
+                headers['Content-Encoding'] = 'gzip'
+        start = time.time()
+        resp, resp_body = super(BaseContrailClient, self).raw_request(
+            url, method, headers=headers, body=body, chunked=chunked,
+            **kwargs)
+        if metrics.RECORDER is not None:
+            metrics.RECORDER.record(
+                method, url, resp.status, time.time() - start,
+                len(body or ''),
+                int(resp.get('content-length', len(resp_body or ''))))
+        return resp, resp_body
+
+    def get(self, url, headers=None, extra_headers=False, *args, **kwargs):
+        """Send a GET, revalidating cached objects when show cache is on
+
+        A cached object is requested with ``If-None-Match`` set to its
+        ETag, or to its ``id_perms.last_modified`` when the server sent no
+        ETag.  On ``304 Not Modified`` the cached response and body are
+        returned, so unchanged objects are not transferred again while the
+        request is still authorized by the server.
+        """
+        if (self.show_cache is None or headers is not None
+                or '?' in url or not _object_path(url)):
+            return super(BaseContrailClient, self).get(
+                url, headers, extra_headers, *args, **kwargs)
+        cached = self.show_cache.get(url)
+        if cached:
+            headers = {'If-None-Match': cached[0]}
+            extra_headers = True
+        resp, body = super(BaseContrailClient, self).get(
+            url, headers, extra_headers, *args, **kwargs)
+        if resp.status == 304 and cached:
+            return cached[1], cached[2]
+        etag = resp.get('etag') or _last_modified_etag(body)
+        if etag:
+            self.show_cache.set(url, (etag, resp, body))
+        return resp, body
+
+    @staticmethod
+    def list_query(params=None, **kwargs):
+        """Build the query parameters of a VNC API list call
+
+        Besides raw ``params`` this accepts the list options of the config
+        API as keywords so that one request returns exactly the objects and
+        attributes needed instead of a list followed by a show per object:
+
+        * detail: return whole objects instead of uuid/fq_name/href
+        * fields: list of extra attributes, refs or back-refs to return
+        * obj_uuids, parent_id, back_ref_id: lists of uuids to filter on
+        * filters: dict of attribute name to value (or list of values)
+
+        Any other keyword is passed through as a query parameter.
+
+        :param params: dict of raw query parameters
+        :return: dict of query parameters
+        """
+        query = dict(params or {})
+        filters = kwargs.pop('filters', None)
+        if filters:
+            query['filters'] = ','.join(
+                '%s==%s' % (name, v if isinstance(v, six.string_types)
+                            else json.dumps(v))
+                for name, values in sorted(filters.items())
+                for v in (values if isinstance(values, (list, tuple))
+                          else [values]))
+        for name, value in kwargs.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = ','.join(value)
+            query[name] = value
+        return query
+
+    def list_url(self, url, params=None, **kwargs):
+        """Append the query string of a list call to a collection URL
+
+        :param url: collection URL, e.g. '/virtual-networks'
+        :param params: dict of raw query parameters
+        :param kwargs: list options, see list_query
+        :return: URL string
+        """
+        query = self.list_query(params, **kwargs)
+        if query:
+            url += '?%s' % urllib.urlencode(query)
+        return url
+
+    def resource(self, resource_type):
+        """Return the ResourceClient for the objects of one type
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :return: ResourceClient object sending its requests through this
+                 client
+        """
+        resource = self._resources.get(resource_type)
+        if resource is None:
+            resource = self._resources.setdefault(
+                resource_type, ResourceClient(self, resource_type))
+        return resource
+
+    def iter_resources(self, resource_type, page_limit=DEFAULT_PAGE_LIMIT,
+                       params=None, **kwargs):
+        """Iterate over the objects of a collection page by page
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param page_limit: number of objects requested per page
+        :param params: additional query parameters of the list call
+        :param kwargs: list options, see list_query
+        :return: generator of object dicts, see ResourceClient.iter
+        """
+        return self.resource(resource_type).iter(page_limit, params,
+                                                 **kwargs)
+
+    def create_resource(self, resource_type, body):
+        """Create one object of any type
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param body: object body, as passed to create_*
+        """
+        return self.resource(resource_type).create(body)[1]
+
+    def delete_resource(self, resource_type, uuid):
+        """Delete one object of any type
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param uuid: object uuid
+        """
+        return self.resource(resource_type).delete(uuid)
+
+    def create_many(self, resource_type, bodies, max_workers=None):
+        """Create many objects of one type concurrently
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param bodies: iterable of object bodies, as passed to create_*
+        :param max_workers: number of requests in flight, defaults to the
+                            connection pool size
+        :return: list of BulkResult objects in the order of ``bodies``
+        """
+        return self.run_many(
+            lambda body: self.create_resource(resource_type, body), bodies,
+            max_workers)
+
+    def delete_many(self, resource_type, uuids, max_workers=None):
+        """Delete many objects of one type concurrently
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param uuids: iterable of object uuids
+        :param max_workers: number of requests in flight, defaults to the
+                            connection pool size
+        :return: list of BulkResult objects in the order of ``uuids``
+        """
+        return self.run_many(
+            lambda uuid: self.delete_resource(resource_type, uuid), uuids,
+            max_workers)
+
+    def run_many(self, func, items, max_workers=None):
+        """Call func on every item concurrently, with bounded concurrency
+
+        At most ``max_workers`` calls run at once, each in a thread of its
+        own over the shared connection pool.  A failing item doesn't stop
+        the others; its exception is returned as the ``error`` of its
+        BulkResult.
+
+        :param func: callable taking one item, e.g. a bound API method
+        :param items: iterable of the items to call func on
+        :param max_workers: number of requests in flight, defaults to the
+                            connection pool size
+        :return: list of BulkResult objects in the order of ``items``
+        """
+        def timed(item):
+            start = time.time()
+            try:
+                return BulkResult(func(item), None, time.time() - start)
+            except Exception as e:
+                return BulkResult(None, e, time.time() - start)
+
+        max_workers = max_workers or self.pool_size or DEFAULT_BULK_WORKERS
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(timed, items))
+
+
+class ResourceClient(object):
+    """Requests on the objects of one type of the config API
+
+    The API methods the service classes get from the resource registry,
+    see resources.RESOURCES, and the generic calls of BaseContrailClient
+    all send their requests through these methods.  Like the methods of
+    RestClient they return the response and the raw body.
+
+    :param client: BaseContrailClient sending the requests
+    :param resource_type: object type, e.g. 'virtual-network'
+    """
+
+    def __init__(self, client, resource_type):
+        self.client = client
+        self.resource_type = resource_type
+        self.collection_url = '/%ss' % resource_type
+
+    def object_url(self, uuid, params=None):
+        """Return the URL of one object
+
+        :param uuid: object uuid
+        :param params: dict of query parameters
+        """
+        url = '/%s/%s' % (self.resource_type, uuid)
+        if params:
+            url += '?%s' % urllib.urlencode(params)
+        return url
+
+    def list(self, params=None, **kwargs):
+        """
+        :param params: dict of raw query parameters
+        :param kwargs: list options, see BaseContrailClient.list_query
+        """
+        return self.client.get(
+            self.client.list_url(self.collection_url, params, **kwargs))
+
+    def create(self, body):
+        """
+        :param body: dict of the attributes of the object
+        :return: the response and its body as a ResponseBody
+        """
+        resp, resp_body = self.client.post(
+            self.collection_url, json.dumps({self.resource_type: body}))
+        resp_body = ResponseBody(resp, resp_body)
+        if _CREATE_OBSERVERS:
+            # The observers share the body decoded for the caller
+            obj = resp_body.get(self.resource_type)
+            if obj:
+                for observer in _CREATE_OBSERVERS:
+                    observer(self.resource_type, obj, body)
+        return resp, resp_body
+
+    def show(self, uuid, params=None):
+        """
+        :param uuid: object uuid
+        :param params: dict of query parameters, e.g. {'fields': ...}
+        """
+        return self.client.get(self.object_url(uuid, params))
+
+    def update(self, uuid, body):
+        """
+        :param uuid: object uuid
+        :param body: dict of the attributes to update
+        """
+        return self.client.put(self.object_url(uuid),
+                               json.dumps({self.resource_type: body}))
+
+    def delete(self, uuid):
+        """
+        :param uuid: object uuid
+        """
+        return self.client.delete(self.object_url(uuid))
+
+    def iter(self, page_limit=DEFAULT_PAGE_LIMIT, params=None, **kwargs):
+        """Iterate over the objects page by page
+
+        Uses the VNC API ``page_limit``/``page_marker`` parameters, so only
+        one page is held in memory at a time and no further page is fetched
+        once the caller stops iterating.  A server that doesn't paginate
+        returns everything as a single page.
+
+        :param page_limit: number of objects requested per page
+        :param params: additional query parameters of the list call
+        :param kwargs: list options, see BaseContrailClient.list_query
+        :return: generator of object dicts
+        """
+        collection = self.collection_url[1:]
+        query = self.client.list_query(params, page_limit=page_limit,
+                                       **kwargs)
+        while True:
+            _, body = self.client.get(
+                '%s?%s' % (self.collection_url, urllib.urlencode(query)))
+            body = _json_loads(body)
+            objs = body.get(collection)
+            for obj in objs or []:
+                yield obj
+            marker = body.get('marker')
+            if not objs or not marker:
+                return
+            query['page_marker'] = marker
+
+    def create_many(self, bodies, max_workers=None):
+        """Create many objects concurrently, see BaseContrailClient"""
+        return self.client.create_many(self.resource_type, bodies,
+                                       max_workers)
+
+    def delete_many(self, uuids, max_workers=None):
+        """Delete many objects concurrently, see BaseContrailClient"""
+        return self.client.delete_many(self.resource_type, uuids,
+                                       max_workers)
+
+
+# Key the raw JSON body of an undecoded ResponseBody is stored under.  The
+# dict is not empty meanwhile, which makes C code checking its size, like
+# the json encoder, go through the decoding methods.
+_RAW_BODY = object()
+
 
 class ResponseBody(dict):
     """Class that wraps an http response and dict body into a single value.
 
     Callers that receive this object will normally use it as a dict but
-    can extract the response if needed.
+    can extract the response if needed.  A raw JSON body is only decoded
+    when the dict is first read; the dict methods decode it first, so the
+    object passes for a decoded dict, e.g. to json.dumps or copy().
     """
 
+    __slots__ = ('response',)
+
     def __init__(self, response, body=None, **kwargs):
-        super(ResponseBody, self).__init__(**kwargs)
-        body_data = body or {}
-        self.update(body_data)
+        super(ResponseBody, self).__init__()
         self.response = response
+        if isinstance(body, (six.binary_type, six.text_type)):
+            if body:
+                dict.__setitem__(self, _RAW_BODY, body)
+        elif body is not None:
+            dict.update(self, body)
+        if kwargs:
+            self.update(kwargs)
+
+    def _decode(self):
+        raw = dict.get(self, _RAW_BODY)
+        if raw is not None:
+            dict.update(self, _json_loads(raw))
+            dict.pop(self, _RAW_BODY, None)
+
+    def __eq__(self, other):
+        self._decode()
+        if isinstance(other, ResponseBody):
+            other._decode()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
 
     def __str__(self):
-        body = super(ResponseBody, self).__str__()
-        return "response: %s\nBody: %s" % (self.response, body)
+        self._decode()
+        return "response: %s\nBody: %s" % (self.response,
+                                           dict.__repr__(self))
+
+
+def _decoding(name):
+    method = getattr(dict, name)
+
+    def decoding(self, *args, **kwargs):
+        self._decode()
+        return method(self, *args, **kwargs)
+    decoding.__name__ = name
+    decoding.__doc__ = method.__doc__
+    return decoding
+
+
+for _name in ('__contains__', '__delitem__', '__getitem__', '__iter__',
+              '__len__', '__repr__', '__setitem__', 'clear', 'copy', 'get',
+              'items', 'keys', 'pop', 'popitem', 'setdefault', 'update',
+              'values') + (('iteritems', 'iterkeys', 'itervalues',
+                            'has_key') if six.PY2 else ()):
+    setattr(ResponseBody, _name, _decoding(_name))
@@ -17,63 +17,13 @@
 Tempest service class for BGP as a service test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class BGPAsAServiceClient(base.BaseContrailClient):
 
     """
     Service class for bgp as a service test cases
     """
-
-    def list_bgp_as_a_services(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/bgp-as-a-services'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_bgp_as_a_services(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/bgp-as-a-services'
-        post_body = json.dumps({'bgp-as-a-service': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_bgp_as_a_service(self, bgp_id):
-        """
-        :param bgp_id:
-        :return: response object
-        """
-        url = '/bgp-as-a-service/%s' % str(bgp_id)
-        return self.get(url)
-
-    def delete_bgp_as_a_service(self, bgp_id):
-        """
-        :param bgp_id:
-        :return: response object
-        """
-        url = '/bgp-as-a-service/%s' % str(bgp_id)
-        return self.delete(url)
-
-    def update_bgp_as_a_service(self, bgp_id, **kwargs):
-        """
-        :param bgp_id:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/bgp-as-a-service/%s' % str(bgp_id)
-        post_data = {'bgp-as-a-service': kwargs}
-        req_post_data = json.dumps(post_data)
-        resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
@@ -0,0 +1,216 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Record and replay transport for the Contrail service clients
+"""
+
+import atexit
+import collections
+import gzip
+import io
+import json
+import os
+import re
+import threading
+import time
+
+from oslo_concurrency import lockutils
+import six
+from six.moves.urllib import parse as urllib
+from tempest.lib import exceptions
+
+UUID_RE = re.compile(
+    r'[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}')
+# Numeric suffix appended by data_utils.rand_name
+RAND_NAME_RE = re.compile(r'-\d{6,}\b')
+
+# Response headers kept in the cassette
+RECORDED_HEADERS = ('content-type', 'etag')
+
+_CASSETTES = {}
+_CASSETTES_LOCK = threading.Lock()
+
+# A cassette last written before the process started is from an earlier run
+_STARTED = time.time()
+
+
+class CassetteMiss(exceptions.TempestException):
+    message = "No recorded response for %(method)s %(url)s"
+
+
+class Response(dict):
+    """Response headers in the form returned by tempest's http objects"""
+
+    def __init__(self, status, headers, url):
+        super(Response, self).__init__(headers)
+        self.status = status
+        self.reason = ''
+        self.version = 11
+        self['status'] = str(status)
+        self['content-location'] = url
+
+
+def _text(data):
+    if isinstance(data, six.binary_type):
+        return data.decode('utf-8')
+    return data or ''
+
+
+def normalize(text):
+    """Replace uuids and rand_name suffixes with fixed placeholders"""
+    return RAND_NAME_RE.sub('-<rand>', UUID_RE.sub('<uuid>', text))
+
+
+def request_key(method, url, headers=None, body=None):
+    """Return the key a request is recorded and looked up under
+
+    The endpoint is left out and uuids and rand_name suffixes are
+    normalized, so that a replayed run matches the recorded one even
+    though the objects got other names and ids.
+    """
+    parsed = urllib.urlparse(url)
+    path = parsed.path + ('?' + parsed.query if parsed.query else '')
+    if body and (headers or {}).get('Content-Encoding') == 'gzip':
+        body = gzip.GzipFile(fileobj=io.BytesIO(body)).read()
+    return '%s %s %s' % (method, normalize(path), normalize(_text(body)))
+
+
+class Cassette(object):
+    """Interactions recorded to or replayed from one JSON lines file
+
+    Each line holds one request key with the status, headers and body of
+    its response; files ending in ``.gz`` are gzip compressed.  Repeated
+    requests with the same key are replayed in the order recorded.
+
+    Every worker process records to a file of its own, ``<path>.<pid>``,
+    through a single writer kept open until close() or exit.  close()
+    merges it into the cassette under an inter-process lock, replacing a
+    cassette left by an earlier run and adding to one written by another
+    worker of this run.  The cassette is rewritten as a whole, so a gzip
+    cassette is one compressed stream rather than a member per line.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.worker_path = '%s.%d' % (path, os.getpid())
+        self._replies = None
+        self._writer = None
+        self._recorded = False
+        self._lock = threading.Lock()
+
+    def _open(self, path, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(path, mode + 't')
+        return io.open(path, mode)
+
+    def record(self, key, status, headers, body):
+        line = json.dumps({
+            'key': key,
+            'status': status,
+            'headers': dict((name, headers[name])
+                            for name in RECORDED_HEADERS if name in headers),
+            'body': _text(body),
+        }, sort_keys=True)
+        with self._lock:
+            if self._writer is None:
+                # Only the first writer of the process starts a new file
+                self._writer = self._open(self.worker_path,
+                                          'a' if self._recorded else 'w')
+                if not self._recorded:
+                    atexit.register(self.close)
+                self._recorded = True
+            self._writer.write(six.text_type(line + '\n'))
+
+    def close(self):
+        """Close the recording writer, if any, and merge what it wrote"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                self._merge()
+
+    def _merge(self):
+        directory, name = os.path.split(os.path.abspath(self.path))
+        with lockutils.lock(name + '.lock', external=True,
+                            lock_path=directory):
+            lines = []
+            written = (os.path.getmtime(self.path)
+                       if os.path.exists(self.path) else 0)
+            if written >= _STARTED:
+                with self._open(self.path, 'r') as f:
+                    lines.extend(f)
+            with self._open(self.worker_path, 'r') as f:
+                lines.extend(f)
+            tmp_path = self.worker_path + '.tmp'
+            with self._open(tmp_path, 'w') as f:
+                f.writelines(lines)
+            os.rename(tmp_path, self.path)
+            os.remove(self.worker_path)
+
+    def replay(self, key):
+        with self._lock:
+            if self._replies is None:
+                self._replies = collections.defaultdict(collections.deque)
+                if os.path.exists(self.path):
+                    with self._open(self.path, 'r') as f:
+                        for line in f:
+                            reply = json.loads(line)
+                            self._replies[reply['key']].append(reply)
+            replies = self._replies.get(key)
+            if not replies:
+                return None
+            # Keep serving the last response once the recording runs out
+            return replies.popleft() if len(replies) > 1 else replies[0]
+
+
+def get_cassette(path):
+    """Return the process-wide cassette stored at path"""
+    path = os.path.abspath(path)
+    with _CASSETTES_LOCK:
+        cassette = _CASSETTES.get(path)
+        if cassette is None:
+            cassette = _CASSETTES[path] = Cassette(path)
+        return cassette
+
+
+class RecordingHttp(object):
+    """Http object that records what the wrapped one sends and receives"""
+
+    def __init__(self, http_obj, cassette):
+        self.http_obj = http_obj
+        self.cassette = cassette
+
+    def request(self, url, method, headers=None, body=None, **kwargs):
+        resp, resp_body = self.http_obj.request(
+            url, method, headers=headers, body=body, **kwargs)
+        if kwargs.get('preload_content', True):
+            self.cassette.record(request_key(method, url, headers, body),
+                                 resp.status, resp, resp_body)
+        return resp, resp_body
+
+
+class ReplayHttp(object):
+    """Http object answering requests from a cassette, without a server"""
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def request(self, url, method, headers=None, body=None, **kwargs):
+        reply = self.cassette.replay(request_key(method, url, headers, body))
+        if reply is None:
+            raise CassetteMiss(method=method, url=url)
+        return (Response(reply['status'], reply['headers'], url),
+                reply['body'].encode('utf-8'))
@@ -17,58 +17,13 @@
 Tempest service class for database test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class ContrailDatabaseClient(base.BaseContrailClient):
 
     """
     Service class for database test cases
     """
-
-    def list_database_nodes(self):
-        """
-        :return: response object
-        """
-        url = '/database-nodes'
-        return self.get(url)
-
-    def show_database_node(self, db_node_id):
-        """
-        :param db_node_id:
-        :return: response object
-        """
-        url = '/database-node/%s' % db_node_id
-        return self.get(url)
-
-    def create_databse_nodes(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        post_body = json.dumps({'database-node': kwargs})
-        url = '/database-nodes'
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_database_node(self, db_node_id):
-        """
-        :param db_node_id:
-        :return: response object
-        """
-        url = '/database-node/%s' % db_node_id
-        return self.delete(url)
-
-    def update_database_node(self, db_node_id, **kwargs):
-        """
-        :param db_node_id:
-        :param kwargs:
-        :return: map object
-        """
-        post_body = json.dumps({'database-node': kwargs})
-        url = '/database-node/%s' % db_node_id
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
@@ -17,63 +17,13 @@
 Tempest service class for database service assignment test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class DiscoveryServiceAssignmentClient(base.BaseContrailClient):
 
     """
     Service class for dsa test cases
     """
-
-    def list_ds_assignments(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/discovery-service-assignments'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_ds_assignments(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/discovery-service-assignments'
-        post_body = json.dumps({'discovery-service-assignment': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_ds_assignment(self, assignment_id):
-        """
-        :param assignment_id:
-        :return: response object
-        """
-        url = '/discovery-service-assignment/%s' % str(assignment_id)
-        return self.get(url)
-
-    def delete_ds_assignment(self, assignment_id):
-        """
-        :param assignment_id:
-        :return: response object
-        """
-        url = '/discovery-service-assignment/%s' % str(assignment_id)
-        return self.delete(url)
-
-    def update_ds_assignment(self, assignment_id, **kwargs):
-        """
-        :param assignment_id:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/discovery-service-assignment/%s' % str(assignment_id)
-        post_data = {'discovery-service-assignment': kwargs}
-        req_post_data = json.dumps(post_data)
-        resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
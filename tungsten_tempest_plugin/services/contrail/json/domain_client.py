@@ -17,68 +17,13 @@
 Tempest service class for domain test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class DomainClient(base.BaseContrailClient):
 
     """
     Service class for domain test cases
     """
-
-
-    def list_domains(self, params=None):
-        """
-        :param params:
-        :return: map object
-        """
-        url = '/domains'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_domains(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/domains'
-        resp, body = self.post(url, json.dumps({'domain': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_domain(self, uuid, params=None):
-        """
-        :param uuid:
-        :param params:
-        :return: map object
-        """
-        url = '/domain/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_domain(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/domain/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'domain': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_domain(self, uuid):
-        """
-        :param uuid:
-        :return: response object
-        """
-        url = '/domain/{0}'.format(uuid)
-        return self.delete(url)
@@ -17,62 +17,13 @@
 Tempest service class for dsa rule test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class DSARuleClient(base.BaseContrailClient):
 
     """
     Service class for dsa rules test cases
     """
-
-    def list_dsa_rules(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/dsa-rules'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_dsa_rules(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/dsa-rules'
-        post_body = json.dumps({'dsa-rule': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_dsa_rule(self, dns_id):
-        """
-        :param dns_id:
-        :return: response object
-        """
-        url = '/dsa-rule/%s' % dns_id
-        return self.get(url)
-
-    def delete_dsa_rule(self, dns_id):
-        """
-        :param dns_id:
-        :return: response object
-        """
-        url = '/dsa-rule/%s' % dns_id
-        return self.delete(url)
-
-    def update_dsa_rule(self, dns_id, **kwargs):
-        """
-        :param dns_id:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/dsa-rule/%s' % dns_id
-        post_body = json.dumps({'dsa-rule': kwargs})
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
@@ -13,62 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class ForwardingClassClient(base.BaseContrailClient):
 
     """
     Service class for forwarding class test cases
     """
-
-    def list_forwarding_classs(self, params=None):
-        """
-        :param params:
-        :return: response object
-        """
-        url = '/forwarding-classs'
-        if params:
-            url += '?{0}'.format(urllib.urlencode(params))
-        return self.get(url)
-
-    def show_forwarding_class(self, uuid):
-        """
-        :param uuid:
-        :return: response object
-        """
-        url = '/forwarding-class/{0}'.format(uuid)
-        return self.get(url)
-
-    def create_forwarding_classs(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/forwarding-classs'
-        post_body = json.dumps({'forwarding-class': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_forwarding_class(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/forwarding-class/{0}'.format(uuid)
-        put_body = json.dumps({'forwarding-class': kwargs})
-        resp, body = self.put(url, put_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_forwarding_class(self, uuid):
-        """
-        :param uuid:
-        :return: response object
-        """
-        url = '/forwarding-class/{0}'.format(uuid)
-        return self.delete(url)
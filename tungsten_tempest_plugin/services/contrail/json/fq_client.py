@@ -17,9 +17,91 @@
 Tempest service class for forward class test cases
 """
 
+import collections
+import threading
+import time
+
 from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
 
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+class ResolutionCache(object):
+    """Bounded LRU map between uuids and (type, fq_name) with a TTL
+
+    Both directions share one entry per object, so evicting, expiring or
+    invalidating an object always drops both lookups together.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # uuid -> (type, fq_name, response, expiry)
+        self._entries = collections.OrderedDict()
+        # (type, fq_name) -> uuid
+        self._uuids = {}
+        self._lock = threading.Lock()
+
+    def get_uuid(self, obj_type, fq_name):
+        """Return (uuid, response) of a cached object or None"""
+        with self._lock:
+            uuid = self._uuids.get((obj_type, tuple(fq_name)))
+            entry = self._get(uuid) if uuid else None
+            return (uuid, entry[2]) if entry else None
+
+    def get_fqname(self, uuid):
+        """Return (type, fq_name, response) of a cached object or None"""
+        with self._lock:
+            entry = self._get(uuid)
+            return (entry[0], list(entry[1]), entry[2]) if entry else None
+
+    def add(self, uuid, obj_type, fq_name, response):
+        with self._lock:
+            self._pop(uuid)
+            fq_name = tuple(fq_name)
+            self._entries[uuid] = (obj_type, fq_name, response,
+                                   time.time() + self.ttl)
+            self._uuids[(obj_type, fq_name)] = uuid
+            while len(self._entries) > self.maxsize:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, resource_type, uuid):
+        with self._lock:
+            self._pop(uuid)
+
+    def _get(self, uuid):
+        entry = self._pop(uuid)
+        if entry and entry[3] > time.time():
+            # Re-insert to mark the entry as most recently used
+            self._entries[uuid] = entry
+            self._uuids[(entry[0], entry[1])] = uuid
+            return entry
+        return None
+
+    def _pop(self, uuid):
+        entry = self._entries.pop(uuid, None)
+        if entry:
+            self._uuids.pop((entry[0], entry[1]), None)
+        return entry
+
+
+def get_resolution_cache(maxsize, ttl):
+    """Return the process-wide resolution cache for the given limits
+
+    :param maxsize: maximum number of cached objects
+    :param ttl: seconds a resolution is served from the cache
+    :return: ResolutionCache object
+    """
+    with _CACHES_LOCK:
+        cache = _CACHES.get((maxsize, ttl))
+        if cache is None:
+            cache = ResolutionCache(maxsize, ttl)
+            base.register_delete_observer(cache.invalidate)
+            _CACHES[(maxsize, ttl)] = cache
+        return cache
+
 
 class FqnameIdClient(base.BaseContrailClient):
 
@@ -27,26 +109,75 @@ class FqnameIdClient(base.BaseContrailClient):
     Service class for fq name test cases
     """
 
+    def __init__(self, auth_provider, service, region,
+                 endpoint_type='publicURL', cache_size=0, cache_ttl=0,
+                 **kwargs):
+        super(FqnameIdClient, self).__init__(
+            auth_provider, service, region, endpoint_type=endpoint_type,
+            **kwargs)
+        self.cache = None
+        if cache_size and cache_ttl:
+            self.cache = get_resolution_cache(cache_size, cache_ttl)
+
     def fqname_to_id(self, **kwargs):
         """
         :param kwargs:
         :return: map object
         """
+        if self.cache and set(kwargs) == {'type', 'fq_name'}:
+            cached = self.cache.get_uuid(kwargs['type'], kwargs['fq_name'])
+            if cached:
+                return base.ResponseBody(cached[1], {'uuid': cached[0]})
+
         uri = '/fqname-to-id'
         req_post_data = json.dumps(kwargs)
 
         resp, body = self.post(uri, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
+        body = base.ResponseBody(resp, body)
+        if self.cache and 'uuid' in body:
+            self.cache.add(body['uuid'], kwargs.get('type'),
+                           kwargs.get('fq_name', []), resp)
+        return body
 
     def id_to_fqname(self, **kwargs):
         """
         :param kwargs:
         :return: map object
         """
+        if self.cache and set(kwargs) == {'uuid'}:
+            cached = self.cache.get_fqname(kwargs['uuid'])
+            if cached:
+                return base.ResponseBody(
+                    cached[2], {'type': cached[0], 'fq_name': cached[1]})
+
         uri = '/id-to-fqname'
         req_post_data = json.dumps(kwargs)
 
         resp, body = self.post(uri, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
+        body = base.ResponseBody(resp, body)
+        if self.cache and 'fq_name' in body:
+            self.cache.add(kwargs.get('uuid'), body.get('type'),
+                           body['fq_name'], resp)
+        return body
+
+    def fqnames_to_ids(self, names, max_workers=None):
+        """
+        Resolve many fq_names concurrently
+
+        :param names: iterable of dicts with 'type' and 'fq_name' keys
+        :param max_workers: number of requests in flight
+        :return: list of BulkResult objects in the order of ``names``
+        """
+        return self.run_many(lambda name: self.fqname_to_id(**name),
+                             names, max_workers)
+
+    def ids_to_fqnames(self, uuids, max_workers=None):
+        """
+        Resolve many uuids concurrently
+
+        :param uuids: iterable of object uuids
+        :param max_workers: number of requests in flight
+        :return: list of BulkResult objects in the order of ``uuids``
+        """
+        return self.run_many(lambda uuid: self.id_to_fqname(uuid=uuid),
+                             uuids, max_workers)
@@ -17,67 +17,13 @@
 Tempest service class for instance IP test cases
 """
 
-from oslo_serialization import jsonutils as json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class InstanceIPClient(base.BaseContrailClient):
 
     """
     Service class for instance ip test cases
     """
-
-    def list_instance_ips(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/instance-ips'
-        if kwargs:
-            url += '?%s' % urllib.urlencode(kwargs)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_instance_ips(self, **kwargs):
-        """
-        :param kwargs:
-        :return: map object
-        """
-        url = '/instance-ips'
-        post_body = {'instance-ip': kwargs}
-        resp, body = self.post(url, json.dumps(post_body))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_instance_ip(self, uuid):
-        """
-        :param uuid:
-        :return: map object
-        """
-        url = '/instance-ip/{0}'.format(uuid)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_instance_ip(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return: map object
-        """
-        url = '/instance-ip/{0}'.format(uuid)
-        put_body = {'instance-ip': kwargs}
-        resp, body = self.put(url, json.dumps(put_body))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_instance_ip(self, uuid):
-        """
-        :param uuid:
-        :return: map object
-        """
-        url = '/instance-ip/{0}'.format(uuid)
-        resp, body = self.delete(url)
-        return base.ResponseBody(resp, body)
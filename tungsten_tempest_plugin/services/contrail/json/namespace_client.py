@@ -17,67 +17,13 @@
 Tempest service class for namespace test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class NamespaceClient(base.BaseContrailClient):
 
     """
     Service class for namespace test cases
     """
-
-    def list_namespaces(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/namespaces'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_namespaces(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/namespaces'
-        resp, body = self.post(url, json.dumps({'namespace': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_namespace(self, uuid, params=None):
-        """
-        :param uuid:
-        :param params:
-        :return:
-        """
-        url = '/namespace/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_namespace(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return:
-        """
-        url = '/namespace/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'namespace': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_namespace(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/namespace/{0}'.format(uuid)
-        return self.delete(url)
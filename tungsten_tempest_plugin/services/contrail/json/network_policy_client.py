@@ -17,67 +17,13 @@
 Tempest service class for netwrok policy test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class NetworkPolicyClient(base.BaseContrailClient):
 
     """
     Service class for network policy test cases
     """
-
-    def list_network_policys(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/network-policys'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_network_policys(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/network-policys'
-        resp, body = self.post(url, json.dumps({'network-policy': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_network_policy(self, uuid, params=None):
-        """
-        :param uuid:
-        :param params:
-        :return:
-        """
-        url = '/network-policy/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_network_policy(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return:
-        """
-        url = '/network-policy/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'network-policy': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_network_policy(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/network-policy/{0}'.format(uuid)
-        return self.delete(url)
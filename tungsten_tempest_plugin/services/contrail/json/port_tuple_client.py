@@ -17,59 +17,13 @@
 Tempest service class for tuple test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class PortTupleClient(base.BaseContrailClient):
 
-
-    def list_port_tuples(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/port-tuples'
-        if params:
-            url += '?{0}'.format(urllib.urlencode(params))
-        return self.get(url)
-
-    def show_port_tuple(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/port-tuple/{0}'.format(uuid)
-        return self.get(url)
-
-    def create_port_tuples(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/port-tuples'
-        post_body = json.dumps({'port-tuple': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_port_tuple(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return:
-        """
-        url = '/port-tuple/{0}'.format(uuid)
-        put_body = json.dumps({'port-tuple': kwargs})
-        resp, body = self.put(url, put_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_port_tuple(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/port-tuple/{0}'.format(uuid)
-        return self.delete(url)
+    """
+    Service class for port tuple test cases
+    """
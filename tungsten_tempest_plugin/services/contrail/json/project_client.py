@@ -17,67 +17,13 @@
 Tempest service class for project test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class ProjectClient(base.BaseContrailClient):
 
     """
     Service class for project test cases
     """
-
-    def list_projects(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/projects'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_projects(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/projects'
-        resp, body = self.post(url, json.dumps({'project': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_project(self, uuid, params=None):
-        """
-        :param uuid:
-        :param params:
-        :return:
-        """
-        url = '/project/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_project(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return:
-        """
-        url = '/project/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'project': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_project(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/project/{0}'.format(uuid)
-        return self.delete(url)
@@ -17,163 +17,13 @@
 Tempest service class for QoS test cases
 """
 
-import json
-
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class QosContrailClient(base.BaseContrailClient):
 
     """
     Service class for QoS test cases
     """
-
-    def show_global_qos_config(self, instance_id):
-        """
-        :param instance_id:
-        :return:
-        """
-        url = '/global-qos-config/%s' % instance_id
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_global_qos_config(self, instance_id):
-        """
-        :param instance_id:
-        :return:
-        """
-        url = '/global-qos-config/%s' % instance_id
-        return self.delete(url)
-
-    def update_global_qos_config(self, instance_id, **kwargs):
-        """
-        :param instance_id:
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'global-qos-config': kwargs})
-        url = '/global-qos-config/%s' % instance_id
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def list_global_qos_configs(self):
-        """
-        :return:
-        """
-        url = '/global-qos-configs'
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_global_qos_configs(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'global-qos-config': kwargs})
-        url = '/global-qos-configs'
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_qos_config(self, qos_config_id):
-        """
-        :param qos_config_id:
-        :return:
-        """
-        url = '/qos-config/%s' % qos_config_id
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_qos_config(self, qos_config_id):
-        """
-        :param qos_config_id:
-        :return:
-        """
-        url = '/qos-config/%s' % qos_config_id
-        return self.delete(url)
-
-    def update_qos_config(self, qos_config_id, **kwargs):
-        """
-        :param qos_config_id:
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'qos-config': kwargs})
-        url = '/qos-config/%s' % qos_config_id
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def list_qos_configs(self):
-        """
-        :return:
-        """
-        url = '/qos-configs'
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_qos_configs(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'qos-config': kwargs})
-        url = '/qos-configs'
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_qos_queue(self, qos_queue_id):
-        """
-        :param qos_queue_id:
-        :return:
-        """
-        url = '/qos-queue/%s' % qos_queue_id
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_qos_queue(self, qos_queue_id):
-        """
-        :param qos_queue_id:
-        :return:
-        """
-        url = '/qos-queue/%s' % qos_queue_id
-        return self.delete(url)
-
-    def update_qos_queue(self, qos_queue_id, **kwargs):
-        """
-        :param qos_queue_id:
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'qos-queue': kwargs})
-        url = '/qos-queue/%s' % qos_queue_id
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def list_qos_queues(self):
-        """
-        :return:
-        """
-        url = '/qos-queues'
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_qos_queues(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'qos-queue': kwargs})
-        url = '/qos-queues'
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
@@ -0,0 +1,330 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Registry of the config API resources and the API methods built from it
+
+Every service class gets list, create, show, update, delete and iter
+methods for the resources registered for it here.  They all send their
+requests through base.ResourceClient, so the same code serves every type.
+"""
+
+import inspect
+
+from tungsten_tempest_plugin.services.contrail.json import base
+
+# Operations of the resources returning the response and raw body as a
+# tuple instead of a ResponseBody, as their methods always did
+TUPLE_READS = ('list', 'show', 'delete')
+TUPLE_DELETE = ('delete',)
+
+
+class Resource(object):
+    """Entry of the resource registry
+
+    Its API methods are named list_<plural>, create_<plural>, show_<name>,
+    update_<name>, delete_<name> and iter_<plural>.
+
+    :param resource_type: object type, e.g. 'virtual-network'
+    :param client: name of the service class the methods belong to
+    :param name: name of the type in the method names, by default the type
+                 with underscores
+    :param plural: plural of name, by default name with an 's' appended
+    :param id_name: name of the uuid argument of show, update and delete
+    :param names: dict of operation to name of the methods not following
+                  the scheme
+    :param tuples: operations returning the response and body as a tuple
+    """
+
+    def __init__(self, resource_type, client, name=None, plural=None,
+                 id_name='uuid', names=None, tuples=()):
+        self.resource_type = resource_type
+        self.client = client
+        self.name = name or resource_type.replace('-', '_').lower()
+        self.plural = plural or self.name + 's'
+        self.id_name = id_name
+        self.names = names or {}
+        self.tuples = tuples
+
+    def method_name(self, operation):
+        if operation in self.names:
+            return self.names[operation]
+        if operation in ('list', 'create', 'iter'):
+            return '%s_%s' % (operation, self.plural)
+        return '%s_%s' % (operation, self.name)
+
+    def methods(self):
+        """Return a dict of method name to API method of the resource"""
+        return dict((self.method_name(operation), build(self))
+                    for operation, build in _BUILDERS.items())
+
+
+RESOURCES = (
+    Resource('access-control-list', 'AccessControlClient', id_name='list_id',
+             tuples=TUPLE_READS),
+    Resource('alarm', 'AlarmClient', tuples=TUPLE_DELETE),
+    Resource('alias-ip', 'AliasIPsClient', id_name='ip_id',
+             tuples=TUPLE_READS),
+    Resource('alias-ip-pool', 'AliasIPsClient', id_name='pool_id',
+             tuples=TUPLE_READS),
+    Resource('analytics-node', 'AnalyticsNodeClient', tuples=TUPLE_READS),
+    Resource('api-access-list', 'AccessControlClient', id_name='list_id',
+             tuples=TUPLE_READS),
+    Resource('bgp-as-a-service', 'BGPAsAServiceClient', id_name='bgp_id',
+             tuples=TUPLE_READS),
+    Resource('bgp-router', 'RouterClient', id_name='bgp_router_id'),
+    Resource('config-node', 'ConfigClient', id_name='node_id',
+             tuples=('show', 'delete')),
+    Resource('config-root', 'ConfigClient', id_name='root_id',
+             tuples=('show', 'delete')),
+    Resource('customer-attachment', 'AttachmentsClient',
+             id_name='appliance_id', tuples=TUPLE_READS),
+    Resource('database-node', 'ContrailDatabaseClient', id_name='db_node_id',
+             names={'create': 'create_databse_nodes'}, tuples=TUPLE_READS),
+    Resource('discovery-service-assignment',
+             'DiscoveryServiceAssignmentClient', name='ds_assignment',
+             id_name='assignment_id', tuples=TUPLE_READS),
+    Resource('domain', 'DomainClient', tuples=TUPLE_DELETE),
+    Resource('dsa-rule', 'DSARuleClient', id_name='dns_id',
+             tuples=TUPLE_READS),
+    Resource('floating-ip', 'FloatingIpClient', id_name='floatingip_id'),
+    Resource('floating-ip-pool', 'FloatingIpClient',
+             id_name='floatingip_pool_id'),
+    Resource('forwarding-class', 'ForwardingClassClient', tuples=TUPLE_READS),
+    Resource('global-qos-config', 'QosContrailClient', id_name='instance_id',
+             tuples=TUPLE_DELETE),
+    Resource('global-system-config', 'ConfigClient', id_name='template_id',
+             tuples=TUPLE_READS),
+    Resource('global-vrouter-config', 'RouterClient',
+             id_name='global_vrouter_config_id'),
+    Resource('instance-ip', 'InstanceIPClient'),
+    Resource('interface-route-table', 'RouteClient',
+             id_name='interface_route_id'),
+    Resource('loadbalancer', 'LoadBalancerClient', name='load_balancer',
+             tuples=TUPLE_DELETE),
+    Resource('loadbalancer-healthmonitor', 'LoadBalancerClient',
+             name='lb_healthmonitor', tuples=TUPLE_DELETE),
+    Resource('loadbalancer-listener', 'LoadBalancerClient',
+             name='load_balancer_listener', tuples=TUPLE_DELETE),
+    Resource('loadbalancer-member', 'LoadBalancerClient',
+             name='load_balancer_member', tuples=TUPLE_DELETE),
+    Resource('loadbalancer-pool', 'LoadBalancerClient',
+             name='load_balancer_pool', tuples=TUPLE_DELETE),
+    Resource('logical-interface', 'InterfaceClient',
+             tuples=('list', 'delete')),
+    Resource('logical-router', 'RouterClient', id_name='logical_router_id'),
+    Resource('namespace', 'NamespaceClient', tuples=TUPLE_DELETE),
+    Resource('network-ipam', 'NetworkIpamsClient', id_name='instance_id',
+             tuples=TUPLE_READS),
+    Resource('network-policy', 'NetworkPolicyClient', tuples=TUPLE_DELETE),
+    Resource('physical-interface', 'InterfaceClient',
+             tuples=('list', 'delete')),
+    Resource('physical-router', 'RouterClient', id_name='physical_router_id'),
+    Resource('port-tuple', 'PortTupleClient', tuples=TUPLE_READS),
+    Resource('project', 'ProjectClient', tuples=TUPLE_DELETE),
+    Resource('provider-attachment', 'AttachmentsClient',
+             id_name='appliance_id', tuples=TUPLE_READS),
+    Resource('qos-config', 'QosContrailClient', id_name='qos_config_id',
+             tuples=TUPLE_DELETE),
+    Resource('qos-queue', 'QosContrailClient', id_name='qos_queue_id',
+             tuples=TUPLE_DELETE),
+    Resource('route-aggregate', 'RouteClient', id_name='route_aggr_id'),
+    Resource('route-table', 'RouteClient', id_name='route_id'),
+    Resource('route-target', 'RouteClient', id_name='route_target_id'),
+    Resource('routing-instance', 'RoutingClient', id_name='instance_id',
+             tuples=TUPLE_READS),
+    Resource('routing-policy', 'RoutingPolicyClient', tuples=TUPLE_DELETE),
+    Resource('security-group', 'SecurityGroupClient', id_name='sec_group_id',
+             tuples=TUPLE_READS),
+    Resource('service-appliance', 'ServiceAppliancesClient',
+             id_name='appliance_id', tuples=TUPLE_READS),
+    Resource('service-appliance-set', 'ServiceAppliancesClient',
+             id_name='appliance_id', tuples=TUPLE_READS),
+    Resource('service-health-check', 'ServiceClient', id_name='template_id',
+             tuples=TUPLE_READS),
+    Resource('service-instance', 'ServiceClient', id_name='template_id',
+             tuples=TUPLE_READS),
+    Resource('service-template', 'ServiceClient', id_name='template_id',
+             tuples=TUPLE_READS),
+    Resource('subnet', 'SubnetClient', tuples=TUPLE_DELETE),
+    Resource('virtual-DNS', 'VirtualDNSClient', plural='virtual_dns',
+             id_name='dns_id', tuples=TUPLE_READS),
+    Resource('virtual-DNS-record', 'VirtualDNSClient', id_name='dns_record_id',
+             tuples=TUPLE_READS),
+    Resource('virtual-ip', 'VirtualIPClient', tuples=TUPLE_DELETE),
+    Resource('virtual-machine-interface', 'VmContrailClient',
+             id_name='instance_id',
+             names={'create': 'create_vm_interfaces',
+                    'update': 'update_vm_interface',
+                    'delete': 'delete_vm_interface'},
+             tuples=TUPLE_DELETE),
+    Resource('virtual-network', 'VirtualNetworkClient', tuples=TUPLE_READS),
+    Resource('virtual-router', 'RouterClient', id_name='vrouter_id'),
+)
+
+
+def _result(resource, operation, resp, body):
+    if operation in resource.tuples:
+        return resp, body
+    return base.ResponseBody(resp, body)
+
+
+def _signature(resource, *parameters):
+    """Return the signature of a method taking the uuid first
+
+    The uuid argument is named id_name, as it was in the methods written
+    by hand, so the generated methods take it by that keyword and show it
+    to inspect and help().
+
+    :param parameters: inspect.Parameter objects following the uuid
+    """
+    return inspect.Signature([
+        inspect.Parameter('self', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        inspect.Parameter(resource.id_name,
+                          inspect.Parameter.POSITIONAL_OR_KEYWORD),
+    ] + list(parameters))
+
+
+def _var_keyword(name):
+    return inspect.Parameter(name, inspect.Parameter.VAR_KEYWORD)
+
+
+def _list_method(resource):
+    def method(self, params=None, **kwargs):
+        resp, body = self.resource(resource.resource_type).list(
+            params, **kwargs)
+        return _result(resource, 'list', resp, body)
+    method.__doc__ = """List the %s objects
+
+        :param params: dict of raw query parameters
+        :param kwargs: list options, see BaseContrailClient.list_query
+        """ % resource.resource_type
+    return method
+
+
+def _create_method(resource):
+    def method(self, **kwargs):
+        return self.resource(resource.resource_type).create(kwargs)[1]
+    method.__doc__ = """Create a %s object
+
+        :param kwargs: attributes of the object
+        """ % resource.resource_type
+    return method
+
+
+def _show_method(resource):
+    signature = _signature(
+        resource,
+        inspect.Parameter('params', inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                          default=None),
+        _var_keyword('fields'))
+
+    def method(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs).arguments
+        params = dict(arguments.get('params') or {},
+                      **arguments.get('fields', {}))
+        resp, body = arguments['self'].resource(resource.resource_type).show(
+            arguments[resource.id_name], params)
+        return _result(resource, 'show', resp, body)
+    method.__signature__ = signature
+    method.__doc__ = """Show a %s object
+
+        :param %s: uuid of the object
+        :param params: dict of query parameters, e.g. {'fields': ...}
+        :param fields: further query parameters
+        """ % (resource.resource_type, resource.id_name)
+    return method
+
+
+def _update_method(resource):
+    signature = _signature(resource, _var_keyword('kwargs'))
+
+    def method(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs).arguments
+        resp, body = arguments['self'].resource(
+            resource.resource_type).update(arguments[resource.id_name],
+                                           arguments.get('kwargs', {}))
+        return _result(resource, 'update', resp, body)
+    method.__signature__ = signature
+    method.__doc__ = """Update a %s object
+
+        :param %s: uuid of the object
+        :param kwargs: attributes to update
+        """ % (resource.resource_type, resource.id_name)
+    return method
+
+
+def _delete_method(resource):
+    signature = _signature(resource)
+
+    def method(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs).arguments
+        resp, body = arguments['self'].resource(
+            resource.resource_type).delete(arguments[resource.id_name])
+        return _result(resource, 'delete', resp, body)
+    method.__signature__ = signature
+    # Lets deferred deletes be queued by type and uuid rather than client
+    method.resource_type = resource.resource_type
+    method.__doc__ = """Delete a %s object
+
+        :param %s: uuid of the object
+        """ % (resource.resource_type, resource.id_name)
+    return method
+
+
+def _iter_method(resource):
+    def method(self, page_limit=base.DEFAULT_PAGE_LIMIT, params=None,
+               **kwargs):
+        return self.resource(resource.resource_type).iter(
+            page_limit, params, **kwargs)
+    method.__doc__ = """Iterate over the %s objects page by page
+
+        :param page_limit: number of objects requested per page
+        :param params: additional query parameters of the list call
+        :param kwargs: list options, see BaseContrailClient.list_query
+        :return: generator of object dicts
+        """ % resource.resource_type
+    return method
+
+
+_BUILDERS = {
+    'list': _list_method,
+    'create': _create_method,
+    'show': _show_method,
+    'update': _update_method,
+    'delete': _delete_method,
+    'iter': _iter_method,
+}
+
+
+def resource_methods(client_class):
+    """Add the API methods of its registered resources to a service class
+
+    Methods the class defines itself are kept.  The added ones are named
+    as if they were defined in the class.
+
+    :param client_class: subclass of base.BaseContrailClient
+    :return: client_class
+    """
+    for resource in RESOURCES:
+        if resource.client != client_class.__name__:
+            continue
+        for name, method in resource.methods().items():
+            if name not in vars(client_class):
+                method.__name__ = name
+                method.__qualname__ = '%s.%s' % (client_class.__name__, name)
+                method.__module__ = client_class.__module__
+                setattr(client_class, name, method)
+    return client_class
@@ -17,58 +17,13 @@
 Tempest service class for security group test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class SecurityGroupClient(base.BaseContrailClient):
 
     """
     Service class for security group test cases
     """
-
-    def list_security_groups(self):
-        """
-        :return:
-        """
-        url = '/security-groups'
-        return self.get(url)
-
-    def show_security_group(self, sec_group_id):
-        """
-        :param sec_group_id:
-        :return:
-        """
-        url = '/security-group/%s' % sec_group_id
-        return self.get(url)
-
-    def create_security_groups(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'security-group': kwargs})
-        url = '/security-groups'
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_security_group(self, sec_group_id, **kwargs):
-        """
-        :param sec_group_id:
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'security-group': kwargs})
-        url = '/security-group/%s' % sec_group_id
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_security_group(self, sec_group_id):
-        """
-        :param sec_group_id:
-        :return:
-        """
-        url = '/security-group/%s' % sec_group_id
-        return self.delete(url)
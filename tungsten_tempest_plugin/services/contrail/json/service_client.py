@@ -17,163 +17,13 @@
 Tempest service class for service test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class ServiceClient(base.BaseContrailClient):
 
     """
     Service class for service client test cases
     """
-
-    def list_service_templates(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/service-templates'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_service_templates(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/service-templates'
-        post_body = json.dumps({'service-template': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_service_template(self, template_id):
-        """
-        :param template_id:
-        :return:
-        """
-        url = '/service-template/%s' % str(template_id)
-        return self.get(url)
-
-    def delete_service_template(self, template_id):
-        """
-        :param template_id:
-        :return:
-        """
-        url = '/service-template/%s' % str(template_id)
-        return self.delete(url)
-
-    def update_service_template(self, template_id, **kwargs):
-        """
-        :param template_id:
-        :param kwargs:
-        :return:
-        """
-        url = '/service-template/%s' % str(template_id)
-        put_data = {'service-template': kwargs}
-        req_put_data = json.dumps(put_data)
-        resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def list_service_health_checks(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/service-health-checks'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def create_service_health_checks(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/service-health-checks'
-        post_body = json.dumps({'service-health-check': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_service_health_check(self, template_id):
-        """
-        :param template_id:
-        :return:
-        """
-        url = '/service-health-check/%s' % str(template_id)
-        return self.get(url)
-
-    def delete_service_health_check(self, template_id):
-        """
-        :param template_id:
-        :return:
-        """
-        url = '/service-health-check/%s' % str(template_id)
-        return self.delete(url)
-
-    def update_service_health_check(self, template_id, **kwargs):
-        """
-        :param template_id:
-        :param kwargs:
-        :return:
-        """
-        url = '/service-health-check/%s' % str(template_id)
-        put_data = {'service-health-check': kwargs}
-        req_put_data = json.dumps(put_data)
-        resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_service_instances(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/service-instances'
-        post_body = json.dumps({'service-instance': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_service_instance(self, template_id):
-        """
-        :param template_id:
-        :return:
-        """
-        url = '/service-instance/%s' % str(template_id)
-        return self.get(url)
-
-    def delete_service_instance(self, template_id):
-        """
-        :param template_id:
-        :return:
-        """
-        url = '/service-instance/%s' % str(template_id)
-        return self.delete(url)
-
-    def list_service_instances(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/service-instances'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        return self.get(url)
-
-    def update_service_instance(self, template_id, **kwargs):
-        """
-        :param template_id:
-        :param kwargs:
-        :return:
-        """
-        url = '/service-instance/%s' % str(template_id)
-        put_data = {'service-instance': kwargs}
-        req_put_data = json.dumps(put_data)
-        resp, body = self.put(url, req_put_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
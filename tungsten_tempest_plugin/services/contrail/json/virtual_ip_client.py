@@ -17,67 +17,13 @@
 Tempest service class for virtual ip test cases
 """
 
-import json
-from six.moves.urllib import parse as urllib
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class VirtualIPClient(base.BaseContrailClient):
 
     """
     Service class for virtual ip test cases
     """
-
-    def list_virtual_ips(self, params=None):
-        """
-        :param params:
-        :return:
-        """
-        url = '/virtual-ips'
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_virtual_ips(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/virtual-ips'
-        resp, body = self.post(url, json.dumps({'virtual-ip': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_virtual_ip(self, uuid, params=None):
-        """
-        :param uuid:
-        :param params:
-        :return:
-        """
-        url = '/virtual-ip/{0}'.format(uuid)
-        if params:
-            url += '?%s' % urllib.urlencode(params)
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_virtual_ip(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return:
-        """
-        url = '/virtual-ip/{0}'.format(uuid)
-        resp, body = self.put(url, json.dumps({'virtual-ip': kwargs}))
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_virtual_ip(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/virtual-ip/{0}'.format(uuid)
-        return self.delete(url)
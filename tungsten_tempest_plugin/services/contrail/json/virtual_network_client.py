@@ -17,59 +17,13 @@
 Tempest service class for virtual network test cases
 """
 
-from oslo_serialization import jsonutils as json
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class VirtualNetworkClient(base.BaseContrailClient):
 
     """
     Service class for virtual n/w test cases
     """
-
-    def list_virtual_networks(self):
-        """
-        :return:
-        """
-        url = '/virtual-networks'
-        return self.get(url)
-
-    def create_virtual_networks(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        url = '/virtual-networks'
-        post_body = json.dumps({'virtual-network': kwargs})
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def update_virtual_network(self, uuid, **kwargs):
-        """
-        :param uuid:
-        :param kwargs:
-        :return:
-        """
-        url = '/virtual-network/%s' % uuid
-        post_data = {'virtual-network': kwargs}
-        req_post_data = json.dumps(post_data)
-        resp, body = self.put(url, req_post_data)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_virtual_network(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/virtual-network/%s' % uuid
-        return self.delete(url)
-
-    def show_virtual_network(self, uuid):
-        """
-        :param uuid:
-        :return:
-        """
-        url = '/virtual-network/%s' % uuid
-        return self.get(url)
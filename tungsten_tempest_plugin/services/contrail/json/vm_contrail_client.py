@@ -17,62 +17,13 @@
 Tempest service class for virtual machine test cases
 """
 
-import json
 from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
 
 
+@resources.resource_methods
 class VmContrailClient(base.BaseContrailClient):
 
     """
     Service class for vm test cases
     """
-
-    def list_virtual_machine_interfaces(self):
-        """
-        :return:
-        """
-        url = '/virtual-machine-interfaces'
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def create_vm_interfaces(self, **kwargs):
-        """
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'virtual-machine-interface': kwargs})
-        url = '/virtual-machine-interfaces'
-        resp, body = self.post(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def show_virtual_machine_interface(self, instance_id):
-        """
-        :param instance_id:
-        :return:
-        """
-        url = '/virtual-machine-interface/%s' % instance_id
-        resp, body = self.get(url)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
-
-    def delete_vm_interface(self, instance_id):
-        """
-        :param instance_id:
-        :return:
-        """
-        url = '/virtual-machine-interface/%s' % instance_id
-        return self.delete(url)
-
-    def update_vm_interface(self, instance_id, **kwargs):
-        """
-        :param instance_id:
-        :param kwargs:
-        :return:
-        """
-        post_body = json.dumps({'virtual-machine-interface': kwargs})
-        url = '/virtual-machine-interface/%s' % instance_id
-        resp, body = self.put(url, post_body)
-        body = json.loads(body)
-        return base.ResponseBody(resp, body)
@@ -0,0 +1,34 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import unittest
+
+# Packages left out when tempest discovers the plugin's tests; the unit
+# tests run on their own, without a deployment
+EXCLUDED_PACKAGES = ('unit',)
+
+
+def load_tests(loader, tests, pattern):
+    suite = unittest.TestSuite()
+    test_dir = os.path.dirname(os.path.abspath(__file__))
+    top_dir = os.path.dirname(os.path.dirname(test_dir))
+    for name in sorted(os.listdir(test_dir)):
+        package_dir = os.path.join(test_dir, name)
+        if (name not in EXCLUDED_PACKAGES
+                and os.path.isfile(os.path.join(package_dir, '__init__.py'))):
+            suite.addTests(loader.discover(package_dir, pattern=pattern,
+                                           top_level_dir=top_dir))
+    return suite
@@ -17,7 +17,16 @@
 Base class for contrail testing against RBAC rules
 """
 
+import atexit
+import collections
+from concurrent import futures
+import functools
+import os
+import threading
+import time
+
 from oslo_log import log as logging
+import six
 
 from tungsten_tempest_plugin.services.contrail.json.access_control_client \
     import AccessControlClient
@@ -90,310 +99,999 @@ from tungsten_tempest_plugin.services.contrail.json.\
 from tungsten_tempest_plugin.services.contrail.json.vm_contrail_client import \
     VmContrailClient
 
+from tungsten_tempest_plugin import durations
+from tungsten_tempest_plugin import rbac_report
+from tungsten_tempest_plugin.services.contrail.json import base
+
+from patrole_tempest_plugin import policy_authority
 from patrole_tempest_plugin import rbac_utils
+from patrole_tempest_plugin import requirements_authority
 
+from tempest import clients
+from tempest.common import credentials_factory
 from tempest import config
 from tempest import test
 
+from tempest.lib.common.utils import data_utils
 from tempest.lib import exceptions
 
 CONF = config.CONF
 LOG = logging.getLogger(__name__)
+# Logger patrole reports the outcome of every RBAC test to
+RBACLOG = logging.getLogger('rbac_reporting')
 
+# Attribute name on ContrailTest -> Contrail service client class
+CONTRAIL_CLIENTS = {
+    'access_control_client': AccessControlClient,
+    'alarm_client': AlarmClient,
+    'alias_ip_client': AliasIPsClient,
+    'analytics_node_client': AnalyticsNodeClient,
+    'attachments_client': AttachmentsClient,
+    'bgp_as_a_service_client': BGPAsAServiceClient,
+    'config_client': ConfigClient,
+    'db_client': ContrailDatabaseClient,
+    'domain_client': DomainClient,
+    'dsa_client': DiscoveryServiceAssignmentClient,
+    'dsa_rule_client': DSARuleClient,
+    'fip_client': FloatingIpClient,
+    'forwarding_class_client': ForwardingClassClient,
+    'fq_client': FqnameIdClient,
+    'iip_client': InstanceIPClient,
+    'interface_client': InterfaceClient,
+    'load_balancer_client': LoadBalancerClient,
+    'namespace_client': NamespaceClient,
+    'network_ipams_client': NetworkIpamsClient,
+    'network_policy_client': NetworkPolicyClient,
+    'port_tuple_client': PortTupleClient,
+    'project_client': ProjectClient,
+    'qos_client': QosContrailClient,
+    'route_client': RouteClient,
+    'router_client': RouterClient,
+    'routing_client': RoutingClient,
+    'routing_policy_client': RoutingPolicyClient,
+    'security_group_client': SecurityGroupClient,
+    'service_appliances_client': ServiceAppliancesClient,
+    'service_client': ServiceClient,
+    'subnet_client': SubnetClient,
+    'virtual_dns_client': VirtualDNSClient,
+    'virtual_ip_client': VirtualIPClient,
+    'vm_client': VmContrailClient,
+    'vn_client': VirtualNetworkClient,
+}
 
-class BaseContrailTest(test.BaseTestCase):
-    """Base class for Contrail tests."""
+# Client class -> {constructor argument: [sdn] option}
+_CLIENT_OPTIONS = {
+    FqnameIdClient: {'cache_size': 'fqname_cache_size',
+                     'cache_ttl': 'fqname_cache_ttl'},
+}
+
+# (project id, client class, credentials) -> client
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _forget_clients(project_id):
+    """Drop the clients built with credentials of the project"""
+    with _CLIENTS_LOCK:
+        for key in [key for key in _CLIENTS if key[0] == project_id]:
+            del _CLIENTS[key]
+
+
+class _LazyClient(object):
+    """Class attribute that builds its service client on first access
+
+    Clients are shared by every test class running with the same primary
+    credentials, so a class only pays for constructing the clients it
+    actually uses.  Those of dynamic credentials are dropped with the
+    credentials, by clear_credentials.
+    """
+
+    def __init__(self, client_class):
+        self.client_class = client_class
+
+    def __get__(self, instance, owner):
+        auth_provider = (getattr(_ROLE_CONTEXT, 'auth_provider', None)
+                         or owner.os_primary.auth_provider)
+        return _client(self.client_class, auth_provider)
+
+
+def _client(client_class, auth_provider):
+    """Return the shared service client of the class for the credentials"""
+    credentials = auth_provider.credentials
+    key = (credentials.tenant_id, client_class,
+           tuple(credentials.get(attr) for attr in credentials.ATTRIBUTES))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            options = _CLIENT_OPTIONS.get(client_class, {})
+            client = client_class(
+                auth_provider,
+                CONF.sdn.catalog_type,
+                CONF.identity.region,
+                CONF.sdn.endpoint_type,
+                disable_ssl_certificate_validation=(
+                    CONF.identity.disable_ssl_certificate_validation),
+                ca_certs=CONF.identity.ca_certificates_file,
+                pool_size=CONF.sdn.connection_pool_size,
+                show_cache_size=CONF.sdn.show_cache_size,
+                compression=CONF.sdn.http_compression,
+                transport=CONF.sdn.transport,
+                cassette_path=CONF.sdn.cassette_path,
+                **dict((arg, getattr(CONF.sdn, opt))
+                       for arg, opt in options.items()))
+            _CLIENTS[key] = client
+    # rbac_utils refreshes the token of the running class' provider when
+    # it overrides roles, so make sure the shared client follows it.
+    client.auth_provider = auth_provider
+    return client
+
+
+# Seconds between the rounds of retrying deletes that answered 409
+CLEANUP_RETRY_INTERVAL = 1
+
+# uuid -> (parent uuid, uuids of referred objects, fq_name) of the objects
+# created through the Contrail clients and not deleted yet
+_CREATED = {}
+# fq_name -> uuid of the same objects, to resolve references given by name
+_CREATED_NAMES = {}
+_CREATED_LOCK = threading.Lock()
+
+
+def _track_create(resource_type, obj, body):
+    with _CREATED_LOCK:
+        refs = set()
+        for key, value in body.items():
+            if key.endswith('_refs'):
+                for ref in value or []:
+                    ref_uuid = ref.get('uuid') or _CREATED_NAMES.get(
+                        tuple(ref.get('to') or ()))
+                    if ref_uuid:
+                        refs.add(ref_uuid)
+        fq_name = tuple(obj.get('fq_name') or ())
+        _CREATED[obj['uuid']] = (obj.get('parent_uuid'), refs, fq_name)
+        if fq_name:
+            _CREATED_NAMES[fq_name] = obj['uuid']
+
+
+def _track_delete(resource_type, uuid):
+    with _CREATED_LOCK:
+        created = _CREATED.pop(uuid, None)
+        # Unless the name was taken by an object created since
+        if created and _CREATED_NAMES.get(created[2]) == uuid:
+            del _CREATED_NAMES[created[2]]
+
+
+base.register_create_observer(_track_create)
+base.register_delete_observer(_track_delete)
+
+
+class CleanupEngine(object):
+    """Deferred resource deletes run concurrently in dependency order
+
+    Deletes are queued with add() and carried out by run().  An object is
+    only deleted after every queued object that has it as parent or refers
+    to it, so run() groups the deletes into dependency levels and deletes
+    the objects of a level concurrently.  The dependencies are known for
+    the objects created through the Contrail clients; deletes of any other
+    object are run last.
+
+    Deletes that answer 404 are taken as done, those answering 409 are
+    retried after the other levels, and what keeps failing is reported as
+    leaked.
+    """
+
+    def __init__(self, max_workers=None, retries=0):
+        self.max_workers = max_workers or base.DEFAULT_BULK_WORKERS
+        self.retries = retries
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def add(self, delete_callable, *args, **kwargs):
+        with self._lock:
+            self._pending.append((delete_callable, args, kwargs))
+
+    @staticmethod
+    def _describe(delete):
+        delete_callable, args, kwargs = delete
+        return '%s(%s)' % (getattr(delete_callable, '__name__',
+                                   delete_callable),
+                           ', '.join([repr(arg) for arg in args]
+                                     + ['%s=%r' % item
+                                        for item in kwargs.items()]))
+
+    @staticmethod
+    def _levels(deletes, created):
+        """Return lists of deletes, the first ones to run first"""
+        uuids = []
+        for delete_callable, args, kwargs in deletes:
+            uuids.append(next((arg for arg in args
+                               if isinstance(arg, six.string_types)
+                               and arg in created), None))
+        index = dict((uuid, i) for i, uuid in enumerate(uuids) if uuid)
+        # i -> deletes that have to run before delete i
+        before = collections.defaultdict(set)
+        for i, uuid in enumerate(uuids):
+            if uuid:
+                parent, refs, _ = created[uuid]
+                for dependency in refs.union([parent]):
+                    if dependency in index and dependency != uuid:
+                        before[index[dependency]].add(i)
+
+        levels = {}
+
+        def level(i, path):
+            if i not in levels:
+                # Break dependency cycles rather than loop
+                levels[i] = 1 + max([level(j, path | {i})
+                                     for j in before[i] if j not in path]
+                                    or [-1])
+            return levels[i]
+
+        last = 0
+        for i, uuid in enumerate(uuids):
+            if uuid:
+                last = max(last, level(i, frozenset()))
+        grouped = collections.defaultdict(list)
+        for i, delete in enumerate(deletes):
+            grouped[levels[i] if uuids[i] else last + 1].append(delete)
+        return [grouped[key] for key in sorted(grouped)]
+
+    @staticmethod
+    def _delete(delete):
+        delete_callable, args, kwargs = delete
+        try:
+            delete_callable(*args, **kwargs)
+        # if resource is not found, this means it was deleted in the test
+        except exceptions.NotFound:
+            pass
+
+    def run(self):
+        """Carry out the queued deletes
+
+        :return: list of (description, exception) of the leaked deletes
+        """
+        with self._lock:
+            deletes, self._pending = self._pending, []
+        if not deletes:
+            return []
+        with _CREATED_LOCK:
+            created = dict(_CREATED)
+        leaked = []
+        with futures.ThreadPoolExecutor(self.max_workers) as executor:
+            for attempt in range(self.retries + 1):
+                conflicts = []
+                for level in self._levels(deletes, created):
+                    for delete, future in [
+                            (delete, executor.submit(self._delete, delete))
+                            for delete in level]:
+                        error = future.exception()
+                        if isinstance(error, exceptions.Conflict):
+                            conflicts.append((delete, error))
+                        elif error is not None:
+                            leaked.append((delete, error))
+                if not conflicts:
+                    break
+                if attempt < self.retries:
+                    time.sleep(CLEANUP_RETRY_INTERVAL)
+                    deletes = [delete for delete, _ in conflicts]
+            else:
+                leaked.extend(conflicts)
+        leaked = [(self._describe(delete), error)
+                  for delete, error in leaked]
+        for description, error in leaked:
+            LOG.warning("Leaked resource, %s failed: %s", description, error)
+        return leaked
+
+
+class WorkerFixtures(object):
+    """Objects shared by the test classes run by one worker process
+
+    A fixture is created by the first class acquiring its key and handed to
+    every later one, which counts as a reference until the class releases
+    it.  Unreferenced fixtures are kept for the next class and only deleted
+    by delete_all, when the worker exits.
+
+    The reset hook given to acquire() brings a reused fixture back to a
+    known state; when it raises NotFound, e.g. because a test deleted the
+    fixture, the fixture is created again.
+    """
+
+    def __init__(self):
+        # key -> [object, resource type, reference count]
+        self._fixtures = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._fixtures)
+
+    def acquire(self, key, resource_type, create, reset=None):
+        """Return the fixture stored under key, creating it if needed
+
+        :param key: hashable identifying the fixture
+        :param resource_type: Contrail type of the object, e.g. 'project'
+        :param create: callable creating the object and returning it
+        :param reset: callable taking the object, called when reused
+        :return: dict of the object as returned by create
+        """
+        with self._lock:
+            fixture = self._fixtures.get(key)
+            if fixture is not None and reset is not None:
+                try:
+                    reset(fixture[0])
+                except exceptions.NotFound:
+                    LOG.warning("Shared %s %s is gone, creating it again",
+                                resource_type, fixture[0]['uuid'])
+                    del self._fixtures[key]
+                    fixture = None
+            if fixture is None:
+                fixture = self._fixtures[key] = [create(), resource_type, 0]
+            fixture[2] += 1
+            return fixture[0]
+
+    def release(self, key):
+        with self._lock:
+            self._fixtures[key][2] -= 1
+
+    def refcount(self, key):
+        with self._lock:
+            fixture = self._fixtures.get(key)
+            return fixture[2] if fixture else 0
+
+    def delete_all(self, client):
+        """Delete the fixtures, the most recently created first
+
+        :param client: Contrail client used to delete the objects
+        """
+        with self._lock:
+            while self._fixtures:
+                key, (obj, resource_type, refcount) = \
+                    self._fixtures.popitem()
+                if refcount:
+                    LOG.warning("Deleting shared %s %s still used by %d "
+                                "test classes", resource_type, obj['uuid'],
+                                refcount)
+                try:
+                    client.delete_resource(resource_type, obj['uuid'])
+                except exceptions.NotFound:
+                    pass
+                except Exception as e:
+                    LOG.warning("Leaked shared %s %s: %s", resource_type,
+                                obj['uuid'], e)
+
+
+WORKER_FIXTURES = WorkerFixtures()
+
+
+@atexit.register
+def _delete_worker_fixtures():
+    if not len(WORKER_FIXTURES):
+        return
+    # The credentials of the classes that created the fixtures are gone by
+    # now, so delete them with the configured admin credentials
+    try:
+        manager = clients.Manager(
+            credentials_factory.get_configured_admin_credentials())
+        client = base.BaseContrailClient(
+            manager.auth_provider,
+            CONF.sdn.catalog_type,
+            CONF.identity.region,
+            CONF.sdn.endpoint_type,
+            disable_ssl_certificate_validation=(
+                CONF.identity.disable_ssl_certificate_validation),
+            ca_certs=CONF.identity.ca_certificates_file)
+    except Exception:
+        LOG.exception("Cannot delete the %d shared fixtures of the worker",
+                      len(WORKER_FIXTURES))
+        return
+    WORKER_FIXTURES.delete_all(client)
+
+
+# (user id, project id) -> ids of the roles the user has on the project, as
+# left by the last role switch of this process
+_ROLE_ASSIGNMENTS = {}
+# Role name -> role id
+_ROLE_IDS = {}
+_ROLES_LOCK = threading.RLock()
+
+
+def _role_ids(roles_client, names):
+    """Return the ids of the roles named"""
+    with _ROLES_LOCK:
+        if not all(name in _ROLE_IDS for name in names):
+            _ROLE_IDS.update((role['name'], role['id'])
+                             for role in roles_client.list_roles()['roles'])
+        return frozenset(_ROLE_IDS[name] for name in names)
+
+
+def _forget_role_assignment(credentials):
+    """Drop what is remembered of the roles of a user on its project
+
+    Needed whenever the roles were changed by anything but a RoleSwitcher,
+    e.g. by patrole's own _override_role.
+    """
+    with _ROLES_LOCK:
+        _ROLE_ASSIGNMENTS.pop((credentials.user_id, credentials.tenant_id),
+                              None)
+
+
+class RoleSwitcher(object):
+    """Switch the roles of the primary user only when requests need it
+
+    patrole's RbacUtils replaces the role assignment of the primary user and
+    fetches a new token when entering override_role, and does so again
+    when leaving it.  Here leaving override_role only records that the
+    admin role is wanted again; the switch is made before the next request
+    sent with the primary credentials.  Tests entering override_role with
+    no request in between keep the assignment and the token they have.
+
+    The assignments made are remembered per user and project, so switching
+    needs no listing of the user's roles, and the token is only replaced
+    when the role set changes.  Tokens are not cached per role set:
+    Keystone revokes the tokens of a user when one of its roles is removed,
+    so a token cannot outlive a switch.
+
+    :param test_cls: test class whose primary user gets its roles switched
+    """
+
+    def __init__(self, test_cls):
+        self.roles_client = test_cls.os_admin.roles_v3_client
+        self.auth_provider = test_cls.os_primary.auth_provider
+        credentials = test_cls.os_primary.credentials
+        self.key = (credentials.user_id, credentials.tenant_id)
+        self._wanted = None
+
+        auth_request = self.auth_provider.auth_request
+
+        def switching_auth_request(*args, **kwargs):
+            self.apply()
+            return auth_request(*args, **kwargs)
+
+        self.auth_provider.auth_request = switching_auth_request
+
+    def override_role(self, test_obj, toggle_rbac_role=False):
+        """Replacement of RbacUtils._override_role
+
+        :param test_obj: test class or test object, unused
+        :param toggle_rbac_role: switch to ``[patrole] rbac_test_roles`` if
+                                 True, to ``[identity] admin_role`` otherwise
+        """
+        if toggle_rbac_role:
+            self.switch(rbac_report.test_roles())
+        else:
+            self._wanted = [CONF.identity.admin_role]
+
+    def switch(self, role_names):
+        """Give the primary user exactly the roles named, right away"""
+        self._wanted = list(role_names)
+        self.apply()
+        rbac_report.roles_switched(role_names)
+
+    def apply(self):
+        """Give the primary user the wanted roles if it lacks them"""
+        if self._wanted is None:
+            return
+        with _ROLES_LOCK:
+            wanted = _role_ids(self.roles_client, self._wanted)
+            current = _ROLE_ASSIGNMENTS.get(self.key)
+            if current == wanted:
+                return
+            project_id, user_id = self.key[1], self.key[0]
+            # Forget the assignment until it is known again
+            _ROLE_ASSIGNMENTS.pop(self.key, None)
+            if current is None:
+                current = frozenset(
+                    role['id'] for role in
+                    self.roles_client.list_user_roles_on_project(
+                        project_id, user_id)['roles'])
+            for role_id in wanted - current:
+                self.roles_client.create_user_role_on_project(
+                    project_id, user_id, role_id)
+            for role_id in current - wanted:
+                self.roles_client.delete_role_from_user_on_project(
+                    project_id, user_id, role_id)
+            _ROLE_ASSIGNMENTS[self.key] = wanted
+            if current != wanted:
+                LOG.debug("Switched roles of user %s to %s", user_id,
+                          self._wanted)
+                self.auth_provider.clear_auth()
+                # Fernet tokens are not subsecond aware, so make sure the new
+                # token is issued after the revocation of the old one
+                if current - wanted:
+                    time.sleep(1)
+                self.auth_provider.set_auth()
+
+
+# Holds the auth provider the Contrail clients of the thread use instead of
+# the primary one, while a test runs with pooled role credentials
+_ROLE_CONTEXT = threading.local()
+
+
+class RoleCredentialPool(object):
+    """Users of the worker, one per tested set of roles
+
+    Rather than changing the roles of the primary user, override_role has
+    the Contrail clients authenticate as a user of the pool holding the
+    tested roles on the primary user's project.  Each user is created once
+    per worker and given its roles once per project, so switching roles
+    needs no Keystone write, and tests running concurrently can each use
+    roles of their own.
+    """
+
+    def __init__(self):
+        # role names -> (user name, user id, password)
+        self._users = {}
+        # (role names, project id) -> auth provider
+        self._providers = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._users)
+
+    def auth_provider(self, test_cls, role_names):
+        """Return an auth provider of the pool user holding the roles
+
+        :param test_cls: test class whose primary project the roles are on
+        :param role_names: names of the roles
+        """
+        roles = tuple(sorted(role_names))
+        credentials = test_cls.os_primary.credentials
+        project_id = credentials.tenant_id
+        with self._lock:
+            provider = self._providers.get((roles, project_id))
+            if provider is not None:
+                return provider
+            user = self._users.get(roles)
+            if user is None:
+                name = data_utils.rand_name('rbac-' + '-'.join(roles))
+                password = data_utils.rand_password()
+                user_id = test_cls.os_admin.users_v3_client.create_user(
+                    name=name, password=password,
+                    domain_id=credentials.user_domain_id)['user']['id']
+                user = self._users[roles] = (name, user_id, password)
+            roles_client = test_cls.os_admin.roles_v3_client
+            for role_id in _role_ids(roles_client, roles):
+                roles_client.create_user_role_on_project(
+                    project_id, user[1], role_id)
+            provider = self._providers[(roles, project_id)] = \
+                clients.get_auth_provider(
+                    credentials_factory.get_credentials(
+                        username=user[0], password=user[2],
+                        user_domain_id=credentials.user_domain_id,
+                        project_id=project_id,
+                        project_domain_id=credentials.project_domain_id),
+                    pre_auth=True)
+            return provider
+
+    def override_role(self, test_cls, test_obj, toggle_rbac_role=False):
+        """Replacement of RbacUtils._override_role
+
+        :param test_cls: test class the roles are tested by
+        :param test_obj: test class or test object, unused
+        :param toggle_rbac_role: use ``[patrole] rbac_test_roles`` if True,
+                                 the primary credentials otherwise
+        """
+        _ROLE_CONTEXT.auth_provider = None
+        if toggle_rbac_role:
+            roles = rbac_report.test_roles()
+            _ROLE_CONTEXT.auth_provider = self.auth_provider(test_cls, roles)
+            rbac_report.roles_switched(roles)
+
+    def forget_project(self, project_id):
+        """Drop the auth providers of the pool users on the project"""
+        with self._lock:
+            for key in [key for key in self._providers
+                        if key[1] == project_id]:
+                del self._providers[key]
+
+    def delete_all(self, users_client):
+        with self._lock:
+            while self._users:
+                _, (name, user_id, _) = self._users.popitem()
+                try:
+                    users_client.delete_user(user_id)
+                except exceptions.NotFound:
+                    pass
+                except Exception as e:
+                    LOG.warning("Leaked pooled user %s: %s", name, e)
+            self._providers.clear()
+
+
+ROLE_CREDENTIALS = RoleCredentialPool()
+
+
+@atexit.register
+def _delete_role_credentials():
+    if not len(ROLE_CREDENTIALS):
+        return
+    try:
+        manager = clients.Manager(
+            credentials_factory.get_configured_admin_credentials())
+    except Exception:
+        LOG.exception("Cannot delete the %d pooled users of the worker",
+                      len(ROLE_CREDENTIALS))
+        return
+    ROLE_CREDENTIALS.delete_all(manager.users_v3_client)
+
+
+# Prefix of the rule-by-role table written by each worker
+MATRIX_REPORT_NAME = 'rbac_matrix'
+
+# (rule, role) -> (expected, actual) outcome of the role matrix checks
+_MATRIX = {}
+_MATRIX_LOCK = threading.Lock()
+
+
+def _allowed(authority, rule, role):
+    """Return whether the authority allows the rule to the role
+
+    patrole releases with the ``rbac_test_roles`` option take the list of
+    roles in allowed(), the older ones, RbacUtils among them, one role.
+    """
+    if getattr(CONF.patrole, 'rbac_test_roles', None) is None:
+        return authority.allowed(rule, role)
+    return authority.allowed(rule, [role])
+
+
+def format_matrix(results):
+    """Return a rule-by-role table of role matrix outcomes
+
+    :param results: dict of (rule, role) to (expected, actual) outcome
+    :return: text table, unexpected outcomes are marked with a '!'
+    """
+    roles = sorted(set(role for _, role in results))
+    rows = [['rule'] + roles]
+    for rule in sorted(set(rule for rule, _ in results)):
+        row = [rule]
+        for role in roles:
+            expected, actual = results.get((rule, role), (None, '-'))
+            row.append(actual if expected in (None, actual) else
+                       '%s!' % actual)
+        rows.append(row)
+    widths = [max(len(row[i]) for row in rows) for i in range(len(roles) + 1)]
+    return '\n'.join('  '.join(cell.ljust(width)
+                               for cell, width in zip(row, widths)).rstrip()
+                     for row in rows)
+
+
+@atexit.register
+def _write_matrix():
+    if _MATRIX:
+        path = os.path.join(
+            os.path.abspath(CONF.tungsten_log.report_log_path),
+            '%s.%d.txt' % (MATRIX_REPORT_NAME, os.getpid()))
+        with open(path, 'w') as f:
+            f.write(format_matrix(_MATRIX) + '\n')
+
+
+class ResourceGraph(object):
+    """Contrail objects built from a declarative spec of their dependencies
+
+    ``spec`` maps a key to the description of one object::
+
+        {'ipam': {'type': 'network-ipam',
+                  'parent': ('project', project_fq_name)},
+         'net': {'type': 'virtual-network',
+                 'parent': ('project', project_fq_name),
+                 'refs': {'network_ipam_refs': [('ipam', ipam_attr)]},
+                 'body': {'router_external': True}},
+         'pool': {'type': 'floating-ip-pool', 'parent': 'net'}}
+
+    ``parent`` is the key of another object of the spec, an existing object
+    given as a (type, fq_name) tuple, or left out for objects right below
+    config-root.  ``refs`` maps a <type>_refs property to keys of the spec,
+    each optionally paired with the attr of the reference.  Objects are
+    named rand_name(key) unless the spec sets a ``name``.
+
+    create() creates every object as soon as its parent and referred
+    objects exist, so independent branches are built concurrently.
+    delete() removes the objects leaf first, one dependency level at a
+    time, deleting the objects of a level concurrently.
+    """
+
+    def __init__(self, client, spec, max_workers=None):
+        self.client = client
+        self.spec = spec
+        self.max_workers = (max_workers or client.pool_size
+                            or base.DEFAULT_BULK_WORKERS)
+        # Key -> created object
+        self.objects = {}
+        self._depends = dict((key, self._dependencies(entry))
+                             for key, entry in spec.items())
+        self._levels = {}
+        for key in spec:
+            self._level(key, ())
+
+    def _dependencies(self, entry):
+        depends = set()
+        if isinstance(entry.get('parent'), six.string_types):
+            depends.add(entry['parent'])
+        for refs in (entry.get('refs') or {}).values():
+            for ref in refs:
+                depends.add(ref[0] if isinstance(ref, tuple) else ref)
+        unknown = depends.difference(self.spec)
+        if unknown:
+            raise ValueError("Unknown resources %s in %s" % (
+                sorted(unknown), entry))
+        return depends
+
+    def _level(self, key, path):
+        """Return the length of the longest dependency chain below key"""
+        if key in path:
+            raise ValueError("Dependency cycle %s" % ' -> '.join(
+                path + (key,)))
+        if key not in self._levels:
+            self._levels[key] = 1 + max(
+                [self._level(dep, path + (key,))
+                 for dep in self._depends[key]] or [-1])
+        return self._levels[key]
+
+    def _ref(self, ref):
+        key, attr = ref if isinstance(ref, tuple) else (ref, None)
+        obj = self.objects[key]
+        ref = {'to': obj['fq_name'], 'uuid': obj['uuid']}
+        if attr is not None:
+            ref['attr'] = attr
+        return ref
+
+    def _create(self, key):
+        entry = self.spec[key]
+        name = entry.get('name') or data_utils.rand_name(key)
+        parent = entry.get('parent')
+        if parent is None:
+            parent_type, fq_name = 'config-root', []
+        elif isinstance(parent, tuple):
+            parent_type, fq_name = parent
+        else:
+            parent_type = self.spec[parent]['type']
+            fq_name = self.objects[parent]['fq_name']
+        body = dict(entry.get('body') or {},
+                    parent_type=parent_type,
+                    fq_name=list(fq_name) + [name])
+        for field, refs in (entry.get('refs') or {}).items():
+            body[field] = [self._ref(ref) for ref in refs]
+        resource_type = entry['type']
+        return self.client.create_resource(resource_type,
+                                           body)[resource_type]
+
+    def create(self):
+        """Create the objects of the spec
+
+        If an object fails to be created, the objects created so far are
+        deleted again and the error is raised.
+
+        :return: dict of the created objects by key
+        """
+        pending = dict(self._depends)
+        running = {}
+        with futures.ThreadPoolExecutor(self.max_workers) as executor:
+            try:
+                while pending or running:
+                    for key in [key for key, depends in pending.items()
+                                if depends.issubset(self.objects)]:
+                        del pending[key]
+                        running[executor.submit(self._create, key)] = key
+                    done, _ = futures.wait(
+                        running, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        self.objects[running.pop(future)] = future.result()
+            except Exception:
+                for future, key in running.items():
+                    if not future.exception():
+                        self.objects[key] = future.result()
+                self.delete()
+                raise
+        return self.objects
+
+    def _delete(self, key):
+        entry = self.spec[key]
+        try:
+            self.client.delete_resource(entry['type'],
+                                        self.objects[key]['uuid'])
+        except exceptions.NotFound:
+            pass
+        del self.objects[key]
+
+    def delete(self):
+        """Delete the created objects, ignoring those already deleted
+
+        Every level is attempted even if deletes of a former level failed;
+        the first error is raised at the end.
+        """
+        errors = []
+        with futures.ThreadPoolExecutor(self.max_workers) as executor:
+            for level in sorted(set(self._levels.values()), reverse=True):
+                keys = [key for key in self.objects
+                        if self._levels[key] == level]
+                for future in [executor.submit(self._delete, key)
+                               for key in keys]:
+                    if future.exception():
+                        errors.append(future.exception())
+        if errors:
+            raise errors[0]
+
+
+class ContrailTest(test.BaseTestCase):
+    """Base class for Contrail tests not validating RBAC rules."""
     credentials = ['primary', 'admin']
+    _setup_started = None
+    _tests_ended = None
 
     @classmethod
     def skip_checks(cls):
-        super(BaseContrailTest, cls).skip_checks()
+        super(ContrailTest, cls).skip_checks()
         if not CONF.service_available.contrail:
             raise cls.skipException("Contrail support is required")
-        if not CONF.patrole.enable_rbac:
-            raise cls.skipException(
-                "%s skipped as RBAC Flag not enabled" % cls.__name__)
         if CONF.auth.tempest_roles != ['admin']:
             raise cls.skipException(
                 "%s skipped because tempest roles is not admin" % cls.__name__)
 
+    @classmethod
+    def _record_duration(cls, phase, seconds):
+        if durations.RECORDER is not None:
+            durations.RECORDER.record_class(
+                '%s.%s' % (cls.__module__, cls.__name__), phase, seconds)
+
     @classmethod
     def setup_credentials(cls):
-        super(BaseContrailTest, cls).setup_credentials()
+        # The class setup lasts until the first test starts, see setUp, and
+        # its cleanup from the end of the last test, see clear_credentials
+        cls._setup_started = time.time()
+        cls._tests_ended = None
+        super(ContrailTest, cls).setup_credentials()
+
+    @classmethod
+    def clear_credentials(cls):
+        project_id = getattr(cls, '_clients_project_id', None)
+        if project_id and CONF.auth.use_dynamic_credentials:
+            # The project is deleted with the credentials
+            _forget_clients(project_id)
+            ROLE_CREDENTIALS.forget_project(project_id)
+        try:
+            super(ContrailTest, cls).clear_credentials()
+        finally:
+            started = cls._tests_ended or cls._setup_started
+            if started is not None:
+                cls._record_duration('cleanup', time.time() - started)
 
     @classmethod
     def setup_clients(cls):
-        super(BaseContrailTest, cls).setup_clients()
+        super(ContrailTest, cls).setup_clients()
         cls.auth_provider = cls.os_primary.auth_provider
+        cls._clients_project_id = cls.os_primary.credentials.tenant_id
         cls.admin_client = cls.os_admin.networks_client
-        dscv = CONF.identity.disable_ssl_certificate_validation
-        ca_certs = CONF.identity.ca_certificates_file
-        cls.rbac_utils = rbac_utils.RbacUtils(cls)
-        cls.access_control_client = AccessControlClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.alarm_client = AlarmClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.vm_client = VmContrailClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.dsa_client = DiscoveryServiceAssignmentClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.dsa_rule_client = DSARuleClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.forwarding_class_client = ForwardingClassClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.qos_client = QosContrailClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.routing_client = RoutingClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.security_group_client = SecurityGroupClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.service_appliances_client = ServiceAppliancesClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.analytics_node_client = AnalyticsNodeClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.vn_client = VirtualNetworkClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.db_client = ContrailDatabaseClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.fip_client = FloatingIpClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.fq_client = FqnameIdClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.virtual_ip_client = VirtualIPClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.virtual_dns_client = VirtualDNSClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.domain_client = DomainClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.project_client = ProjectClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.port_tuple_client = PortTupleClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.network_policy_client = NetworkPolicyClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.routing_policy_client = RoutingPolicyClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.namespace_client = NamespaceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.network_ipams_client = NetworkIpamsClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.bgp_as_a_service_client = BGPAsAServiceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.iip_client = InstanceIPClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.subnet_client = SubnetClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.load_balancer_client = LoadBalancerClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.route_client = RouteClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.interface_client = InterfaceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.router_client = RouterClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.service_client = ServiceClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.attachments_client = AttachmentsClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.config_client = ConfigClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
-        cls.alias_ip_client = AliasIPsClient(
-            cls.auth_provider,
-            CONF.sdn.catalog_type,
-            CONF.identity.region,
-            CONF.sdn.endpoint_type,
-            disable_ssl_certificate_validation=dscv,
-            ca_certs=ca_certs)
 
     @classmethod
     def resource_setup(cls):
+        cls.cleanup_engine = CleanupEngine(
+            CONF.sdn.connection_pool_size, CONF.sdn.cleanup_conflict_retries)
+        # (key, resource type, object) of the fixtures acquired by the class
+        cls._fixtures = []
         cls.tenant_name = cls.os_primary.credentials.tenant_name
         if CONF.auth.use_dynamic_credentials:
             # Create a contrail project for tests
+            if CONF.sdn.worker_scoped_fixtures:
+                tenant_name = data_utils.rand_name('tempest-shared')
+            else:
+                tenant_name = cls.tenant_name
             post_body = {
                 'parent_type': 'domain',
-                'fq_name': ['default-domain', cls.tenant_name]
+                'fq_name': ['default-domain', tenant_name]
             }
-            resp_body = cls.project_client.create_projects(**post_body)
-            cls.project_uuid = resp_body['project']['uuid']
+            project = cls._acquire_fixture(
+                ('project',), 'project',
+                lambda: cls.project_client.create_projects(
+                    **post_body)['project'])
+            cls.tenant_name = project['fq_name'][-1]
+            cls.project_uuid = project['uuid']
 
     @classmethod
     def resource_cleanup(cls):
-        if CONF.auth.use_dynamic_credentials:
-            cls._try_delete_resource(cls.project_client.delete_project,
-                                     cls.project_uuid)
+        for key, resource_type, obj in getattr(cls, '_fixtures', []):
+            if CONF.sdn.worker_scoped_fixtures:
+                WORKER_FIXTURES.release(key)
+            else:
+                cls.cleanup_engine.add(cls._delete_as_primary,
+                                       resource_type, obj['uuid'])
+        try:
+            cls._run_deferred_deletes()
+        finally:
+            try:
+                super(ContrailTest, cls).resource_cleanup()
+            finally:
+                # Deletes queued by the class cleanups run by the parent
+                cls._run_deferred_deletes()
+
+    def setUp(self):
+        super(ContrailTest, self).setUp()
+        cls = type(self)
+        start = time.time()
+        if cls._setup_started is not None:
+            cls._record_duration('setup', start - cls._setup_started)
+            cls._setup_started = None
+        # Registered first, so the duration includes all cleanups
+        self.addCleanup(self._test_ended, start)
+        # Registered first, so it runs after the test's own cleanups
+        self.addCleanup(self._run_deferred_deletes)
+
+    def _test_ended(self, start):
+        end = time.time()
+        type(self)._tests_ended = end
+        if durations.RECORDER is not None:
+            durations.RECORDER.record_test(self.id(), end - start)
+
+    @classmethod
+    def _run_deferred_deletes(cls):
+        """Delete what _try_delete_resource queued, raising if any leaked"""
+        leaked = cls.cleanup_engine.run()
+        if leaked:
+            raise leaked[0][1]
+
+    @classmethod
+    def _acquire_fixture(cls, key, resource_type, create, reset=None):
+        """Return an object the class uses in all of its tests
+
+        With [sdn] worker_scoped_fixtures enabled the object is shared with
+        the other classes of the worker, see WorkerFixtures, otherwise it is
+        created for the class.  Either way resource_cleanup takes care of
+        it, so the caller must not delete it.
+
+        :param key: hashable identifying the object among the shared ones
+        :param resource_type: Contrail type of the object
+        :param create: callable creating the object and returning it
+        :param reset: callable taking the object, called when it is reused
+        :return: dict of the object as returned by create
+        """
+        if CONF.sdn.worker_scoped_fixtures:
+            obj = WORKER_FIXTURES.acquire(key, resource_type, create, reset)
+        else:
+            obj = create()
+        cls._fixtures.append((key, resource_type, obj))
+        return obj
+
+    @classmethod
+    def _acquire_network(cls):
+        """Return a plain virtual network of the test project
+
+        :return: dict of the virtual network
+        """
+        def create():
+            fq_name = ['default-domain', cls.tenant_name,
+                       data_utils.rand_name('test-net')]
+            return cls.vn_client.create_virtual_networks(
+                parent_type='project', fq_name=fq_name)['virtual-network']
+
+        def reset(network):
+            cls.vn_client.update_virtual_network(
+                network['uuid'], display_name=network['name'])
+
+        return cls._acquire_fixture(
+            ('virtual-network', cls.tenant_name), 'virtual-network',
+            create, reset)
+
+    @classmethod
+    def _create_resource_graph(cls, spec):
+        """Create the objects of a ResourceGraph spec
+
+        The caller deletes them again with _delete_resource_graph, from
+        resource_cleanup or through addCleanup.
 
-        super(BaseContrailTest, cls).resource_cleanup()
+        :param spec: dict describing the objects, see ResourceGraph
+        :return: ResourceGraph object holding the created objects
+        """
+        graph = ResourceGraph(cls.vn_client, spec,
+                              CONF.sdn.connection_pool_size)
+        graph.create()
+        return graph
+
+    @classmethod
+    def _delete_resource_graph(cls, graph):
+        """Queue the deletes of the objects of a ResourceGraph
+
+        :param graph: ResourceGraph object returned by _create_resource_graph
+        """
+        for key, obj in graph.objects.items():
+            cls.cleanup_engine.add(cls._delete_as_primary,
+                                   graph.spec[key]['type'], obj['uuid'])
 
     @classmethod
     def _try_delete_resource(cls, delete_callable, *args, **kwargs):
@@ -405,12 +1103,137 @@ class BaseContrailTest(test.BaseTestCase):
         exceptions thrown for resources that were correctly deleted by the
         test.
 
+        The delete is queued in the cleanup engine and carried out, together
+        with the other queued deletes, once the test's cleanups or the
+        class' resource_cleanup finished.  Deletes of the Contrail clients
+        are queued by object type and uuid and run with the primary
+        credentials, so those queued while override_role has the clients
+        use a role's credentials still run with the primary ones.
+
         :param delete_callable: delete method
         :param args: arguments for delete method
         :param kwargs: keyword arguments for delete method
         """
-        try:
-            delete_callable(*args, **kwargs)
-        # if resource is not found, this means it was deleted in the test
-        except exceptions.NotFound:
-            pass
+        function = getattr(delete_callable, '__func__', None)
+        resource_type = getattr(delete_callable, 'resource_type', None)
+        if function is base.BaseContrailClient.delete_resource:
+            cls.cleanup_engine.add(cls._delete_as_primary, *args, **kwargs)
+        elif resource_type is not None and len(args) + len(kwargs) == 1:
+            uuid = args[0] if args else list(kwargs.values())[0]
+            cls.cleanup_engine.add(cls._delete_as_primary, resource_type,
+                                   uuid)
+        else:
+            cls.cleanup_engine.add(delete_callable, *args, **kwargs)
+
+    @classmethod
+    def _delete_as_primary(cls, resource_type, uuid):
+        """Delete an object with the primary credentials
+
+        The client is resolved when the delete runs, whatever roles the
+        clients of the calling thread use at that time.
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param uuid: object uuid
+        """
+        _client(base.BaseContrailClient,
+                cls.os_primary.auth_provider).delete_resource(
+            resource_type, uuid)
+
+
+class BaseContrailTest(ContrailTest):
+    """Base class for Contrail tests."""
+
+    @classmethod
+    def skip_checks(cls):
+        super(BaseContrailTest, cls).skip_checks()
+        if not CONF.patrole.enable_rbac:
+            raise cls.skipException(
+                "%s skipped as RBAC Flag not enabled" % cls.__name__)
+
+    @classmethod
+    def setup_clients(cls):
+        super(BaseContrailTest, cls).setup_clients()
+        cls.rbac_utils = rbac_utils.RbacUtils(cls)
+        # RbacUtils switched the roles itself, with pre-provisioned
+        # credentials possibly away from what an earlier class left
+        _forget_role_assignment(cls.os_primary.credentials)
+        if CONF.sdn.role_credentials:
+            # override_role uses users of the pool holding the roles
+            cls.rbac_utils._override_role = functools.partial(
+                ROLE_CREDENTIALS.override_role, cls)
+        # The role matrix switches roles through the RoleSwitcher too
+        elif CONF.sdn.defer_role_switches or CONF.sdn.rbac_matrix_roles:
+            cls.role_switcher = RoleSwitcher(cls)
+            # RbacUtils.override_role switches roles with _override_role
+            cls.rbac_utils._override_role = cls.role_switcher.override_role
+
+    def setUp(self):
+        super(BaseContrailTest, self).setUp()
+        rbac_report.test_started()
+
+    def _check_role_matrix(self, rule, call, obj=None, clone=None,
+                           service='Contrail',
+                           denied_errors=(exceptions.Forbidden,)):
+        """Make a guarded call under every role of [sdn] rbac_matrix_roles
+
+        The outcome of the call under each role is compared with the one
+        the policy (or [patrole] custom_requirements_file) expects and
+        recorded in the worker's rule-by-role table.
+
+        :param rule: name of the rule guarding the call
+        :param call: callable taking the object and making the call
+        :param obj: object the call is made on under every role
+        :param clone: callable returning a new object, used instead of obj
+                      by calls that modify or delete the object
+        :param service: service enforcing the rule
+        :param denied_errors: exceptions telling that the call was denied
+        """
+        if not CONF.sdn.rbac_matrix_roles:
+            raise self.skipException("[sdn] rbac_matrix_roles is empty")
+        if CONF.patrole.test_custom_requirements:
+            authority = requirements_authority.RequirementsAuthority(
+                CONF.patrole.custom_requirements_file, service)
+        else:
+            authority = policy_authority.PolicyAuthority(
+                self.os_primary.credentials.tenant_id,
+                self.os_primary.credentials.user_id, service)
+
+        unexpected = []
+        for role in CONF.sdn.rbac_matrix_roles:
+            target = clone() if clone else obj
+            expected = ('allowed' if _allowed(authority, rule, role)
+                        else 'denied')
+            if CONF.sdn.role_credentials:
+                _ROLE_CONTEXT.auth_provider = ROLE_CREDENTIALS.auth_provider(
+                    self.__class__, [role])
+                rbac_report.roles_switched([role])
+            else:
+                self.role_switcher.switch([role])
+            try:
+                call(target)
+                actual = 'allowed'
+            except denied_errors:
+                actual = 'denied'
+            finally:
+                if CONF.sdn.role_credentials:
+                    _ROLE_CONTEXT.auth_provider = None
+                else:
+                    # Switched back before the next request needing admin
+                    self.role_switcher.override_role(self, False)
+            with _MATRIX_LOCK:
+                _MATRIX[(rule, role)] = (expected, actual)
+            # Reported like patrole does, with the role of this call
+            RBACLOG.info(
+                "[Service]: %s, [Test]: %s, [Rules]: %s, "
+                "[Expected]: %s, [Actual]: %s",
+                service, self._testMethodName, rule, expected.capitalize(),
+                actual.capitalize())
+            if actual != expected:
+                unexpected.append('%s with role %s: expected %s, was %s' % (
+                    rule, role, expected, actual))
+        if unexpected:
+            self.fail('; '.join(unexpected))
+
+
+for _name, _client_class in CONTRAIL_CLIENTS.items():
+    setattr(ContrailTest, _name, _LazyClient(_client_class))
@@ -42,51 +42,40 @@ class BaseFloatingIpTest(rbac_base.BaseContrailTest):
     def resource_setup(cls):
         super(BaseFloatingIpTest, cls).resource_setup()
 
-        # Create subnet using ipam
-        ipam_name = data_utils.rand_name('rbac-fip-ipam')
-        fq_name_ipam = ['default-domain',
-                        cls.tenant_name,
-                        ipam_name]
-
+        # Create network with a subnet of the project network CIDR
         ip_cidr = CONF.network.project_network_cidr
         ip_prefix, ip_prefix_len = ip_cidr.split('/')
         subnet_ip_prefix = {'ip_prefix': ip_prefix,
                             'ip_prefix_len': int(ip_prefix_len)}
-        ipam_post_body = {'parent_type': 'project', 'fq_name': fq_name_ipam}
-
-        body = cls.network_ipams_client.create_network_ipams(**ipam_post_body)
-        cls.ipam = body['network-ipam']
-
-        # Create network
-        net_name = data_utils.rand_name('rbac-pool-network')
-        fq_name = ['default-domain', cls.tenant_name, net_name]
-
-        post_body = {'parent_type': 'project',
-                     'router_external': True,
-                     'fq_name': fq_name,
-                     'network_ipam_refs': [
-                         {
-                             'to': cls.ipam['fq_name'],
-                             'href': cls.ipam['href'],
-                             'uuid': cls.ipam['uuid'],
-                             'attr': {
-                                 'ipam_subnets': [{'subnet': subnet_ip_prefix}]
-                                 }
-                             }
-                         ],
-                     'virtual_network_properties': {
-                         'forwarding_mode': 'l3'
-                         }
+        project = ('project', ['default-domain', cls.tenant_name])
+        cls.resources = cls._create_resource_graph({
+            'rbac-fip-ipam': {
+                'type': 'network-ipam',
+                'parent': project,
+            },
+            'rbac-pool-network': {
+                'type': 'virtual-network',
+                'parent': project,
+                'refs': {
+                    'network_ipam_refs': [
+                        ('rbac-fip-ipam',
+                         {'ipam_subnets': [{'subnet': subnet_ip_prefix}]})
+                    ]
+                },
+                'body': {
+                    'router_external': True,
+                    'virtual_network_properties': {
+                        'forwarding_mode': 'l3'
                     }
-        body = cls.vn_client.create_virtual_networks(**post_body)
-        cls.network = body['virtual-network']
+                }
+            }
+        })
+        cls.ipam = cls.resources.objects['rbac-fip-ipam']
+        cls.network = cls.resources.objects['rbac-pool-network']
 
     @classmethod
     def resource_cleanup(cls):
-        cls._try_delete_resource(cls.vn_client.delete_virtual_network,
-                                 cls.network['uuid'])
-        cls._try_delete_resource(cls.network_ipams_client.delete_network_ipam,
-                                 cls.ipam['uuid'])
+        cls._delete_resource_graph(cls.resources)
         super(BaseFloatingIpTest, cls).resource_cleanup()
 
 
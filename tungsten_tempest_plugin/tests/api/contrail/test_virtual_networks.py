@@ -130,3 +130,26 @@ class NetworksTest(rbac_base.BaseContrailTest):
         uuid = self._create_virtual_network()['uuid']
         with self.rbac_utils.override_role(self):
             self.vn_client.show_virtual_network(uuid)
+
+    @decorators.idempotent_id('d37e2284-1ab8-4fda-91c8-adecce2829bf')
+    def test_virtual_network_role_matrix(self):
+        """
+        test method for show, update and delete vm network objects under
+        every role of the role matrix
+        """
+        if not CONF.sdn.rbac_matrix_roles:
+            raise self.skipException("[sdn] rbac_matrix_roles is empty")
+        network = self._create_virtual_network()
+        self._check_role_matrix(
+            'show_virtual_network',
+            lambda net: self.vn_client.show_virtual_network(net['uuid']),
+            obj=network)
+        self._check_role_matrix(
+            'update_virtual_network',
+            lambda net: self.vn_client.update_virtual_network(
+                net['uuid'], router_external=False),
+            clone=self._create_virtual_network)
+        self._check_role_matrix(
+            'delete_virtual_network',
+            lambda net: self.vn_client.delete_virtual_network(net['uuid']),
+            clone=self._create_virtual_network)
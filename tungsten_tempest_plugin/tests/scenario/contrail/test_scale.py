@@ -0,0 +1,248 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tempest scenario to measure object create and delete throughput at scale
+"""
+
+import json
+import os
+import threading
+import time
+
+from oslo_log import log as logging
+
+from tungsten_tempest_plugin import metrics
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+
+from tempest import config
+from tempest.lib.common.utils import data_utils
+from tempest.lib import decorators
+from tempest.lib import exceptions
+
+CONF = config.CONF
+LOG = logging.getLogger(__name__)
+
+# Test id -> phase reports of every scale scenario run by this worker
+_REPORTS = {}
+_REPORTS_LOCK = threading.Lock()
+
+
+class PhaseReport(object):
+    """Throughput and latency percentiles of one phase of a scenario
+
+    :param name: phase name, e.g. 'create-virtual-network'
+    :param results: BulkResult objects of the phase's requests
+    :param seconds: wall clock duration of the phase
+    """
+
+    def __init__(self, name, results, seconds):
+        self.name = name
+        self.count = len(results)
+        self.errors = [result.error for result in results if result.error]
+        self.seconds = seconds
+        self.latency_us = metrics.Histogram()
+        for result in results:
+            self.latency_us.record(int(result.seconds * 1000000))
+
+    @property
+    def objects_per_second(self):
+        done = self.count - len(self.errors)
+        return done / self.seconds if self.seconds else 0.0
+
+    def to_dict(self):
+        report = {
+            'phase': self.name,
+            'count': self.count,
+            'errors': len(self.errors),
+            'seconds': self.seconds,
+            'objects_per_second': self.objects_per_second,
+            'max_ms': self.latency_us.max / 1000.0,
+        }
+        for percent in metrics.PERCENTILES:
+            report['p%d_ms' % percent] = (
+                self.latency_us.percentile(percent) / 1000.0)
+        return report
+
+    def __str__(self):
+        return ('%(phase)s: %(count)d objects, %(errors)d errors in '
+                '%(seconds).2fs, %(objects_per_second).1f objects/s, '
+                'p50 %(p50_ms).1fms p95 %(p95_ms).1fms p99 %(p99_ms).1fms '
+                'max %(max_ms).1fms' % self.to_dict())
+
+
+class ContrailScaleTest(rbac_base.ContrailTest):
+
+    """
+    Scenario creating and deleting many Contrail objects concurrently
+
+    Every phase creates or deletes scale_factor objects of one type with
+    ``concurrency`` requests in flight and reports its throughput and
+    latency percentiles.  The objects are deleted again in dependency
+    order; whatever a failing run leaves behind is removed on cleanup.
+    """
+
+    @classmethod
+    def skip_checks(cls):
+        super(ContrailScaleTest, cls).skip_checks()
+        if not CONF.tungsten_scale.scale_factor:
+            raise cls.skipException(
+                "%s skipped as [tungsten_scale] scale_factor is 0"
+                % cls.__name__)
+
+    def setUp(self):
+        super(ContrailScaleTest, self).setUp()
+        self.reports = []
+        # Resource type -> (client, uuids not deleted yet)
+        self.created = {}
+        self.addCleanup(self._write_report)
+
+    def _write_report(self):
+        with _REPORTS_LOCK:
+            _REPORTS[self.id()] = [report.to_dict()
+                                   for report in self.reports]
+            path = os.path.join(
+                os.path.abspath(CONF.tungsten_log.report_log_path),
+                '%s.%d.json' % (CONF.tungsten_scale.report_name,
+                                os.getpid()))
+            with open(path, 'w') as f:
+                json.dump(_REPORTS, f, indent=2, sort_keys=True)
+
+    def _run_phase(self, name, bulk_callable, *args):
+        start = time.time()
+        results = bulk_callable(
+            *args, max_workers=CONF.tungsten_scale.concurrency)
+        report = PhaseReport(name, results, time.time() - start)
+        self.reports.append(report)
+        LOG.info("Scale %s", report)
+        return results, report
+
+    def _create_objects(self, client, resource_type, bodies):
+        results, report = self._run_phase('create-%s' % resource_type,
+                                          client.create_many,
+                                          resource_type, bodies)
+        objs = [result.result[resource_type] for result in results
+                if result.error is None]
+        # Shared with _delete_objects, which discards what it deleted
+        leftovers = set(obj['uuid'] for obj in objs)
+        self.addCleanup(self._delete_leftovers, client, resource_type,
+                        leftovers)
+        self.created[resource_type] = (client, leftovers)
+        if report.errors:
+            raise report.errors[0]
+        return objs
+
+    def _delete_objects(self, resource_type):
+        client, leftovers = self.created[resource_type]
+        uuids = sorted(leftovers)
+        results, report = self._run_phase('delete-%s' % resource_type,
+                                          client.delete_many,
+                                          resource_type, uuids)
+        for uuid, result in zip(uuids, results):
+            if result.error is None:
+                leftovers.discard(uuid)
+        if report.errors:
+            raise report.errors[0]
+
+    @staticmethod
+    def _delete_leftovers(client, resource_type, uuids):
+        results = client.delete_many(
+            resource_type, sorted(uuids),
+            max_workers=CONF.tungsten_scale.concurrency)
+        for uuid, result in zip(sorted(uuids), results):
+            if result.error and not isinstance(result.error,
+                                               exceptions.NotFound):
+                LOG.warning("Failed to delete %s %s: %s", resource_type,
+                            uuid, result.error)
+
+    def _create_network_ipam(self, prefix):
+        ipam = self.network_ipams_client.create_network_ipams(
+            parent_type='project',
+            fq_name=['default-domain', self.tenant_name,
+                     prefix + '-ipam'])['network-ipam']
+        self.addCleanup(self._try_delete_resource,
+                        self.network_ipams_client.delete_network_ipam,
+                        ipam['uuid'])
+        return ipam
+
+    @staticmethod
+    def _ref(obj, **kwargs):
+        return dict(kwargs, to=obj['fq_name'], uuid=obj['uuid'])
+
+    @staticmethod
+    def _subnet(index):
+        # A /24 per network; networks may overlap beyond 65536 of them
+        return {'ip_prefix': '10.%d.%d.0' % (index // 256 % 256, index % 256),
+                'ip_prefix_len': 24}
+
+    @decorators.attr(type='slow')
+    @decorators.idempotent_id('b1847499-78fa-4a0b-9c3b-540c663b8773')
+    def test_create_delete_at_scale(self):
+        """
+        test method creating and deleting networks, ports and security
+        groups at scale
+        """
+        count = CONF.tungsten_scale.scale_factor
+        prefix = data_utils.rand_name('scale')
+        project_fq_name = ['default-domain', self.tenant_name]
+        ipam = self._create_network_ipam(prefix)
+
+        networks = self._create_objects(self.vn_client, 'virtual-network', [{
+            'parent_type': 'project',
+            'fq_name': project_fq_name + ['%s-vn-%d' % (prefix, i)],
+            'network_ipam_refs': [self._ref(ipam, attr={
+                'ipam_subnets': [{'subnet': self._subnet(i)}]})],
+        } for i in range(count)])
+
+        ports = self._create_objects(
+            self.vm_client, 'virtual-machine-interface', [{
+                'parent_type': 'project',
+                'fq_name': project_fq_name + ['%s-vmi-%d' % (prefix, i)],
+                'virtual_network_refs': [self._ref(network)],
+            } for i, network in enumerate(networks)])
+
+        self._create_objects(self.iip_client, 'instance-ip', [{
+            'fq_name': ['%s-iip-%d' % (prefix, i)],
+            'virtual_network_refs': [self._ref(network)],
+            'virtual_machine_interface_refs': [self._ref(port)],
+        } for i, (network, port) in enumerate(zip(networks, ports))])
+
+        self._create_objects(self.security_group_client, 'security-group', [{
+            'parent_type': 'project',
+            'fq_name': project_fq_name + ['%s-sg-%d' % (prefix, i)],
+            'security_group_entries': {'policy_rule': [{
+                'direction': '>',
+                'protocol': 'tcp',
+                'ethertype': 'IPv4',
+                'src_addresses': [{'security_group': 'local'}],
+                'src_ports': [{'start_port': 0, 'end_port': 65535}],
+                'dst_addresses': [{'subnet': {'ip_prefix': '0.0.0.0',
+                                              'ip_prefix_len': 0}}],
+                'dst_ports': [{'start_port': 1024 + i % 64000,
+                               'end_port': 1024 + i % 64000}],
+            }]},
+        } for i in range(count)])
+
+        for resource_type in ('instance-ip', 'virtual-machine-interface',
+                              'security-group', 'virtual-network'):
+            self._delete_objects(resource_type)
+
+        minimum = CONF.tungsten_scale.min_objects_per_second
+        slow = [str(report) for report in self.reports
+                if report.name.startswith('create-')
+                and report.objects_per_second < minimum]
+        if slow:
+            self.fail("Created fewer than %s objects/s in: %s" % (
+                minimum, '; '.join(slow)))
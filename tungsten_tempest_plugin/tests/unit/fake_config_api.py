@@ -0,0 +1,694 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+In-process fake of the Contrail VNC config API server
+
+Serves the CRUD, list and fqname endpoints used by the service clients in
+``services/contrail/json`` from an in-memory store, so that the clients and
+fixtures can be exercised and benchmarked without a Contrail deployment::
+
+    with FakeConfigApiServer(latency=0.005) as server:
+        client = VirtualNetworkClient(server.auth_provider(), 'sdn', 'r')
+
+Resource types are not hard-coded: ``/<type>s`` is the collection and
+``/<type>/<uuid>`` an object of any type.
+"""
+
+import collections
+import copy
+import datetime
+import gzip
+import io
+import threading
+import time
+import uuid
+import zlib
+
+from oslo_serialization import jsonutils as json
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse as urllib
+from tempest.tests.lib import fake_auth_provider
+import testtools
+
+# Objects a freshly installed config API server already holds, parents first
+DEFAULT_OBJECTS = (
+    ('domain', ['default-domain']),
+    ('project', ['default-domain', 'default-project']),
+    ('global-system-config', ['default-global-system-config']),
+)
+
+# Parent type of every object created with a single element fq_name
+ROOT_TYPE = 'config-root'
+
+# Properties that are set by the server and never taken from a request
+SERVER_PROPERTIES = ('uuid', 'fq_name', 'href', 'parent_type', 'parent_uuid',
+                     'parent_href')
+
+
+class ApiError(Exception):
+    """Error answered to the client with the given HTTP status"""
+
+    def __init__(self, status, message):
+        super(ApiError, self).__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _now():
+    return datetime.datetime.utcnow().isoformat()
+
+
+def _field(resource_type):
+    """Return the name of a property derived from a type name"""
+    return resource_type.replace('-', '_')
+
+
+def _ref_type(key):
+    """Return the referred type of a <type>_refs property"""
+    return key[:-len('_refs')].replace('_', '-')
+
+
+def _json_value(value):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _gzip(data):
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+class ConfigStore(object):
+    """In-memory store of config objects with parent/child and references
+
+    Creating an object requires its parent and every referred object to
+    exist, and deleting an object fails with 409 while it still has
+    children or is referred to, as it does on the real server.  All
+    operations are serialized by one lock, so the store may be shared by
+    the threads of the server.
+    """
+
+    def __init__(self, defaults=DEFAULT_OBJECTS):
+        self.href_base = ''
+        self._lock = threading.RLock()
+        self._revision = 0
+        # uuid -> (type, object)
+        self._objects = {}
+        # (type, fq_name) -> uuid
+        self._fq_names = {}
+        # uuid -> uuids of the children
+        self._children = collections.defaultdict(set)
+        # uuid -> uuids of the objects referring to it
+        self._back_refs = collections.defaultdict(set)
+        # uuid -> revision used as entity tag
+        self._revisions = {}
+        for resource_type, fq_name in defaults:
+            self.create(resource_type, {'fq_name': fq_name})
+
+    def __len__(self):
+        with self._lock:
+            return len(self._objects)
+
+    def _href(self, resource_type, obj_uuid):
+        return '%s/%s/%s' % (self.href_base, resource_type, obj_uuid)
+
+    def _get(self, resource_type, obj_uuid):
+        entry = self._objects.get(obj_uuid)
+        if entry is None or (resource_type and entry[0] != resource_type):
+            raise ApiError(404, '%s %s not found' % (
+                resource_type or 'Object', obj_uuid))
+        return entry[1]
+
+    def _lookup(self, resource_type, fq_name):
+        """Return the uuid of the object with fq_name, any type if None"""
+        if resource_type:
+            return self._fq_names.get((resource_type, tuple(fq_name)))
+        for (_, name), obj_uuid in self._fq_names.items():
+            if name == tuple(fq_name):
+                return obj_uuid
+        return None
+
+    def _bump(self, obj_uuid, obj):
+        self._revision += 1
+        self._revisions[obj_uuid] = self._revision
+        obj['id_perms']['last_modified'] = _now()
+
+    def _resolve_refs(self, obj):
+        """Point every <type>_refs entry of obj to an existing object"""
+        refs = {}
+        for key in [key for key in obj if key.endswith('_refs')]:
+            ref_type = _ref_type(key)
+            resolved = []
+            for ref in obj[key] or []:
+                ref_uuid = ref.get('uuid')
+                if not ref_uuid and ref.get('to'):
+                    ref_uuid = self._lookup(ref_type, ref['to'])
+                if ref_uuid not in self._objects:
+                    raise ApiError(404, 'Reference %s %s not found' % (
+                        ref_type, ref.get('to') or ref_uuid))
+                ref_obj = self._objects[ref_uuid][1]
+                resolved.append({'to': ref_obj['fq_name'],
+                                 'uuid': ref_uuid,
+                                 'href': self._href(ref_type, ref_uuid),
+                                 'attr': ref.get('attr')})
+            refs[key] = resolved
+        return refs
+
+    def _set_refs(self, obj_uuid, obj, refs):
+        for ref in self._refs_of(obj):
+            self._back_refs[ref['uuid']].discard(obj_uuid)
+        obj.update(refs)
+        for ref in self._refs_of(obj):
+            self._back_refs[ref['uuid']].add(obj_uuid)
+
+    @staticmethod
+    def _refs_of(obj):
+        for key, refs in obj.items():
+            if key.endswith('_refs'):
+                for ref in refs or []:
+                    yield ref
+
+    def _default_fq_name(self, resource_type, body):
+        name = (body.get('name') or body.get('display_name')
+                or '%s-%s' % (resource_type, uuid.uuid4()))
+        parent_type = body.get('parent_type', ROOT_TYPE)
+        if body.get('parent_uuid'):
+            parent = self._get(parent_type if 'parent_type' in body else None,
+                               body['parent_uuid'])
+            return parent['fq_name'] + [name]
+        if parent_type == ROOT_TYPE:
+            return [name]
+        for default_type, fq_name in DEFAULT_OBJECTS:
+            if default_type == parent_type:
+                return fq_name + [name]
+        raise ApiError(400, 'No default parent of type %s' % parent_type)
+
+    def create(self, resource_type, body):
+        with self._lock:
+            fq_name = (list(body['fq_name']) if body.get('fq_name')
+                       else self._default_fq_name(resource_type, body))
+            if self._lookup(resource_type, fq_name):
+                raise ApiError(409, 'Fq_name %s of type %s already exists' % (
+                    fq_name, resource_type))
+            obj_uuid = body.get('uuid') or str(uuid.uuid4())
+            if obj_uuid in self._objects:
+                raise ApiError(409, 'Uuid %s already exists' % obj_uuid)
+            obj = copy.deepcopy(body)
+            obj.update({
+                'uuid': obj_uuid,
+                'fq_name': fq_name,
+                'name': fq_name[-1],
+                'href': self._href(resource_type, obj_uuid),
+            })
+            obj.setdefault('display_name', fq_name[-1])
+            parent_uuid = None
+            if len(fq_name) > 1:
+                parent_type = body.get('parent_type')
+                parent_uuid = self._lookup(parent_type, fq_name[:-1])
+                if parent_uuid is None:
+                    raise ApiError(404, 'Parent %s %s not found' % (
+                        parent_type or '', fq_name[:-1]))
+                parent_type = self._objects[parent_uuid][0]
+                obj.update({
+                    'parent_type': parent_type,
+                    'parent_uuid': parent_uuid,
+                    'parent_href': self._href(parent_type, parent_uuid),
+                })
+            else:
+                obj['parent_type'] = ROOT_TYPE
+            created = _now()
+            id_perms = dict(obj.get('id_perms') or {})
+            id_perms.update({'created': created, 'last_modified': created})
+            id_perms.setdefault('enable', True)
+            obj['id_perms'] = id_perms
+            refs = self._resolve_refs(obj)
+            for key in refs:
+                obj[key] = []
+            self._objects[obj_uuid] = (resource_type, obj)
+            self._fq_names[(resource_type, tuple(fq_name))] = obj_uuid
+            if parent_uuid:
+                self._children[parent_uuid].add(obj_uuid)
+            self._set_refs(obj_uuid, obj, refs)
+            self._bump(obj_uuid, obj)
+            return self._read(resource_type, obj_uuid)
+
+    def _read(self, resource_type, obj_uuid, fields=None):
+        obj = copy.deepcopy(self._get(resource_type, obj_uuid))
+        if fields is not None:
+            obj = dict((key, value) for key, value in obj.items()
+                       if key in fields or key in SERVER_PROPERTIES)
+        for child_uuid in self._children.get(obj_uuid, ()):
+            child_type, child = self._objects[child_uuid]
+            obj.setdefault(_field(child_type) + 's', []).append({
+                'to': child['fq_name'],
+                'uuid': child_uuid,
+                'href': child['href']})
+        for ref_uuid in self._back_refs.get(obj_uuid, ()):
+            ref_type, ref_obj = self._objects[ref_uuid]
+            attrs = [ref.get('attr') for ref in self._refs_of(ref_obj)
+                     if ref['uuid'] == obj_uuid]
+            obj.setdefault(_field(ref_type) + '_back_refs', []).append({
+                'to': ref_obj['fq_name'],
+                'uuid': ref_uuid,
+                'href': ref_obj['href'],
+                'attr': attrs[0] if attrs else None})
+        return obj
+
+    def read(self, resource_type, obj_uuid, fields=None):
+        with self._lock:
+            return self._read(resource_type, obj_uuid, fields)
+
+    def etag(self, obj_uuid):
+        with self._lock:
+            revision = self._revisions.get(obj_uuid)
+        return '"%s"' % revision if revision else None
+
+    def last_modified_etag(self, obj_uuid):
+        """Return id_perms.last_modified of the object as entity tag"""
+        with self._lock:
+            entry = self._objects.get(obj_uuid)
+            if entry is None:
+                return None
+            return '"%s"' % entry[1]['id_perms']['last_modified']
+
+    def update(self, resource_type, obj_uuid, body):
+        with self._lock:
+            obj = self._get(resource_type, obj_uuid)
+            body = dict((key, value) for key, value in body.items()
+                        if key not in SERVER_PROPERTIES)
+            if 'id_perms' in body:
+                id_perms = dict(obj['id_perms'])
+                id_perms.update(body.pop('id_perms') or {})
+                body['id_perms'] = id_perms
+            refs = self._resolve_refs(body)
+            obj.update(copy.deepcopy(
+                dict((key, value) for key, value in body.items()
+                     if key not in refs)))
+            self._set_refs(obj_uuid, obj, refs)
+            self._bump(obj_uuid, obj)
+            return self._read(resource_type, obj_uuid)
+
+    def delete(self, resource_type, obj_uuid):
+        with self._lock:
+            obj = self._get(resource_type, obj_uuid)
+            if self._children.get(obj_uuid):
+                raise ApiError(409, 'Delete when children still present: %s'
+                               % sorted(self._children[obj_uuid]))
+            if self._back_refs.get(obj_uuid):
+                raise ApiError(409, 'Delete when resource still referred: %s'
+                               % sorted(self._back_refs[obj_uuid]))
+            self._set_refs(obj_uuid, obj, dict(
+                (key, []) for key in obj if key.endswith('_refs')))
+            if obj.get('parent_uuid'):
+                self._children[obj['parent_uuid']].discard(obj_uuid)
+            self._children.pop(obj_uuid, None)
+            self._back_refs.pop(obj_uuid, None)
+            self._revisions.pop(obj_uuid, None)
+            del self._fq_names[(resource_type, tuple(obj['fq_name']))]
+            del self._objects[obj_uuid]
+
+    def list(self, resource_type, query):
+        """List a collection, honouring the VNC API list options
+
+        :param resource_type: object type, e.g. 'virtual-network'
+        :param query: dict of query parameters, each with a string value
+        """
+        def values(name):
+            value = query.get(name)
+            return set(value.split(',')) if value else None
+
+        obj_uuids = values('obj_uuids')
+        parent_ids = values('parent_id')
+        back_ref_ids = values('back_ref_id')
+        fields = values('fields')
+        filters = collections.defaultdict(list)
+        for item in (query.get('filters') or '').split(','):
+            if '==' in item:
+                key, value = item.split('==', 1)
+                filters[key].append(_json_value(value))
+        detail = query.get('detail', '').lower() == 'true'
+        collection = '%ss' % resource_type
+
+        with self._lock:
+            objs = []
+            for obj_uuid, (obj_type, obj) in self._objects.items():
+                if obj_type != resource_type:
+                    continue
+                if obj_uuids is not None and obj_uuid not in obj_uuids:
+                    continue
+                if (parent_ids is not None
+                        and obj.get('parent_uuid') not in parent_ids):
+                    continue
+                if back_ref_ids is not None and not back_ref_ids.intersection(
+                        ref['uuid'] for ref in self._refs_of(obj)):
+                    continue
+                if any(obj.get(key) not in accepted
+                       for key, accepted in filters.items()):
+                    continue
+                objs.append(obj)
+            objs.sort(key=lambda obj: obj['uuid'])
+            if query.get('count', '').lower() == 'true':
+                return {collection: {'count': len(objs)}}
+
+            marker = None
+            if 'page_limit' in query:
+                start = query.get('page_marker')
+                if start:
+                    objs = [obj for obj in objs if obj['uuid'] > start]
+                limit = int(query['page_limit'])
+                if len(objs) > limit:
+                    objs = objs[:limit]
+                    marker = objs[-1]['uuid']
+
+            if detail:
+                listed = [{resource_type: self._read(
+                    resource_type, obj['uuid'], fields)} for obj in objs]
+            else:
+                listed = []
+                for obj in objs:
+                    entry = {'href': obj['href'],
+                             'fq_name': obj['fq_name'],
+                             'uuid': obj['uuid']}
+                    for field in fields or ():
+                        if field in obj:
+                            entry[field] = copy.deepcopy(obj[field])
+                    listed.append(entry)
+        body = {collection: listed}
+        if 'page_limit' in query:
+            body['marker'] = marker
+        return body
+
+    def fqname_to_id(self, body):
+        with self._lock:
+            obj_uuid = self._lookup(body.get('type'), body.get('fq_name', []))
+        if obj_uuid is None:
+            raise ApiError(404, 'Name %s of type %s not found' % (
+                body.get('fq_name'), body.get('type')))
+        return {'uuid': obj_uuid}
+
+    def id_to_fqname(self, body):
+        with self._lock:
+            entry = self._objects.get(body.get('uuid'))
+        if entry is None:
+            raise ApiError(404, 'UUID %s not found' % body.get('uuid'))
+        return {'type': entry[0], 'fq_name': entry[1]['fq_name']}
+
+
+class _RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, don't let them wait for the
+    # client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.server.count('connections')
+
+    def _send(self, status, body=None, headers=None):
+        if isinstance(body, dict):
+            data = json.dumps(body).encode('utf-8')
+            content_type = 'application/json; charset=UTF-8'
+        else:
+            data = (body or '').encode('utf-8')
+            content_type = 'text/plain; charset=UTF-8'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if data and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self.server.count('gzip_responses')
+            data = _gzip(data)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        data = self.rfile.read(length) if length else b''
+        encoding = self.headers.get('Content-Encoding')
+        if encoding == 'gzip':
+            self.server.count('gzip_requests')
+            data = gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+        elif encoding == 'deflate':
+            data = zlib.decompress(data)
+        return json.loads(data) if data else {}
+
+    def _handle(self, method):
+        # Drain the request before sleeping, the connection is kept alive
+        body = self._read_body() if method in ('POST', 'PUT') else None
+        self.server.started(method, self.path)
+        try:
+            self._respond(method, body)
+        finally:
+            self.server.finished()
+
+    def _respond(self, method, body):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        parsed = urllib.urlparse(self.path)
+        path = parsed.path.strip('/').split('/')
+        query = dict(urllib.parse_qsl(parsed.query))
+        store = server.store
+        try:
+            if method == 'POST' and path == ['fqname-to-id']:
+                return self._send(200, store.fqname_to_id(body))
+            if method == 'POST' and path == ['id-to-fqname']:
+                return self._send(200, store.id_to_fqname(body))
+            if len(path) == 1 and path[0].endswith('s'):
+                resource_type = path[0][:-1]
+                if method == 'GET':
+                    return self._send(200, store.list(resource_type, query))
+                if method == 'POST':
+                    obj = store.create(resource_type, self._unwrap(
+                        resource_type, body))
+                    return self._send(200, {resource_type: obj})
+            elif len(path) == 2:
+                resource_type, obj_uuid = path
+                if method == 'GET':
+                    fields = query.get('fields')
+                    obj = store.read(resource_type, obj_uuid,
+                                     fields and fields.split(','))
+                    if server.etags:
+                        etag = store.etag(obj_uuid)
+                        headers = {'ETag': etag}
+                    else:
+                        # Still revalidates by the modification time
+                        etag = store.last_modified_etag(obj_uuid)
+                        headers = None
+                    if etag and self.headers.get('If-None-Match') == etag:
+                        server.count('not_modified')
+                        return self._send(304, headers=headers)
+                    return self._send(200, {resource_type: obj}, headers)
+                if method == 'PUT':
+                    obj = store.update(resource_type, obj_uuid, self._unwrap(
+                        resource_type, body))
+                    return self._send(200, {resource_type: obj})
+                if method == 'DELETE':
+                    store.delete(resource_type, obj_uuid)
+                    return self._send(200)
+            raise ApiError(404, 'No %s on %s' % (method, parsed.path))
+        except ApiError as e:
+            self._send(e.status, e.message)
+        except Exception as e:
+            self._send(500, '%s: %s' % (type(e).__name__, e))
+
+    @staticmethod
+    def _unwrap(resource_type, body):
+        if resource_type in body:
+            return body[resource_type]
+        if len(body) == 1:
+            return list(body.values())[0]
+        raise ApiError(400, 'Body of a %s expected' % resource_type)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                           BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store, latency, etags):
+        BaseHTTPServer.HTTPServer.__init__(self, address, _RequestHandler)
+        self.store = store
+        self.latency = latency
+        self.etags = etags
+        self.counts = collections.Counter()
+        # (method, path) of the requests, in the order they came in
+        self.log = []
+        self._in_flight = 0
+        self._counts_lock = threading.Lock()
+
+    def count(self, name):
+        with self._counts_lock:
+            self.counts[name] += 1
+
+    def started(self, method, path):
+        with self._counts_lock:
+            self.counts['requests'] += 1
+            self.log.append((method, path))
+            self._in_flight += 1
+            self.counts['peak_requests'] = max(self.counts['peak_requests'],
+                                               self._in_flight)
+
+    def finished(self):
+        with self._counts_lock:
+            self._in_flight -= 1
+
+
+class FakeAuthProvider(fake_auth_provider.FakeAuthProvider):
+    """Auth provider sending every request to the fake server"""
+
+    def auth_request(self, method, url, headers=None, body=None,
+                     filters=None):
+        return self.fake_base_url + url, headers, body
+
+
+class FakeConfigApiServer(object):
+    """Fake config API server running in a thread of this process
+
+    :param latency: seconds every request is delayed by before it is
+                    handled, to model the round trip to a real server
+    :param store: ConfigStore to serve, a new one by default
+    :param host: address to listen on
+    :param port: port to listen on, a free one by default
+    :param etags: send an ETag with every object, else only revalidate
+                  requests whose If-None-Match is id_perms.last_modified
+    """
+
+    def __init__(self, latency=0, store=None, host='127.0.0.1', port=0,
+                 etags=True):
+        self.store = store or ConfigStore()
+        self._server = _ThreadingHTTPServer((host, port), self.store,
+                                            latency, etags)
+        self.url = 'http://%s:%d' % self._server.server_address[:2]
+        self.store.href_base = self.url
+        self._thread = None
+
+    @property
+    def latency(self):
+        return self._server.latency
+
+    @latency.setter
+    def latency(self, value):
+        self._server.latency = value
+
+    @property
+    def requests(self):
+        """Number of requests served so far"""
+        return self._server.counts['requests']
+
+    @property
+    def request_log(self):
+        """(method, path) of the requests served so far, in order"""
+        with self._server._counts_lock:
+            return list(self._server.log)
+
+    @property
+    def peak_requests(self):
+        """Largest number of requests handled at once so far"""
+        return self._server.counts['peak_requests']
+
+    @property
+    def objects(self):
+        """Number of objects in the store"""
+        return len(self.store)
+
+    @property
+    def connections(self):
+        """Number of connections accepted so far"""
+        return self._server.counts['connections']
+
+    @property
+    def not_modified(self):
+        """Number of requests answered 304 Not Modified so far"""
+        return self._server.counts['not_modified']
+
+    @property
+    def gzip_requests(self):
+        """Number of gzip encoded request bodies received so far"""
+        return self._server.counts['gzip_requests']
+
+    @property
+    def gzip_responses(self):
+        """Number of gzip encoded response bodies sent so far"""
+        return self._server.counts['gzip_responses']
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def auth_provider(self, creds_dict=None):
+        """Return an auth provider for service clients of this server"""
+        return FakeAuthProvider(creds_dict, fake_base_url=self.url)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class FakeConfigApiTestCase(testtools.TestCase):
+    """Test case with a FakeConfigApiServer of its own
+
+    The server is started by setUp and stopped when the test ends.
+    """
+
+    # Keyword arguments of the server
+    server_options = {}
+
+    def setUp(self):
+        super(FakeConfigApiTestCase, self).setUp()
+        self.server = FakeConfigApiServer(**self.server_options).start()
+        self.addCleanup(self.server.stop)
+
+    def make_client(self, client_class, **kwargs):
+        """Return a service client of the given class for the server
+
+        :param client_class: service class, e.g. VirtualNetworkClient
+        :param kwargs: further arguments of the service class
+        """
+        return client_class(self.server.auth_provider(), 'sdn', 'region',
+                            **kwargs)
@@ -0,0 +1,70 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the connection handling and bulk calls of the base service class
+"""
+
+from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+
+class SharedHttpTest(fake_config_api.FakeConfigApiTestCase):
+
+    def _client(self, **kwargs):
+        return self.make_client(base.BaseContrailClient, pool_size=4,
+                                **kwargs)
+
+    def test_pool_shared_by_settings(self):
+        following = self._client()
+        self.assertIs(following.http_obj, self._client().http_obj)
+        self.assertTrue(following.http_obj.follow_redirects)
+
+        not_following = self._client(follow_redirects=False)
+        self.assertIsNot(following.http_obj, not_following.http_obj)
+        self.assertFalse(not_following.http_obj.follow_redirects)
+        self.assertIs(not_following.http_obj,
+                      self._client(follow_redirects=False).http_obj)
+
+    def _connections(self, client):
+        start = self.server.connections
+        for _ in range(3):
+            client.get('/virtual-networks')
+        return self.server.connections - start
+
+    def test_connection_reused(self):
+        client = self.make_client(base.BaseContrailClient, pool_size=1)
+        self.assertEqual(1, self._connections(client))
+        # tempest's own http object closes the connection every time
+        client = self.make_client(base.BaseContrailClient)
+        self.assertEqual(3, self._connections(client))
+
+
+class RunManyTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(RunManyTest, self).setUp()
+        self.client = self.make_client(base.BaseContrailClient, pool_size=2)
+
+    def test_requests_in_flight_bounded(self):
+        self.server.latency = 0.05
+        results = self.client.run_many(
+            self.client.resource('virtual-network').show,
+            ['missing-%d' % i for i in range(10)])
+        self.assertEqual(10, len(results))
+        # The default is the connection pool size
+        self.assertEqual(2, self.server.peak_requests)
+        # Every call failed on its own
+        self.assertTrue(all(result.error is not None for result in results))
@@ -0,0 +1,128 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the record and replay transports of the service clients
+"""
+
+import gzip
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from tungsten_tempest_plugin.services.contrail.json import cassette
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+# Records interactions into the cassette at argv[1] as worker argv[2]
+WORKER = """
+import sys
+from tungsten_tempest_plugin.services.contrail.json import cassette
+recorder = cassette.get_cassette(sys.argv[1])
+for i in range(200):
+    recorder.record('GET /%s/%d' % (sys.argv[2], i), 200, {}, 'x' * 100)
+"""
+
+
+class CassetteTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(CassetteTest, self).setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'cassette.jsonl')
+
+    def _client(self, transport, path):
+        return self.make_client(virtual_network_client.VirtualNetworkClient,
+                                transport=transport, cassette_path=path)
+
+    def _exercise(self, client, name):
+        body = client.create_virtual_networks(
+            parent_type='project', fq_name=PROJECT_FQ_NAME + [name])
+        net = body['virtual-network']
+        _, shown = client.show_virtual_network(net['uuid'])
+        client.delete_virtual_network(net['uuid'])
+        return net, shown
+
+    def _round_trip(self, path):
+        recorder = cassette.Cassette(path)
+        client = self._client('record', path)
+        client.http_obj.cassette = recorder
+        net, shown = self._exercise(client, 'net-123456')
+        recorder.close()
+
+        # Replay without a server and with another rand_name suffix
+        self.server.stop()
+        client = self._client('replay', path)
+        client.http_obj.cassette = cassette.Cassette(path)
+        body = client.create_virtual_networks(
+            parent_type='project', fq_name=PROJECT_FQ_NAME + ['net-654321'])
+        self.assertEqual(net, body['virtual-network'])
+        _, body = client.show_virtual_network(net['uuid'])
+        self.assertEqual(shown, body)
+        self.assertRaises(cassette.CassetteMiss,
+                          client.list_virtual_networks)
+
+    def test_round_trip(self):
+        self._round_trip(self.path)
+
+    def test_round_trip_gzip(self):
+        self._round_trip(self.path + '.gz')
+        with io.open(self.path + '.gz', 'rb') as f:
+            data = f.read()
+        # The whole run is a single gzip member
+        self.assertEqual(1, data.count(b'\x1f\x8b\x08'))
+        with gzip.open(self.path + '.gz', 'rt') as f:
+            self.assertEqual(3, len(f.readlines()))
+
+    def test_record_truncates_once(self):
+        with io.open(self.path, 'w') as f:
+            f.write(u'stale line\n')
+        # Left by an earlier run
+        os.utime(self.path, (0, 0))
+        recorder = cassette.Cassette(self.path)
+        client = self._client('record', self.path)
+        client.http_obj.cassette = recorder
+        self._exercise(client, 'net-1')
+        self._exercise(client, 'net-2')
+        recorder.close()
+        with io.open(self.path) as f:
+            lines = f.readlines()
+        self.assertEqual(6, len(lines))
+        self.assertNotIn(u'stale line\n', lines)
+        self.assertFalse(os.path.exists(recorder.worker_path))
+
+    def test_workers_recording_into_one_path(self):
+        path = self.path + '.gz'
+        workers = [subprocess.Popen([sys.executable, '-c', WORKER, path,
+                                     str(worker)])
+                   for worker in range(2)]
+        self.assertEqual([0, 0], [worker.wait() for worker in workers])
+        with io.open(path, 'rb') as f:
+            self.assertEqual(1, f.read().count(b'\x1f\x8b\x08'))
+        replayed = cassette.Cassette(path)
+        for worker in range(2):
+            for i in range(200):
+                self.assertIsNotNone(
+                    replayed.replay('GET /%d/%d' % (worker, i)))
+        # The worker files are merged and removed
+        self.assertEqual([], [name for name in os.listdir(
+            os.path.dirname(path)) if name.split('.')[-1].isdigit()])
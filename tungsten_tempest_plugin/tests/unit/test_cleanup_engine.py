@@ -0,0 +1,170 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the dependency ordered cleanup engine of the RBAC base class
+"""
+
+from tempest.lib import exceptions as lib_exc
+
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+
+class FakeManager(object):
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class CleanupEngineTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(CleanupEngineTest, self).setUp()
+        self.client = self.make_client(
+            virtual_network_client.VirtualNetworkClient, pool_size=4)
+        self.engine = rbac_base.CleanupEngine(max_workers=4)
+
+    def _create(self, resource_type, name, parent=None, **kwargs):
+        parent_type, parent_fq_name = parent or ('project', PROJECT_FQ_NAME)
+        return self.client.create_resource(resource_type, dict(
+            kwargs, parent_type=parent_type,
+            fq_name=parent_fq_name + [name]))[resource_type]
+
+    def _queue_delete(self, resource_type, obj):
+        self.engine.add(self.client.delete_resource, resource_type,
+                        obj['uuid'])
+
+    def test_deletes_in_dependency_order(self):
+        initial = self.server.objects
+        ipam = self._create('network-ipam', 'ipam')
+        net = self._create('virtual-network', 'net', network_ipam_refs=[
+            {'to': ipam['fq_name'], 'attr': {'ipam_subnets': []}}])
+        pool = self._create('floating-ip-pool', 'pool',
+                            parent=('virtual-network', net['fq_name']))
+        # Queued parents first, as tests add their cleanups while creating
+        self._queue_delete('network-ipam', ipam)
+        self._queue_delete('virtual-network', net)
+        self._queue_delete('floating-ip-pool', pool)
+        self._queue_delete('virtual-network', {'uuid': 'deleted-already'})
+
+        start = len(self.server.request_log)
+        self.assertEqual([], self.engine.run())
+        self.assertEqual(initial, self.server.objects)
+        # Children and referring objects first
+        self.assertEqual(
+            [('DELETE', '/floating-ip-pool/%s' % pool['uuid']),
+             ('DELETE', '/virtual-network/%s' % net['uuid']),
+             ('DELETE', '/network-ipam/%s' % ipam['uuid']),
+             ('DELETE', '/virtual-network/deleted-already')],
+            self.server.request_log[start:])
+        # The queue is emptied by run
+        self.assertEqual([], self.engine.run())
+
+    def test_tracking_pruned_on_delete(self):
+        net = self._create('virtual-network', 'tracked-net')
+        fq_name = tuple(net['fq_name'])
+        self.assertEqual(net['uuid'], rbac_base._CREATED_NAMES[fq_name])
+        self._queue_delete('virtual-network', net)
+        self.assertEqual([], self.engine.run())
+        self.assertNotIn(net['uuid'], rbac_base._CREATED)
+        self.assertNotIn(fq_name, rbac_base._CREATED_NAMES)
+
+    def test_independent_deletes_run_concurrently(self):
+        for i in range(4):
+            self._queue_delete('virtual-network',
+                               self._create('virtual-network', 'net-%d' % i))
+        self.server.latency = 0.2
+        self.assertEqual([], self.engine.run())
+        self.assertEqual(4, self.server.peak_requests)
+
+    def test_reports_leaked_resources(self):
+        net = self._create('virtual-network', 'net')
+        self._create('floating-ip-pool', 'pool',
+                     parent=('virtual-network', net['fq_name']))
+        rbac_base.CLEANUP_RETRY_INTERVAL = 0
+        self.addCleanup(setattr, rbac_base, 'CLEANUP_RETRY_INTERVAL', 1)
+        self.engine.retries = 2
+        self._queue_delete('virtual-network', net)
+
+        leaked = self.engine.run()
+        self.assertEqual(1, len(leaked))
+        description, error = leaked[0]
+        self.assertIn(net['uuid'], description)
+        self.assertIsInstance(error, lib_exc.Conflict)
+
+
+class RecordingAuthProvider(fake_config_api.FakeAuthProvider):
+
+    def __init__(self, *args, **kwargs):
+        super(RecordingAuthProvider, self).__init__(*args, **kwargs)
+        self.requests = []
+
+    def auth_request(self, method, url, *args, **kwargs):
+        self.requests.append((method, url.split('?')[0]))
+        return super(RecordingAuthProvider, self).auth_request(
+            method, url, *args, **kwargs)
+
+
+class DeferredDeleteTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(DeferredDeleteTest, self).setUp()
+        self.patch(rbac_base, '_client',
+                   lambda client_class, auth_provider: client_class(
+                       auth_provider, 'sdn', 'region'))
+        self.primary = RecordingAuthProvider(fake_base_url=self.server.url)
+        self.role = RecordingAuthProvider(fake_base_url=self.server.url)
+        self.test_cls = type('FakeTest', (rbac_base.ContrailTest,), {
+            'os_primary': FakeManager(auth_provider=self.primary),
+            'cleanup_engine': rbac_base.CleanupEngine(max_workers=2)})
+        self.addCleanup(setattr, rbac_base._ROLE_CONTEXT, 'auth_provider',
+                        None)
+
+    def _create(self, resource_type, name):
+        return self.test_cls.vn_client.create_resource(resource_type, {
+            'parent_type': 'project',
+            'fq_name': PROJECT_FQ_NAME + [name]})[resource_type]['uuid']
+
+    def test_cleanup_registered_under_role_runs_as_primary(self):
+        initial = self.server.objects
+        net = self._create('virtual-network', 'net')
+        ipam = self._create('network-ipam', 'ipam')
+        # As override_role does with [sdn] role_credentials enabled
+        rbac_base._ROLE_CONTEXT.auth_provider = self.role
+        vn_client = self.test_cls.vn_client
+        self.assertIs(self.role, vn_client.auth_provider)
+        self.test_cls._try_delete_resource(vn_client.delete_virtual_network,
+                                           net)
+        self.test_cls._try_delete_resource(vn_client.delete_resource,
+                                           'network-ipam', ipam)
+        self.test_cls._run_deferred_deletes()
+
+        self.assertEqual([], self.role.requests)
+        self.assertIn(('DELETE', '/virtual-network/%s' % net),
+                      self.primary.requests)
+        self.assertIn(('DELETE', '/network-ipam/%s' % ipam),
+                      self.primary.requests)
+        self.assertEqual(initial, self.server.objects)
+
+    def test_other_deletes_queued_as_given(self):
+        calls = []
+        self.test_cls._try_delete_resource(calls.append, 'id')
+        self.test_cls._run_deferred_deletes()
+        self.assertEqual(['id'], calls)
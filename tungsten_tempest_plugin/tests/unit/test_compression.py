@@ -0,0 +1,57 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the compression of the requests of the base service class
+"""
+
+import json
+
+from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+
+class CompressionTest(fake_config_api.FakeConfigApiTestCase):
+
+    def _round_trip(self, compression):
+        client = self.make_client(base.BaseContrailClient, pool_size=1,
+                                  compression=compression)
+        description = 'compressed ' * 100
+        net = client.create_resource('virtual-network', {
+            'parent_type': 'project',
+            'fq_name': PROJECT_FQ_NAME + ['net-' + compression],
+            'display_name': description})['virtual-network']
+        resp, body = client.resource('virtual-network').show(net['uuid'])
+        self.assertEqual(200, resp.status)
+        self.assertEqual(description,
+                         json.loads(body)['virtual-network']['display_name'])
+
+    def test_none(self):
+        self._round_trip('none')
+        self.assertEqual(0, self.server.gzip_requests)
+        self.assertEqual(0, self.server.gzip_responses)
+
+    def test_response(self):
+        self._round_trip('response')
+        self.assertEqual(0, self.server.gzip_requests)
+        self.assertEqual(2, self.server.gzip_responses)
+
+    def test_request_and_response(self):
+        self._round_trip('request_and_response')
+        # Only the create has a body
+        self.assertEqual(1, self.server.gzip_requests)
+        self.assertEqual(2, self.server.gzip_responses)
@@ -0,0 +1,89 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the recorded test durations and the partitioning based on them
+"""
+
+import os
+import re
+import shutil
+import tempfile
+
+import six
+import testtools
+
+from tungsten_tempest_plugin import durations
+
+PREFIX = 'tungsten_tempest_plugin.tests.api.contrail.'
+
+
+class DurationsTest(testtools.TestCase):
+
+    def setUp(self):
+        super(DurationsTest, self).setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'durations.json')
+
+    def _record(self, class_name, setup, cleanup, *tests):
+        recorder = durations.Recorder()
+        recorder.record_class(PREFIX + class_name, 'setup', setup)
+        recorder.record_class(PREFIX + class_name, 'cleanup', cleanup)
+        for i, seconds in enumerate(tests):
+            recorder.record_test('%s%s.test_%d[id-%d,smoke]' % (
+                PREFIX, class_name, i, i), seconds)
+        recorder.write(self.path)
+
+    def test_runs_are_merged(self):
+        self._record('test_domain.DomainTest', 1, 1, 0.5)
+        self._record('test_routers.RouterTest', 10, 5, 20, 20)
+        self._record('test_domain.DomainTest', 2, 1)
+        costs = durations.class_costs(durations.load(self.path))
+        self.assertEqual({PREFIX + 'test_domain.DomainTest': 3.5,
+                          PREFIX + 'test_routers.RouterTest': 55},
+                         costs)
+
+    def test_partition_balances_cost(self):
+        costs = {'heavy1': 10, 'heavy2': 10, 'light1': 1, 'light2': 1,
+                 'light3': 1}
+        groups = durations.partition(list(costs) + ['unknown'], costs, 2)
+        self.assertEqual([['heavy1', 'light1', 'light3'],
+                          ['heavy2', 'light2', 'unknown']], groups)
+        self.assertEqual([['a']], durations.partition(['a'], {}, 4))
+
+    def test_worker_file(self):
+        self._record('test_domain.DomainTest', 1, 1, 0.5)
+        self._record('test_routers.RouterTest', 10, 5, 20, 20)
+        self._record('test_route.RouteTest', 10, 5, 20)
+        test_list = os.path.join(os.path.dirname(self.path), 'tests.txt')
+        with open(test_list, 'w') as f:
+            f.write('%stest_routers.RouterTest.test_0[id-0]\n'
+                    '%stest_route.RouteTest.test_0\n'
+                    '%stest_domain.DomainTest.test_0\n' % ((PREFIX,) * 3))
+
+        stdout = six.StringIO()
+        self.patch(durations.sys, 'stdout', stdout)
+        durations.main([self.path, '--workers', '2',
+                        '--test-list', test_list])
+        workers = [re.findall(r"- '(.*)'", worker)
+                   for worker in stdout.getvalue().split('- worker:\n')[1:]]
+        self.assertEqual(2, len(workers))
+        self.assertEqual(
+            ['^%s\\.' % re.escape(PREFIX + 'test_routers.RouterTest')],
+            workers[0])
+        test_id = PREFIX + 'test_domain.DomainTest.test_0'
+        self.assertTrue(re.match(workers[1][1], test_id))
+        self.assertFalse(re.match(workers[1][0], test_id))
@@ -0,0 +1,143 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the service clients against the fake config API server
+"""
+
+from oslo_serialization import jsonutils as json
+from tempest.lib import exceptions as lib_exc
+
+from tungsten_tempest_plugin.services.contrail.json import fq_client
+from tungsten_tempest_plugin.services.contrail.json import network_ipams_client
+from tungsten_tempest_plugin.services.contrail.json import project_client
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+
+class FakeConfigApiTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(FakeConfigApiTest, self).setUp()
+        self.vn_client = self.make_client(
+            virtual_network_client.VirtualNetworkClient, pool_size=4)
+        self.ipam_client = self.make_client(
+            network_ipams_client.NetworkIpamsClient)
+        self.project_client = self.make_client(project_client.ProjectClient)
+        self.fq_client = self.make_client(fq_client.FqnameIdClient)
+
+    def _create_network(self, name, **kwargs):
+        return self.vn_client.create_virtual_networks(
+            parent_type='project', fq_name=PROJECT_FQ_NAME + [name],
+            **kwargs)['virtual-network']
+
+    def _show_network(self, uuid):
+        _, body = self.vn_client.show_virtual_network(uuid)
+        return json.loads(body)['virtual-network']
+
+    def _list_networks(self, **kwargs):
+        _, body = self.vn_client.list_virtual_networks(**kwargs)
+        return json.loads(body)['virtual-networks']
+
+    def test_create_show_update_delete(self):
+        net = self._create_network('net', display_name='before')
+        self.assertEqual(PROJECT_FQ_NAME + ['net'], net['fq_name'])
+        self.assertEqual('project', net['parent_type'])
+        self.vn_client.update_virtual_network(net['uuid'],
+                                              display_name='after')
+        self.assertEqual('after', self._show_network(net['uuid'])[
+            'display_name'])
+        self.vn_client.delete_virtual_network(net['uuid'])
+        self.assertRaises(lib_exc.NotFound,
+                          self.vn_client.show_virtual_network, net['uuid'])
+
+    def test_create_conflicts(self):
+        self._create_network('net')
+        self.assertRaises(lib_exc.Conflict, self._create_network, 'net')
+        self.assertRaises(lib_exc.NotFound,
+                          self.vn_client.create_virtual_networks,
+                          parent_type='project',
+                          fq_name=['default-domain', 'missing', 'net'])
+
+    def test_children_and_refs_block_delete(self):
+        ipam = self.ipam_client.create_network_ipams(
+            parent_type='project',
+            fq_name=PROJECT_FQ_NAME + ['ipam'])['network-ipam']
+        net = self._create_network('net', network_ipam_refs=[
+            {'to': ipam['fq_name'], 'attr': {'ipam_subnets': []}}])
+        self.assertEqual(ipam['uuid'], net['network_ipam_refs'][0]['uuid'])
+
+        _, body = self.ipam_client.show_network_ipam(ipam['uuid'])
+        back_refs = json.loads(body)['network-ipam'][
+            'virtual_network_back_refs']
+        self.assertEqual([net['uuid']], [ref['uuid'] for ref in back_refs])
+        self.assertRaises(lib_exc.Conflict,
+                          self.ipam_client.delete_network_ipam, ipam['uuid'])
+        self.assertRaises(lib_exc.Conflict,
+                          self.project_client.delete_project,
+                          net['parent_uuid'])
+
+        self.vn_client.update_virtual_network(net['uuid'],
+                                              network_ipam_refs=[])
+        self.ipam_client.delete_network_ipam(ipam['uuid'])
+
+    def test_delete_drops_back_refs(self):
+        ipam = self.ipam_client.create_network_ipams(
+            parent_type='project',
+            fq_name=PROJECT_FQ_NAME + ['ipam'])['network-ipam']
+        net = self._create_network('net', network_ipam_refs=[
+            {'to': ipam['fq_name'], 'attr': {'ipam_subnets': []}}])
+        self.vn_client.delete_virtual_network(net['uuid'])
+        self.ipam_client.delete_network_ipam(ipam['uuid'])
+
+    def test_list_options_and_paging(self):
+        nets = [self._create_network('net-%d' % i) for i in range(7)]
+        uuids = sorted(net['uuid'] for net in nets)
+        listed = list(self.vn_client.iter_resources('virtual-network',
+                                                    page_limit=3))
+        self.assertEqual(uuids, [net['uuid'] for net in listed])
+
+        listed = self._list_networks(filters={'display_name': 'net-3'})
+        self.assertEqual([nets[3]['uuid']], [net['uuid'] for net in listed])
+
+        listed = self._list_networks(obj_uuids=uuids[:2], detail=True)
+        self.assertEqual(uuids[:2], [net['virtual-network']['uuid']
+                                     for net in listed])
+
+    def test_fqname_to_id(self):
+        net = self._create_network('net')
+        body = self.fq_client.fqname_to_id(type='virtual-network',
+                                           fq_name=net['fq_name'])
+        self.assertEqual(net['uuid'], body['uuid'])
+        body = self.fq_client.id_to_fqname(uuid=net['uuid'])
+        self.assertEqual(net['fq_name'], body['fq_name'])
+        self.assertRaises(lib_exc.NotFound, self.fq_client.fqname_to_id,
+                          type='virtual-network',
+                          fq_name=PROJECT_FQ_NAME + ['missing'])
+
+    def test_concurrent_creates(self):
+        bodies = [{'parent_type': 'project',
+                   'fq_name': PROJECT_FQ_NAME + ['net-%d' % i]}
+                  for i in range(20)]
+        results = self.vn_client.create_many('virtual-network', bodies,
+                                             max_workers=4)
+        self.assertEqual([None] * 20, [result.error for result in results])
+        results = self.vn_client.create_many('virtual-network', bodies[:4],
+                                             max_workers=4)
+        for result in results:
+            self.assertIsInstance(result.error, lib_exc.Conflict)
@@ -0,0 +1,121 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the cached fq_name/uuid resolutions of FqnameIdClient
+"""
+
+import time
+
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from tungsten_tempest_plugin.services.contrail.json import fq_client
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+
+class ResolutionCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ResolutionCacheTest, self).setUp()
+        self.now = 1000.0
+        self.patch(time, 'time', lambda: self.now)
+        self.cache = fq_client.ResolutionCache(2, 10)
+
+    def test_both_directions(self):
+        self.cache.add('u1', 'virtual-network', ['a', 'net'], 'resp')
+        self.assertEqual(('u1', 'resp'),
+                         self.cache.get_uuid('virtual-network', ['a', 'net']))
+        self.assertEqual(('virtual-network', ['a', 'net'], 'resp'),
+                         self.cache.get_fqname('u1'))
+        self.assertIsNone(self.cache.get_uuid('project', ['a', 'net']))
+
+    def test_ttl(self):
+        self.cache.add('u1', 'virtual-network', ['net'], 'resp')
+        self.now += 9
+        self.assertIsNotNone(self.cache.get_fqname('u1'))
+        self.now += 2
+        self.assertIsNone(self.cache.get_fqname('u1'))
+        self.assertIsNone(self.cache.get_uuid('virtual-network', ['net']))
+
+    def test_lru_eviction(self):
+        self.cache.add('u1', 'virtual-network', ['net1'], 'resp')
+        self.cache.add('u2', 'virtual-network', ['net2'], 'resp')
+        # Using u1 makes u2 the least recently used entry
+        self.cache.get_uuid('virtual-network', ['net1'])
+        self.cache.add('u3', 'virtual-network', ['net3'], 'resp')
+        self.assertIsNotNone(self.cache.get_fqname('u1'))
+        self.assertIsNone(self.cache.get_fqname('u2'))
+        self.assertIsNone(self.cache.get_uuid('virtual-network', ['net2']))
+        self.assertIsNotNone(self.cache.get_fqname('u3'))
+
+    def test_invalidate(self):
+        self.cache.add('u1', 'virtual-network', ['net'], 'resp')
+        self.cache.invalidate('virtual-network', 'u1')
+        self.assertIsNone(self.cache.get_fqname('u1'))
+        self.assertIsNone(self.cache.get_uuid('virtual-network', ['net']))
+
+
+class FqnameIdClientTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(FqnameIdClientTest, self).setUp()
+        self.vn_client = self.make_client(
+            virtual_network_client.VirtualNetworkClient)
+        self.fq_client = self.make_client(fq_client.FqnameIdClient,
+                                          cache_size=100, cache_ttl=60)
+        self.addCleanup(fq_client._CACHES.clear)
+
+    def _create_network(self, name):
+        return self.vn_client.create_virtual_networks(
+            parent_type='project',
+            fq_name=PROJECT_FQ_NAME + [name])['virtual-network']
+
+    def test_cached_until_deleted(self):
+        net = self._create_network('net')
+        self.assertEqual(net['uuid'], self.fq_client.fqname_to_id(
+            type='virtual-network', fq_name=net['fq_name'])['uuid'])
+        # Deleted behind the clients' back, the resolution is still cached
+        self.server.store.delete('virtual-network', net['uuid'])
+        self.assertEqual(net['fq_name'], self.fq_client.id_to_fqname(
+            uuid=net['uuid'])['fq_name'])
+
+        net = self._create_network('other-net')
+        self.fq_client.fqname_to_id(type='virtual-network',
+                                    fq_name=net['fq_name'])
+        # A delete through any client invalidates the resolution
+        self.vn_client.delete_virtual_network(net['uuid'])
+        self.assertRaises(lib_exc.NotFound, self.fq_client.fqname_to_id,
+                          type='virtual-network', fq_name=net['fq_name'])
+
+    def test_bulk_resolution(self):
+        nets = [self._create_network('net-%d' % i) for i in range(3)]
+        names = [{'type': 'virtual-network', 'fq_name': net['fq_name']}
+                 for net in nets]
+        names.append({'type': 'virtual-network',
+                      'fq_name': PROJECT_FQ_NAME + ['missing']})
+        results = self.fq_client.fqnames_to_ids(names, max_workers=2)
+        self.assertEqual([net['uuid'] for net in nets],
+                         [result.result['uuid'] for result in results[:3]])
+        self.assertIsInstance(results[3].error, lib_exc.NotFound)
+
+        results = self.fq_client.ids_to_fqnames(
+            [net['uuid'] for net in nets])
+        self.assertEqual([net['fq_name'] for net in nets],
+                         [result.result['fq_name'] for result in results])
@@ -0,0 +1,93 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Import time benchmark of the plugin's test modules
+
+Listing the tests imports every test module.  Most of the time goes to
+tempest's configuration and patrole, which the tests need at import time
+for their decorators; what the plugin's own modules add is kept small,
+both in time and in modules of other packages imported on top of those
+patrole's decorators need anyway.
+"""
+
+import collections
+import subprocess
+import sys
+
+from testtools import content
+import testtools
+
+MODULE = 'tungsten_tempest_plugin.tests.api.contrail.test_virtual_networks'
+
+PACKAGE = 'tungsten_tempest_plugin'
+
+# Module every test module imports for rbac_rule_validation.action
+DECORATOR_MODULE = 'patrole_tempest_plugin.rbac_rule_validation'
+
+# Share of the import time the plugin's own modules may take
+MAX_PLUGIN_SHARE = 0.15
+
+# Seconds the plugin's own modules may take, about three times what they
+# take on a developer machine
+MAX_PLUGIN_SECONDS = 0.2
+
+# Modules of other packages the plugin may import on top of those of
+# DECORATOR_MODULE
+MAX_EXTRA_MODULES = 10
+
+
+def import_times(module):
+    """Import module in a fresh interpreter
+
+    :return: dict of the imported module name -> (seconds spent in the
+             module itself, seconds including its imports)
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stderr=subprocess.STDOUT)
+    times = collections.OrderedDict()
+    for line in output.decode('utf-8').splitlines():
+        if line.startswith('import time:') and '|' in line:
+            own, cumulative, name = line[len('import time:'):].split('|')
+            if own.strip().isdigit():
+                times[name.strip()] = (int(own) / 1e6, int(cumulative) / 1e6)
+    return times
+
+
+@testtools.skipIf(sys.version_info < (3, 7), "needs -X importtime")
+class ImportTimeTest(testtools.TestCase):
+
+    def test_import_test_module(self):
+        times = import_times(MODULE)
+        total = times[MODULE][1]
+        plugin = sum(own for name, (own, _) in times.items()
+                     if name.split('.')[0] == PACKAGE)
+        slowest = sorted(times.items(), key=lambda item: -item[1][1])[:15]
+        self.addDetail('import-seconds', content.text_content(
+            'total %.3f, %s modules %.3f\n%s' % (
+                total, PACKAGE, plugin, '\n'.join(
+                    '%.3f %s' % (cumulative, name)
+                    for name, (_, cumulative) in slowest))))
+        self.assertLess(plugin, total * MAX_PLUGIN_SHARE)
+        self.assertLess(plugin, MAX_PLUGIN_SECONDS)
+
+    def test_no_heavy_imports(self):
+        needed = import_times(DECORATOR_MODULE)
+        extra = [name for name in import_times(MODULE)
+                 if name not in needed and name.split('.')[0] != PACKAGE]
+        self.addDetail('extra-modules', content.text_content(
+            '\n'.join(extra)))
+        self.assertLessEqual(len(extra), MAX_EXTRA_MODULES)
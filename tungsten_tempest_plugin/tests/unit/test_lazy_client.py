@@ -0,0 +1,87 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the Contrail clients the RBAC base class builds on first access
+"""
+
+import testtools
+
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+
+
+class FakeClient(object):
+
+    def __init__(self, auth_provider, *args, **kwargs):
+        self.auth_provider = auth_provider
+
+
+class FakeCredentials(dict):
+    ATTRIBUTES = ['username', 'project_id']
+
+    @property
+    def tenant_id(self):
+        return self['project_id']
+
+
+class FakeAuthProvider(object):
+
+    def __init__(self, username, project_id):
+        self.credentials = FakeCredentials(username=username,
+                                           project_id=project_id)
+
+
+class FakeManager(object):
+
+    def __init__(self, auth_provider):
+        self.auth_provider = auth_provider
+
+
+def _test_class(username, project_id):
+    return type('FakeTest', (object,), {
+        'os_primary': FakeManager(FakeAuthProvider(username, project_id)),
+        'fake_client': rbac_base._LazyClient(FakeClient)})
+
+
+class LazyClientTest(testtools.TestCase):
+
+    def setUp(self):
+        super(LazyClientTest, self).setUp()
+        self.patch(rbac_base, '_CLIENTS', {})
+
+    def test_created_on_first_access(self):
+        test_cls = _test_class('user', 'p1')
+        self.assertEqual({}, rbac_base._CLIENTS)
+        client = test_cls.fake_client
+        self.assertIsInstance(client, FakeClient)
+        self.assertIs(test_cls.os_primary.auth_provider,
+                      client.auth_provider)
+        self.assertEqual(1, len(rbac_base._CLIENTS))
+
+    def test_reused_by_classes_with_same_credentials(self):
+        first, second = _test_class('user', 'p1'), _test_class('user', 'p1')
+        client = first.fake_client
+        self.assertIs(client, first.fake_client)
+        self.assertIs(client, second.fake_client)
+        self.assertIsNot(client, _test_class('other', 'p1').fake_client)
+        self.assertEqual(2, len(rbac_base._CLIENTS))
+
+    def test_forget_clients_of_project(self):
+        first, second = _test_class('user', 'p1'), _test_class('user', 'p2')
+        client = first.fake_client
+        second.fake_client
+        rbac_base._forget_clients('p1')
+        self.assertEqual(1, len(rbac_base._CLIENTS))
+        self.assertIsNot(client, first.fake_client)
@@ -0,0 +1,104 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the test manifest built from the sources of the test modules
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import testtools
+
+from tungsten_tempest_plugin import manifest
+from tungsten_tempest_plugin import plugin
+from tungsten_tempest_plugin.tests.api.contrail import test_floating_ip
+from tungsten_tempest_plugin.tests.api.contrail import test_virtual_networks
+
+
+def _test_ids(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            for test_id in _test_ids(test):
+                yield test_id
+        else:
+            yield test.id()
+
+
+class ManifestTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ManifestTest, self).setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.test_dir, self.top_dir = plugin.TungstenTempestPlugin(
+        ).load_tests()
+
+    def test_ids_match_loaded_tests(self):
+        tests = manifest.load(self.test_dir, self.top_dir, self.cache_dir)
+        ids = set(test['id'] for test in tests)
+        loader = unittest.TestLoader()
+        for module in (test_floating_ip, test_virtual_networks):
+            loaded = set(_test_ids(loader.loadTestsFromModule(module)))
+            self.assertEqual(
+                loaded, set(test_id for test_id in ids
+                            if test_id.startswith(module.__name__ + '.')))
+
+    def test_ids_match_discovered_tests(self):
+        # Neither tempest's discovery nor the manifest include unit tests
+        tests = manifest.load(self.test_dir, self.top_dir, self.cache_dir)
+        discovered = set(_test_ids(unittest.TestLoader().discover(
+            self.test_dir, top_level_dir=self.top_dir)))
+        self.assertEqual(discovered, set(test['id'] for test in tests))
+        self.assertFalse([test_id for test_id in discovered
+                          if '.tests.unit.' in test_id])
+
+    def test_rules(self):
+        tests = manifest.select(
+            manifest.load(self.test_dir, self.top_dir, self.cache_dir),
+            rules=['create_virtual_networks'])
+        self.assertEqual(
+            ['tungsten_tempest_plugin.tests.api.contrail.'
+             'test_virtual_networks.NetworksTest.'
+             'test_create_virtual_networks'],
+            [test['id'].split('[')[0] for test in tests])
+        self.assertEqual('Contrail', tests[0]['service'])
+        self.assertEqual(2, len(tests[0]['idempotent_ids']))
+
+    def test_cached_until_sources_change(self):
+        test_dir = os.path.join(self.cache_dir, 'tests')
+        os.mkdir(test_dir)
+        path = os.path.join(test_dir, 'test_x.py')
+        with open(path, 'w') as f:
+            f.write('class XTest(object):\n'
+                    '    @rbac_rule_validation.action(rules=["x"])\n'
+                    '    def test_x(self):\n'
+                    '        pass\n')
+        tests = manifest.load(test_dir, self.cache_dir, self.cache_dir)
+        self.assertEqual([{'id': 'tests.test_x.XTest.test_x',
+                           'idempotent_ids': [], 'rules': ['x'],
+                           'service': None}], tests)
+
+        # A cached manifest is not rebuilt
+        self.patch(manifest, 'build', lambda *args: self.fail("rebuilt"))
+        self.assertEqual(tests, manifest.load(test_dir, self.cache_dir,
+                                              self.cache_dir))
+        with open(path, 'a') as f:
+            f.write('\n    def test_y(self):\n'
+                    '        pass\n')
+        self.assertRaises(AssertionError, manifest.load, test_dir,
+                          self.cache_dir, self.cache_dir)
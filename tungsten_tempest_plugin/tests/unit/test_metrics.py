@@ -0,0 +1,138 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the latency histograms and the merging of the worker summaries
+"""
+
+import os
+import random
+import shutil
+import tempfile
+
+import testtools
+
+from tungsten_tempest_plugin import metrics
+
+NET_URL = 'http://localhost:8082/virtual-networks'
+NET_UUID_URL = ('http://localhost:8082/virtual-network/'
+                '0b0f7a52-5a13-4a5f-9b3b-0d8a6f0b6a01')
+
+
+class HistogramTest(testtools.TestCase):
+
+    def test_small_values_exact(self):
+        for value in range(64):
+            index = metrics.Histogram._index(value)
+            self.assertEqual(value, index)
+            self.assertEqual(value, metrics.Histogram._upper_bound(index))
+
+    def test_bucket_boundaries(self):
+        # Buckets are contiguous: every value lies above the upper bound
+        # of the previous bucket and at or below the one of its own
+        for value in range(1, 1 << 16):
+            index = metrics.Histogram._index(value)
+            upper = metrics.Histogram._upper_bound(index)
+            self.assertTrue(
+                metrics.Histogram._upper_bound(index - 1) < value <= upper,
+                value)
+
+    def test_bucket_width(self):
+        self.assertEqual(metrics.Histogram._index(64),
+                         metrics.Histogram._index(65))
+        self.assertNotEqual(metrics.Histogram._index(65),
+                            metrics.Histogram._index(66))
+        self.assertEqual(131, metrics.Histogram._upper_bound(
+            metrics.Histogram._index(128)))
+
+    def test_percentile_accuracy(self):
+        rand = random.Random(42)
+        values = [rand.randint(0, 5000000) for _ in range(10000)]
+        histogram = metrics.Histogram()
+        for value in values:
+            histogram.record(value)
+        values.sort()
+        for percent in (1, 50, 95, 99, 100):
+            rank = max(1, int(round(len(values) * percent / 100.0)))
+            exact = values[rank - 1]
+            estimate = histogram.percentile(percent)
+            self.assertTrue(exact <= estimate <= exact * 1.04,
+                            (percent, exact, estimate))
+        self.assertEqual(values[-1], histogram.percentile(100))
+
+    def test_empty(self):
+        self.assertEqual(0, metrics.Histogram().percentile(99))
+
+    def test_merge(self):
+        first, second, both = (metrics.Histogram(), metrics.Histogram(),
+                               metrics.Histogram())
+        for value in range(0, 1000, 3):
+            first.record(value)
+            both.record(value)
+        for value in range(5000, 9000, 7):
+            second.record(value)
+            both.record(value)
+        first.merge(second)
+        self.assertEqual(both.count, first.count)
+        self.assertEqual(both.max, first.max)
+        self.assertEqual(dict(both.buckets), dict(first.buckets))
+
+
+class RecorderTest(testtools.TestCase):
+
+    def test_operation(self):
+        self.assertEqual('virtual-network/LIST',
+                         metrics.Recorder.operation('GET', NET_URL))
+        self.assertEqual('virtual-network/POST',
+                         metrics.Recorder.operation('POST', NET_URL))
+        self.assertEqual('virtual-network/GET',
+                         metrics.Recorder.operation('GET', NET_UUID_URL))
+        self.assertEqual('virtual-network/DELETE',
+                         metrics.Recorder.operation('DELETE', NET_UUID_URL))
+
+    def test_merge(self):
+        first, second = metrics.Recorder(), metrics.Recorder()
+        first.record('POST', NET_URL, 200, 0.002, 100, 300)
+        second.record('POST', NET_URL, 409, 0.004, 50, 30)
+        second.record('GET', NET_URL, 200, 0.001, 0, 1000)
+        first.merge(second)
+        summary = first.to_dict()
+        self.assertEqual(['virtual-network/LIST', 'virtual-network/POST'],
+                         sorted(summary))
+        create = summary['virtual-network/POST']
+        self.assertEqual(2, create['count'])
+        self.assertEqual({'200': 1, '409': 1}, create['statuses'])
+        self.assertEqual(150, create['request_bytes'])
+        self.assertEqual(330, create['response_bytes'])
+        self.assertEqual(4.0, create['max_ms'])
+        self.assertEqual(1, summary['virtual-network/LIST']['count'])
+
+    def test_load(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        both = metrics.Recorder()
+        paths = []
+        for worker, seconds in enumerate((0.002, 0.5)):
+            recorder = metrics.Recorder()
+            for _ in range(worker + 1):
+                recorder.record('POST', NET_URL, 200, seconds, 10, 20)
+                both.record('POST', NET_URL, 200, seconds, 10, 20)
+            recorder.record('DELETE', NET_UUID_URL, 404, seconds, 0, 0)
+            both.record('DELETE', NET_UUID_URL, 404, seconds, 0, 0)
+            prefix = os.path.join(directory, 'metrics.%d' % worker)
+            recorder.write(prefix)
+            self.assertTrue(os.path.exists(prefix + '.csv'))
+            paths.append(prefix + '.json')
+        self.assertEqual(both.to_dict(), metrics.load(paths).to_dict())
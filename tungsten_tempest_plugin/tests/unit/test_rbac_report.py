@@ -0,0 +1,96 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the JSON Lines RBAC report
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import testtools
+
+from tungsten_tempest_plugin import rbac_report
+
+
+class JsonLinesHandlerTest(testtools.TestCase):
+
+    def setUp(self):
+        super(JsonLinesHandlerTest, self).setUp()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'tungsten.log')
+        self.logger = logging.getLogger('rbac_reporting.test')
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def _handler(self, roles):
+        handler = rbac_report.JsonLinesHandler(self.path, roles)
+        self.logger.addHandler(handler)
+        self.addCleanup(self.logger.removeHandler, handler)
+        return handler
+
+    def _log(self, test, actual):
+        self.logger.info(
+            "[Service]: %s, [Test]: %s, [Rules]: %s, [Expected]: %s, "
+            "[Actual]: %s", 'Contrail', test,
+            'create_projects, list_projects', 'Allowed', actual)
+
+    def _report(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_records_are_merged_into_report(self):
+        handler = self._handler(['member'])
+        rbac_report.test_started()
+        self._log('test_create', 'Allowed')
+        self.logger.info("free form %s", 'message')
+        self.assertFalse(os.path.exists(self.path))
+        handler.close()
+
+        first, second = self._report()
+        self.assertEqual('test_create', first['test'])
+        self.assertEqual(['create_projects', 'list_projects'],
+                         first['rules'])
+        self.assertEqual(['member'], first['role'])
+        self.assertEqual(os.getpid(), first['worker'])
+        self.assertGreaterEqual(first['duration'], 0)
+        self.assertEqual('free form message', second['message'])
+
+    def test_worker_files_are_merged_in_time_order(self):
+        handler = self._handler(['member'])
+        self._log('test_1', 'Allowed')
+        # Merged by a worker that exited already
+        with open(self.path, 'w') as f:
+            f.write(json.dumps({'timestamp': 0, 'test': 'test_0'}) + '\n')
+        self._log('test_2', 'Denied')
+        handler.close()
+        self.assertEqual(['test_0', 'test_1', 'test_2'],
+                         [record['test'] for record in self._report()])
+        self.assertFalse(os.path.exists(handler.worker_path))
+
+    def test_roles_in_effect(self):
+        handler = self._handler(['member'])
+        rbac_report.test_started()
+        rbac_report.roles_switched(['reader'])
+        self._log('test_matrix', 'Denied')
+        rbac_report.test_started()
+        self._log('test_default', 'Allowed')
+        handler.close()
+        self.assertEqual([['reader'], ['member']],
+                         [record['role'] for record in self._report()])
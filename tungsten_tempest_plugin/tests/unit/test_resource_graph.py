@@ -0,0 +1,97 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the declarative fixture graph of the RBAC base class
+"""
+
+from tempest.lib import exceptions as lib_exc
+
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT = ('project', ['default-domain', 'default-project'])
+
+SPEC = {
+    'ipam': {'type': 'network-ipam', 'parent': PROJECT},
+    'net': {'type': 'virtual-network', 'parent': PROJECT,
+            'refs': {'network_ipam_refs': [('ipam', {'ipam_subnets': []})]},
+            'body': {'display_name': 'graph-net'}},
+    'pool': {'type': 'floating-ip-pool', 'parent': 'net'},
+    'gsc': {'type': 'global-system-config'},
+    'vrouter': {'type': 'virtual-router', 'parent': 'gsc'},
+    'prouter': {'type': 'physical-router', 'parent': 'gsc'},
+}
+
+
+class ResourceGraphTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(ResourceGraphTest, self).setUp()
+        self.client = self.make_client(
+            virtual_network_client.VirtualNetworkClient, pool_size=4)
+
+    def test_create_and_delete(self):
+        initial = self.server.objects
+        graph = rbac_base.ResourceGraph(self.client, SPEC)
+        objs = graph.create()
+        self.assertEqual(initial + len(SPEC), self.server.objects)
+        self.assertEqual(objs['net']['fq_name'] + [objs['pool']['name']],
+                         objs['pool']['fq_name'])
+        self.assertEqual(objs['ipam']['uuid'],
+                         objs['net']['network_ipam_refs'][0]['uuid'])
+        self.assertEqual('graph-net', objs['net']['display_name'])
+        self.assertEqual('config-root', objs['gsc']['parent_type'])
+
+        graph.delete()
+        self.assertEqual(initial, self.server.objects)
+        self.assertEqual({}, graph.objects)
+        # Deleting again is a no-op
+        graph.delete()
+
+    def test_independent_branches_run_concurrently(self):
+        self.server.latency = 0.2
+        graph = rbac_base.ResourceGraph(self.client, SPEC, max_workers=4)
+        graph.create()
+        # Objects are created once their parent and refs exist, several
+        # at a time
+        log = [path.split('/')[1]
+               for method, path in self.server.request_log
+               if method == 'POST']
+        self.assertLess(log.index('network-ipams'),
+                        log.index('virtual-networks'))
+        self.assertLess(log.index('virtual-networks'),
+                        log.index('floating-ip-pools'))
+        self.assertLess(log.index('global-system-configs'),
+                        log.index('virtual-routers'))
+        self.assertGreater(self.server.peak_requests, 1)
+        graph.delete()
+
+    def test_failed_create_deletes_created_objects(self):
+        initial = self.server.objects
+        spec = dict(SPEC, broken={'type': 'virtual-network',
+                                  'parent': ('project', ['missing'])})
+        graph = rbac_base.ResourceGraph(self.client, spec)
+        self.assertRaises(lib_exc.NotFound, graph.create)
+        self.assertEqual(initial, self.server.objects)
+
+    def test_invalid_spec(self):
+        self.assertRaises(ValueError, rbac_base.ResourceGraph, self.client,
+                          {'a': {'type': 'virtual-network', 'parent': 'b'}})
+        self.assertRaises(ValueError, rbac_base.ResourceGraph, self.client,
+                          {'a': {'type': 'x', 'parent': 'b'},
+                           'b': {'type': 'y', 'refs': {'x_refs': ['a']}}})
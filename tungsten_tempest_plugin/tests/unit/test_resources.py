@@ -0,0 +1,146 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the service classes built from the resource registry
+"""
+
+import importlib
+import inspect
+import pkgutil
+
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from tungsten_tempest_plugin.services.contrail import json as json_services
+from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.services.contrail.json import resources
+from tungsten_tempest_plugin.services.contrail.json import \
+    security_group_client
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+
+def _client_classes():
+    classes = {}
+    for _, name, _ in pkgutil.iter_modules(json_services.__path__):
+        if name.endswith('_client'):
+            module = importlib.import_module(
+                '%s.%s' % (json_services.__name__, name))
+            for value in vars(module).values():
+                if (isinstance(value, type)
+                        and issubclass(value, base.BaseContrailClient)
+                        and value.__module__ == module.__name__):
+                    classes[value.__name__] = value
+    return classes
+
+
+class ResourceRegistryTest(testtools.TestCase):
+
+    def test_registered_methods(self):
+        classes = _client_classes()
+        types = set()
+        for resource in resources.RESOURCES:
+            self.assertNotIn(resource.resource_type, types)
+            types.add(resource.resource_type)
+            client_class = classes[resource.client]
+            for name in resource.methods():
+                self.assertTrue(callable(getattr(client_class, name, None)),
+                                '%s.%s' % (resource.client, name))
+        self.assertEqual(
+            set(classes) - set(['FqnameIdClient']),
+            set(resource.client for resource in resources.RESOURCES))
+
+    def test_method_names(self):
+        resource = resources.Resource(
+            'virtual-DNS', 'VirtualDNSClient', plural='virtual_dns',
+            names={'create': 'create_dns'})
+        self.assertEqual(['create_dns', 'delete_virtual_dns',
+                          'iter_virtual_dns', 'list_virtual_dns',
+                          'show_virtual_dns', 'update_virtual_dns'],
+                         sorted(resource.methods()))
+
+    def test_signatures(self):
+        client_class = security_group_client.SecurityGroupClient
+        self.assertEqual(
+            ['self', 'sec_group_id', 'params', 'fields'],
+            list(inspect.signature(
+                client_class.show_security_group).parameters))
+        self.assertEqual(
+            ['self', 'sec_group_id', 'kwargs'],
+            list(inspect.signature(
+                client_class.update_security_group).parameters))
+        delete = client_class.delete_security_group
+        self.assertEqual(['self', 'sec_group_id'],
+                         list(inspect.signature(delete).parameters))
+        self.assertEqual('SecurityGroupClient.delete_security_group',
+                         delete.__qualname__)
+        self.assertEqual(security_group_client.__name__, delete.__module__)
+        self.assertIn(':param sec_group_id:', delete.__doc__)
+
+
+class ResourceClientTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(ResourceClientTest, self).setUp()
+        self.vn_client = self.make_client(
+            virtual_network_client.VirtualNetworkClient, pool_size=4)
+        self.sg_client = self.make_client(
+            security_group_client.SecurityGroupClient)
+
+    def _create_network(self, name):
+        return self.vn_client.create_virtual_networks(
+            parent_type='project',
+            fq_name=PROJECT_FQ_NAME + [name])['virtual-network']
+
+    def test_return_types(self):
+        net = self._create_network('net')
+        # Network reads return the response and body, updates a
+        # ResponseBody, as they always did
+        resp, _ = self.vn_client.show_virtual_network(net['uuid'])
+        self.assertEqual(200, resp.status)
+        self.assertIsInstance(self.vn_client.update_virtual_network(
+            net['uuid'], display_name='net'), base.ResponseBody)
+        self.assertIsInstance(self.vn_client.list_virtual_networks(),
+                              tuple)
+
+    def test_uuid_by_name(self):
+        group = self.sg_client.create_security_groups(
+            parent_type='project',
+            fq_name=PROJECT_FQ_NAME + ['sg'])['security-group']
+        self.sg_client.update_security_group(sec_group_id=group['uuid'],
+                                             display_name='renamed')
+        resource = self.vn_client.resource('security-group')
+        _, body = resource.show(group['uuid'], {'fields': 'display_name'})
+        self.assertEqual('renamed', base.ResponseBody(None, body)[
+            'security-group']['display_name'])
+        self.assertRaises(TypeError, self.sg_client.delete_security_group)
+        self.assertRaises(TypeError, self.sg_client.delete_security_group,
+                          group['uuid'], 'extra')
+        self.sg_client.delete_security_group(sec_group_id=group['uuid'])
+        self.assertRaises(lib_exc.NotFound, self.sg_client.show_security_group,
+                          group['uuid'])
+
+    def test_iter(self):
+        uuids = set(self._create_network('net-%d' % i)['uuid']
+                    for i in range(5))
+        self.assertIs(self.vn_client.resource('virtual-network'),
+                      self.vn_client.resource('virtual-network'))
+        listed = set(obj['uuid'] for obj in
+                     self.vn_client.iter_virtual_networks(page_limit=2))
+        self.assertTrue(uuids.issubset(listed))
@@ -0,0 +1,82 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the lazily decoded response bodies of the base service class
+"""
+
+import copy
+import json
+
+import testtools
+
+from tungsten_tempest_plugin.services.contrail.json import base
+
+RAW = b'{"virtual-network": {"uuid": "net-uuid", "name": "net"}}'
+DECODED = {'virtual-network': {'uuid': 'net-uuid', 'name': 'net'}}
+
+
+class ResponseBodyTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ResponseBodyTest, self).setUp()
+        self.decoded = []
+        loads = base._json_loads
+
+        def counting_loads(raw):
+            self.decoded.append(raw)
+            return loads(raw)
+
+        base.set_json_decoder(counting_loads)
+        self.addCleanup(base.set_json_decoder, loads)
+
+    def test_decoded_on_first_read(self):
+        body = base.ResponseBody('resp', RAW)
+        self.assertEqual([], self.decoded)
+        self.assertEqual('net', body['virtual-network']['name'])
+        self.assertIn('virtual-network', body)
+        self.assertEqual(1, len(body))
+        self.assertEqual([RAW], self.decoded)
+        self.assertEqual('resp', body.response)
+
+    def test_never_read_never_decoded(self):
+        base.ResponseBody('resp', RAW)
+        self.assertEqual([], self.decoded)
+
+    def test_passes_for_dict(self):
+        body = base.ResponseBody('resp', RAW)
+        self.assertIsInstance(body, dict)
+        self.assertEqual(DECODED, json.loads(json.dumps(body)))
+        self.assertEqual(DECODED, base.ResponseBody('resp', RAW).copy())
+        self.assertEqual(DECODED, dict(base.ResponseBody('resp', RAW)))
+        self.assertEqual(DECODED,
+                         copy.deepcopy(base.ResponseBody('resp', RAW)))
+        self.assertEqual(base.ResponseBody('resp', RAW), DECODED)
+        self.assertEqual(DECODED, base.ResponseBody('resp', RAW))
+        self.assertEqual(base.ResponseBody('resp', RAW),
+                         base.ResponseBody('other', RAW))
+
+    def test_updates(self):
+        body = base.ResponseBody('resp', RAW, extra=1)
+        self.assertEqual(1, body['extra'])
+        body['other'] = 2
+        del body['virtual-network']
+        self.assertEqual({'extra': 1, 'other': 2}, body)
+
+    def test_decoded_body_and_empty_body(self):
+        self.assertEqual(DECODED, base.ResponseBody('resp', DECODED))
+        self.assertEqual({}, base.ResponseBody('resp', b''))
+        self.assertEqual({}, base.ResponseBody('resp'))
+        self.assertEqual([], self.decoded)
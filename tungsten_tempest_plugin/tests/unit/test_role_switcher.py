@@ -0,0 +1,253 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the role switching, role credentials and role matrix of the RBAC
+base class
+"""
+
+from tempest import config
+import testtools
+
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+
+CONF = config.CONF
+
+ROLES = {'admin': 'admin-id', 'member': 'member-id'}
+
+
+class FakeRolesClient(object):
+
+    def __init__(self, assigned):
+        self.assigned = set(assigned)
+        self.calls = []
+
+    def list_roles(self):
+        self.calls.append('list_roles')
+        return {'roles': [{'name': name, 'id': role_id}
+                          for name, role_id in ROLES.items()]}
+
+    def list_user_roles_on_project(self, project_id, user_id):
+        self.calls.append('list')
+        return {'roles': [{'id': role_id} for role_id in self.assigned]}
+
+    def create_user_role_on_project(self, project_id, user_id, role_id):
+        self.calls.append('create')
+        self.assigned.add(role_id)
+
+    def delete_role_from_user_on_project(self, project_id, user_id,
+                                         role_id):
+        self.calls.append('delete')
+        self.assigned.discard(role_id)
+
+
+class FakeAuthProvider(object):
+
+    def __init__(self):
+        self.tokens = 0
+        self.requests = []
+
+    def auth_request(self, *args, **kwargs):
+        self.requests.append(args)
+
+    def clear_auth(self):
+        pass
+
+    def set_auth(self):
+        self.tokens += 1
+
+
+class FakeCredentials(object):
+    user_id = 'user-id'
+    tenant_id = 'project-id'
+    user_domain_id = 'domain-id'
+    project_domain_id = 'domain-id'
+
+
+class FakeUsersClient(object):
+
+    def __init__(self):
+        self.users = {}
+
+    def create_user(self, name, password, domain_id):
+        user_id = 'pooled-%d' % len(self.users)
+        self.users[user_id] = name
+        return {'user': {'id': user_id}}
+
+    def delete_user(self, user_id):
+        del self.users[user_id]
+
+
+class FakeManager(object):
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class RoleSwitcherTest(testtools.TestCase):
+
+    def setUp(self):
+        super(RoleSwitcherTest, self).setUp()
+        CONF.set_override('admin_role', 'admin', 'identity')
+        self.addCleanup(CONF.clear_override, 'admin_role', 'identity')
+        CONF.set_override('rbac_test_roles', ['member'], 'patrole')
+        self.addCleanup(CONF.clear_override, 'rbac_test_roles', 'patrole')
+        self.patch(rbac_base, '_ROLE_ASSIGNMENTS', {})
+        self.patch(rbac_base, '_ROLE_IDS', {})
+        self.patch(rbac_base.time, 'sleep', lambda seconds: None)
+
+        self.roles_client = FakeRolesClient(['admin-id'])
+        self.auth_provider = FakeAuthProvider()
+        test_cls = FakeManager(
+            os_admin=FakeManager(roles_v3_client=self.roles_client),
+            os_primary=FakeManager(auth_provider=self.auth_provider,
+                                   credentials=FakeCredentials()))
+        self.switcher = rbac_base.RoleSwitcher(test_cls)
+
+    def _run_test(self, requests_after=0):
+        self.switcher.override_role(None, True)
+        self.auth_provider.auth_request('GET', '/rbac')
+        self.switcher.override_role(None, False)
+        for _ in range(requests_after):
+            self.auth_provider.auth_request('GET', '/admin')
+
+    def test_consecutive_overrides_switch_once(self):
+        for _ in range(3):
+            self._run_test()
+        self.assertEqual({'member-id'}, self.roles_client.assigned)
+        self.assertEqual(['list_roles', 'list', 'create', 'delete'],
+                         self.roles_client.calls)
+        self.assertEqual(1, self.auth_provider.tokens)
+
+    def test_request_outside_override_switches_back(self):
+        self._run_test(requests_after=2)
+        self.assertEqual({'admin-id'}, self.roles_client.assigned)
+        self._run_test(requests_after=1)
+        self.assertEqual({'admin-id'}, self.roles_client.assigned)
+        # The assignments are only listed once
+        self.assertEqual(1, self.roles_client.calls.count('list'))
+        self.assertEqual(4, self.auth_provider.tokens)
+        self.assertEqual(5, len(self.auth_provider.requests))
+
+    def test_switch_to_named_roles(self):
+        self.switcher.switch(['member', 'admin'])
+        self.assertEqual({'admin-id', 'member-id'},
+                         self.roles_client.assigned)
+        self.switcher.override_role(None, False)
+        self.auth_provider.auth_request('GET', '/admin')
+        self.assertEqual({'admin-id'}, self.roles_client.assigned)
+
+    def test_forget_role_assignment(self):
+        self.switcher.switch(['member'])
+        # Roles switched behind the switcher's back, e.g. by patrole
+        self.roles_client.assigned = {'admin-id'}
+        rbac_base._forget_role_assignment(FakeCredentials())
+        self.switcher.switch(['member'])
+        self.assertEqual({'member-id'}, self.roles_client.assigned)
+        self.assertEqual(2, self.roles_client.calls.count('list'))
+
+
+class RoleCredentialPoolTest(testtools.TestCase):
+
+    def setUp(self):
+        super(RoleCredentialPoolTest, self).setUp()
+        CONF.set_override('rbac_test_roles', ['member'], 'patrole')
+        self.addCleanup(CONF.clear_override, 'rbac_test_roles', 'patrole')
+        self.patch(rbac_base, '_ROLE_IDS', {})
+        self.patch(rbac_base.credentials_factory, 'get_credentials',
+                   lambda **kwargs: kwargs)
+        self.patch(rbac_base.clients, 'get_auth_provider',
+                   lambda credentials, pre_auth: credentials)
+        self.roles_client = FakeRolesClient([])
+        self.users_client = FakeUsersClient()
+        self.pool = rbac_base.RoleCredentialPool()
+
+    def _test_cls(self, project_id):
+        credentials = FakeCredentials()
+        credentials.tenant_id = project_id
+        return FakeManager(
+            os_admin=FakeManager(roles_v3_client=self.roles_client,
+                                 users_v3_client=self.users_client),
+            os_primary=FakeManager(credentials=credentials))
+
+    def test_one_user_per_role_set(self):
+        first, second = self._test_cls('p1'), self._test_cls('p2')
+        provider = self.pool.auth_provider(first, ['member'])
+        self.assertIs(provider, self.pool.auth_provider(first, ['member']))
+        self.assertEqual('p1', provider['project_id'])
+        self.assertEqual(
+            provider['username'],
+            self.pool.auth_provider(second, ['member'])['username'])
+        self.pool.auth_provider(second, ['member', 'admin'])
+        self.assertEqual(2, len(self.users_client.users))
+        # The member role once per project, then both roles on p2
+        self.assertEqual(4, self.roles_client.calls.count('create'))
+
+        self.pool.delete_all(self.users_client)
+        self.assertEqual({}, self.users_client.users)
+        self.assertEqual(0, len(self.pool))
+
+    def test_forget_project(self):
+        first, second = self._test_cls('p1'), self._test_cls('p2')
+        provider = self.pool.auth_provider(first, ['member'])
+        kept = self.pool.auth_provider(second, ['member'])
+        self.pool.forget_project('p1')
+        self.assertIsNot(provider, self.pool.auth_provider(first, ['member']))
+        self.assertIs(kept, self.pool.auth_provider(second, ['member']))
+        # The user stays in the pool
+        self.assertEqual(1, len(self.users_client.users))
+
+    def test_override_role_sets_thread_provider(self):
+        test_cls = self._test_cls('p1')
+        self.pool.override_role(test_cls, None, True)
+        self.assertEqual(self.pool.auth_provider(test_cls, ['member']),
+                         rbac_base._ROLE_CONTEXT.auth_provider)
+        self.pool.override_role(test_cls, None, False)
+        self.assertIsNone(rbac_base._ROLE_CONTEXT.auth_provider)
+
+
+class RoleMatrixTest(testtools.TestCase):
+
+    def test_format_matrix(self):
+        table = rbac_base.format_matrix({
+            ('show_virtual_network', 'admin'): ('allowed', 'allowed'),
+            ('show_virtual_network', 'member'): ('allowed', 'allowed'),
+            ('delete_virtual_network', 'admin'): ('allowed', 'allowed'),
+            ('delete_virtual_network', 'member'): ('denied', 'allowed'),
+            ('update_virtual_network', 'admin'): ('allowed', 'allowed'),
+        })
+        self.assertEqual(
+            'rule                    admin    member\n'
+            'delete_virtual_network  allowed  allowed!\n'
+            'show_virtual_network    allowed  allowed\n'
+            'update_virtual_network  allowed  -',
+            table)
+
+    def test_allowed_takes_role_as_patrole_does(self):
+        calls = []
+
+        class FakeAuthority(object):
+            def allowed(self, rule, roles):
+                calls.append((rule, roles))
+                return True
+
+        CONF.set_override('rbac_test_roles', ['member'], 'patrole')
+        self.addCleanup(CONF.clear_override, 'rbac_test_roles', 'patrole')
+        rbac_base._allowed(FakeAuthority(), 'show_virtual_network', 'admin')
+        # Releases without rbac_test_roles take a single role
+        CONF.set_override('rbac_test_roles', None, 'patrole')
+        rbac_base._allowed(FakeAuthority(), 'show_virtual_network', 'admin')
+        self.assertEqual([('show_virtual_network', ['admin']),
+                          ('show_virtual_network', 'admin')], calls)
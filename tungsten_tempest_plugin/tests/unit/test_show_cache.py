@@ -0,0 +1,117 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the show cache of the base service class
+"""
+
+import json
+
+import testtools
+
+from tungsten_tempest_plugin.services.contrail.json import base
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+PROJECT_FQ_NAME = ['default-domain', 'default-project']
+
+
+class LRUCacheTest(testtools.TestCase):
+
+    def test_least_recently_used_evicted(self):
+        cache = base.LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(1, cache.get('a'))
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(3, cache.get('c'))
+        self.assertEqual(3, cache.pop('c'))
+        self.assertIsNone(cache.get('c'))
+
+    def test_shared_by_size(self):
+        self.patch(base, '_SHOW_CACHES', {})
+        self.assertIs(base.get_show_cache(5), base.get_show_cache(5))
+        self.assertIsNot(base.get_show_cache(5), base.get_show_cache(6))
+
+
+class ShowCacheTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(ShowCacheTest, self).setUp()
+        self.patch(base, '_SHOW_CACHES', {})
+        self.client = self.make_client(base.BaseContrailClient,
+                                       show_cache_size=2)
+        self.networks = self.client.resource('virtual-network')
+
+    def _create(self, name):
+        return self.client.create_resource('virtual-network', {
+            'parent_type': 'project',
+            'fq_name': PROJECT_FQ_NAME + [name]})['virtual-network']['uuid']
+
+    def _show(self, uuid):
+        resp, body = self.networks.show(uuid)
+        return resp, json.loads(body)['virtual-network']
+
+    def test_hit_not_transferred_again(self):
+        uuid = self._create('net')
+        _, first = self._show(uuid)
+        requests = self.server.requests
+        resp, second = self._show(uuid)
+        self.assertEqual(200, resp.status)
+        self.assertEqual(first, second)
+        # One conditional GET, answered without the object
+        self.assertEqual(requests + 1, self.server.requests)
+        self.assertEqual(1, self.server.not_modified)
+
+    def test_invalidated_by_update(self):
+        uuid = self._create('net')
+        self._show(uuid)
+        self.networks.update(uuid, {'display_name': 'renamed'})
+        self.assertIsNone(self.client.show_cache.get(
+            '/virtual-network/%s' % uuid))
+        _, net = self._show(uuid)
+        self.assertEqual('renamed', net['display_name'])
+        self.assertEqual(0, self.server.not_modified)
+
+    def test_invalidated_by_delete(self):
+        uuid = self._create('net')
+        self._show(uuid)
+        self.networks.delete(uuid)
+        self.assertIsNone(self.client.show_cache.get(
+            '/virtual-network/%s' % uuid))
+
+    def test_lru_eviction(self):
+        uuids = [self._create('net-%d' % i) for i in range(3)]
+        for uuid in uuids:
+            self._show(uuid)
+        # Only the two shown last are cached
+        self.assertIsNone(self.client.show_cache.get(
+            '/virtual-network/%s' % uuids[0]))
+        for uuid in uuids[1:]:
+            self._show(uuid)
+        self.assertEqual(2, self.server.not_modified)
+        self._show(uuids[0])
+        self.assertEqual(2, self.server.not_modified)
+
+
+class LastModifiedShowCacheTest(ShowCacheTest):
+    """Server sending no ETag, revalidated by id_perms.last_modified"""
+
+    server_options = {'etags': False}
+
+    def test_no_etag_sent(self):
+        resp, _ = self._show(self._create('net'))
+        self.assertNotIn('etag', resp)
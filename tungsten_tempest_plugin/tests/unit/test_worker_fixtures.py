@@ -0,0 +1,83 @@
+# Copyright 2016 AT&T Corp
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Tests of the fixtures shared by the test classes of a worker
+"""
+
+from tungsten_tempest_plugin.services.contrail.json import \
+    virtual_network_client
+from tungsten_tempest_plugin.tests.api.contrail import rbac_base
+from tungsten_tempest_plugin.tests.unit import fake_config_api
+
+
+class WorkerFixturesTest(fake_config_api.FakeConfigApiTestCase):
+
+    def setUp(self):
+        super(WorkerFixturesTest, self).setUp()
+        self.client = self.make_client(
+            virtual_network_client.VirtualNetworkClient)
+        self.fixtures = rbac_base.WorkerFixtures()
+        self.created = []
+
+    def _create(self, resource_type, fq_name, parent_type):
+        obj = self.client.create_resource(resource_type, {
+            'parent_type': parent_type, 'fq_name': fq_name})[resource_type]
+        self.created.append(obj['uuid'])
+        return obj
+
+    def _acquire_project(self):
+        return self.fixtures.acquire(
+            ('project',), 'project',
+            lambda: self._create('project', ['default-domain', 'shared'],
+                                 'domain'))
+
+    def _acquire_network(self):
+        def reset(network):
+            self.client.update_virtual_network(
+                network['uuid'], display_name=network['name'])
+
+        return self.fixtures.acquire(
+            ('virtual-network',), 'virtual-network',
+            lambda: self._create('virtual-network',
+                                 ['default-domain', 'shared', 'net'],
+                                 'project'),
+            reset)
+
+    def test_fixtures_are_created_once(self):
+        initial = self.server.objects
+        for _ in range(3):
+            project = self._acquire_project()
+            network = self._acquire_network()
+            self.fixtures.release(('virtual-network',))
+            self.fixtures.release(('project',))
+        self._acquire_project()
+        self.assertEqual(2, len(self.created))
+        self.assertEqual(project['uuid'], network['parent_uuid'])
+        self.assertEqual(1, self.fixtures.refcount(('project',)))
+        self.assertEqual(0, self.fixtures.refcount(('virtual-network',)))
+
+        # The network goes first, as the project cannot be deleted before
+        self.fixtures.delete_all(self.client)
+        self.assertEqual(0, len(self.fixtures))
+        self.assertEqual(initial, self.server.objects)
+
+    def test_deleted_fixture_is_created_again(self):
+        self._acquire_project()
+        network = self._acquire_network()
+        self.client.delete_virtual_network(network['uuid'])
+        self.assertNotEqual(network['uuid'], self._acquire_network()['uuid'])
+        self.assertEqual(1, self.fixtures.refcount(('virtual-network',)))
+        self.fixtures.delete_all(self.client)